@@ -7,8 +7,9 @@ Tracks all access to Protected Health Information (PHI) for HIPAA compliance.
 import logging
 import os
 import sqlite3
+import threading
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Iterable, Optional
 
 import pandas as pd
 
@@ -25,6 +26,18 @@ _COLUMNS = [
     "justification",
     "model_used",
 ]
+_INSERT_SQL = (
+    "INSERT INTO access_logs (timestamp, user_id, patient_id, resource_type, "
+    "operation, justification, model_used) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+# Columns declared NOT NULL, in log_access argument order
+_NOT_NULL_FIELDS = (
+    "user_id",
+    "patient_id",
+    "resource_type",
+    "operation",
+    "justification",
+)
 # Friendly aliases exposed to callers
 _ALIAS_MAP = {
     "user_id": "user",
@@ -35,24 +48,47 @@ _ALIAS_MAP = {
 }
 
 
+def _check_not_null(record: tuple) -> None:
+    """Raise as the table's NOT NULL constraints would, before buffering."""
+    for field, value in zip(_NOT_NULL_FIELDS, record[1:]):
+        if value is None:
+            raise sqlite3.IntegrityError(
+                f"NOT NULL constraint failed: access_logs.{field}"
+            )
+
+
 class PHIAuditLogger:
     """
     Audit logger for tracking access to Protected Health Information (PHI).
     """
 
-    def __init__(self, db_path: str = "audit/phi_access.db") -> None:
+    def __init__(
+        self, db_path: str = "audit/phi_access.db", batch_size: int = 1
+    ) -> None:
+        """
+        ``batch_size`` records are buffered and written in one transaction.
+        The default of 1 commits every access as it is logged; buffered
+        records are always written before a query and on close().
+        """
         db_dir = os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
         self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._buffer: list = []
+        self._lock = threading.Lock()
         self.conn = sqlite3.connect(db_path, check_same_thread=False)
         self._init_db()
         logger.info(f"Initialized PHI Audit Logger with database: {db_path}")
 
     def _init_db(self) -> None:
         cursor = self.conn.cursor()
-        cursor.execute(
-            """
+        # WAL lets report queries run while records are appended, and with it
+        # synchronous=NORMAL syncs at checkpoints rather than on every commit
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("""
             CREATE TABLE IF NOT EXISTS access_logs (
                 id INTEGER PRIMARY KEY AUTOINCREMENT,
                 timestamp TEXT NOT NULL,
@@ -63,22 +99,30 @@ class PHIAuditLogger:
                 justification TEXT NOT NULL,
                 model_used TEXT
             )
-        """
-        )
+        """)
+        # Patient history filters on patient_id and orders by timestamp; the
+        # composite index serves both, superseding the old idx_patient_id
         cursor.execute(
-            "CREATE INDEX IF NOT EXISTS idx_patient_id ON access_logs(patient_id)"
+            "CREATE INDEX IF NOT EXISTS idx_patient_timestamp "
+            "ON access_logs(patient_id, timestamp)"
         )
+        cursor.execute("DROP INDEX IF EXISTS idx_patient_id")
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_user_id ON access_logs(user_id)")
         cursor.execute(
             "CREATE INDEX IF NOT EXISTS idx_timestamp ON access_logs(timestamp)"
         )
         self.conn.commit()
 
-    def _rows_to_df(self, rows: list) -> pd.DataFrame:
-        """Convert raw DB rows to a DataFrame with aliased column names."""
-        df = pd.DataFrame(rows, columns=_COLUMNS)
-        df = df.rename(columns=_ALIAS_MAP)
-        return df
+    def _query_df(self, where: str, params: tuple) -> pd.DataFrame:
+        """Read matching rows straight into a DataFrame with aliased column names."""
+        self.flush()
+        df = pd.read_sql_query(
+            f"SELECT {', '.join(_COLUMNS)} FROM access_logs "
+            f"WHERE {where} ORDER BY timestamp DESC",
+            self.conn,
+            params=params,
+        )
+        return df.rename(columns=_ALIAS_MAP)
 
     def log_access(
         self,
@@ -89,24 +133,22 @@ class PHIAuditLogger:
         justification: str,
         model: Optional[str] = None,
     ) -> None:
+        record = (
+            datetime.now(timezone.utc).isoformat(),
+            user_id,
+            patient_id,
+            resource_type,
+            operation,
+            justification,
+            model,
+        )
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                INSERT INTO access_logs (timestamp, user_id, patient_id, resource_type, operation, justification, model_used)
-                VALUES (?, ?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    datetime.now(timezone.utc).isoformat(),
-                    user_id,
-                    patient_id,
-                    resource_type,
-                    operation,
-                    justification,
-                    model,
-                ),
-            )
-            self.conn.commit()
+            # A record the table would reject must not enter the shared buffer
+            _check_not_null(record)
+            with self._lock:
+                self._buffer.append(record)
+                if len(self._buffer) >= self.batch_size:
+                    self._flush_locked()
             logger.info(
                 f"Logged PHI access: user={user_id}, patient={patient_id}, "
                 f"resource={resource_type}, operation={operation}"
@@ -115,6 +157,63 @@ class PHIAuditLogger:
             logger.error(f"Failed to log PHI access: {str(e)}")
             raise
 
+    def log_access_many(self, rows: Iterable[tuple]) -> None:
+        """
+        Log several accesses in one transaction. Each row holds the
+        log_access arguments in order, with the model optional:
+        (user_id, patient_id, resource_type, operation, justification[, model]).
+        """
+        rows = [tuple(row) for row in rows]
+        # Reject malformed rows before they reach the shared buffer, where a
+        # failing insert would hold up records logged by earlier calls
+        for i, row in enumerate(rows):
+            if len(row) not in (5, 6):
+                raise ValueError(
+                    f"Access row {i} has {len(row)} fields; expected 5 or 6"
+                )
+        timestamp = datetime.now(timezone.utc).isoformat()
+        records = [
+            (timestamp, *row) if len(row) == 6 else (timestamp, *row, None)
+            for row in rows
+        ]
+        try:
+            for record in records:
+                _check_not_null(record)
+            with self._lock:
+                self._buffer.extend(records)
+                self._flush_locked()
+            logger.info(f"Logged {len(records)} PHI accesses")
+        except sqlite3.Error as e:
+            logger.error(f"Failed to log PHI access: {str(e)}")
+            raise
+
+    def flush(self) -> None:
+        """Write any buffered access records to the database."""
+        with self._lock:
+            self._flush_locked()
+
+    def _flush_locked(self) -> None:
+        if not self._buffer:
+            return
+        try:
+            # Take the write lock up front instead of upgrading mid-transaction
+            self.conn.execute("BEGIN IMMEDIATE")
+            self.conn.executemany(_INSERT_SQL, self._buffer)
+            self.conn.commit()
+        except sqlite3.OperationalError:
+            # Transient failures such as a locked database: the buffered
+            # records were already reported as logged, so keep them for the
+            # next flush rather than dropping them with the transaction
+            self.conn.rollback()
+            raise
+        except sqlite3.Error:
+            # The batch itself was rejected and would fail every retry; drop
+            # it so one bad record cannot wedge the logger
+            self.conn.rollback()
+            self._buffer = []
+            raise
+        self._buffer = []
+
     def log_prediction_request(
         self, patient_id: str, user_id: str = "API_USER", model_used: str = "UNKNOWN"
     ) -> None:
@@ -129,39 +228,25 @@ class PHIAuditLogger:
 
     def generate_report(self, start_date: str, end_date: str) -> pd.DataFrame:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM access_logs
-                WHERE timestamp BETWEEN ? AND ?
-                ORDER BY timestamp DESC
-                """,
-                (start_date, end_date),
-            )
-            return self._rows_to_df(cursor.fetchall())
-        except sqlite3.Error as e:
+            return self._query_df("timestamp BETWEEN ? AND ?", (start_date, end_date))
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
             logger.error(f"Failed to generate audit report: {str(e)}")
             raise
 
     def get_patient_access_history(self, patient_id: str) -> pd.DataFrame:
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                """
-                SELECT * FROM access_logs
-                WHERE patient_id = ?
-                ORDER BY timestamp DESC
-                """,
-                (patient_id,),
-            )
-            return self._rows_to_df(cursor.fetchall())
-        except sqlite3.Error as e:
+            return self._query_df("patient_id = ?", (patient_id,))
+        except (sqlite3.Error, pd.errors.DatabaseError) as e:
             logger.error(f"Failed to get patient access history: {str(e)}")
             raise
 
     def close(self) -> None:
         if getattr(self, "conn", None):
-            self.conn.close()
+            try:
+                self.flush()
+            finally:
+                self.conn.close()
+                self.conn = None
             logger.info("Closed PHI Audit Logger database connection")
 
     def __del__(self) -> None:
@@ -1,19 +1,44 @@
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Any, Dict, List, Optional, Set
 
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.dataset as ds
+    import pyarrow.parquet as pq
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
 from ml_core.pipeline.hipaa_compliance.deidentifier import (
     DeidentificationConfig,
     PHIDeidentifier,
 )
 from ml_core.pipeline.icd10_encoder import ICD10Encoder
-from ml_core.pipeline.temporal_features import TemporalFeatureExtractor
+from ml_core.pipeline.temporal_features import (
+    TemporalFeatureExtractor,
+    warm_window_kernel,
+)
 from ml_core.utils.fhir_connector import FHIRConnector
 
 logger = logging.getLogger(__name__)
 
+# Concurrent FHIR fetches; stays under requests' default pool of 10 connections
+# per host so the connector's shared session reuses every connection.
+DEFAULT_FHIR_WORKERS = 8
+
+DEFAULT_FEATURES_PATH = "data/processed/features.parquet"
+# Rows per Parquet row group; each group carries min/max statistics that let
+# filtered reads skip it entirely.
+PARQUET_ROW_GROUP_SIZE = 65536
+
 
 class ClinicalETL:
     def __init__(self, config: Optional[Dict[str, Any]] = None) -> None:
@@ -23,25 +48,57 @@ class ClinicalETL:
         )
         self.icd10_encoder = ICD10Encoder()
         self.temporal_extractor = TemporalFeatureExtractor()
+        self.creatinine_extractor = TemporalFeatureExtractor(
+            value_column="creatinine_value",
+            aggregation_functions=["mean", "min", "max", "std", "count"],
+        )
+        warm_window_kernel()
+        # Directory for batch-appended, ingest_date-partitioned features; when
+        # unset load() writes a single file as before.
+        self.output_dir = self.config.get("features_dataset_dir")
+        self._created_dirs: Set[str] = set()
+        if self.output_dir:
+            self._makedirs(self.output_dir)
         deid_config = DeidentificationConfig(**self.config.get("deidentification", {}))
         self.deidentifier = PHIDeidentifier(config=deid_config)
         logger.info("ClinicalETL initialized.")
 
+    def _extract_patient(self, pid: str) -> Optional[Dict[str, Any]]:
+        try:
+            patient_data = self.fhir_connector.get_patient_data(pid)
+            # De-identifying inside the worker overlaps the scrub with the
+            # other patients' FHIR round trips instead of a pass afterwards.
+            if patient_data is not None and self.config.get("deidentify_on_extract"):
+                patient_data = self.deidentifier.deidentify_patient_data(patient_data)
+            return patient_data
+        except Exception as e:
+            logger.error(f"Failed to extract data for patient {pid}: {e}")
+            return None
+
     def extract(self, patient_ids: List[str]) -> List[Dict[str, Any]]:
-        raw_data = []
-        for pid in patient_ids:
-            try:
-                data = self.fhir_connector.get_patient_data(pid)
-                raw_data.append(data)
-            except Exception as e:
-                logger.error(f"Failed to extract data for patient {pid}: {e}")
-        return raw_data
+        if not patient_ids:
+            return []
+        # Each patient costs several FHIR round trips, so overlap them across
+        # a small pool; map() keeps the results in patient_ids order.
+        workers = min(
+            self.config.get("fhir_workers", DEFAULT_FHIR_WORKERS), len(patient_ids)
+        )
+        with ThreadPoolExecutor(max_workers=max(workers, 1)) as executor:
+            results = list(executor.map(self._extract_patient, patient_ids))
+        return [data for data in results if data is not None]
 
     def transform(self, raw_data: List[Dict[str, Any]]) -> pd.DataFrame:
         if not raw_data:
             return pd.DataFrame()
 
         flat_data = []
+        all_icd_codes = []
+        # Creatinine labs of every patient, flattened; patient lab_patients[k]
+        # owns entries lab_bounds[k]:lab_bounds[k + 1]
+        lab_patients: List[int] = []
+        lab_bounds = [0]
+        lab_values: List[Any] = []
+        lab_dates: List[Any] = []
         for patient_data in raw_data:
             patient_id = patient_data.get("patient_id", "unknown")
             row: Dict[str, Any] = {
@@ -49,66 +106,150 @@ class ClinicalETL:
                 **patient_data.get("demographics", {}),
             }
 
-            # ICD-10 encoding
-            icd_codes = [
-                event["code"]
-                for event in patient_data.get("clinical_events", [])
-                if event.get("type") == "diagnosis" and "code" in event
-            ]
-            icd_features = self.icd10_encoder.encode_codes_binary(
-                icd_codes, level="group"
+            # ICD-10 codes, encoded for the whole batch after the loop
+            all_icd_codes.append(
+                [
+                    event["code"]
+                    for event in patient_data.get("clinical_events", [])
+                    if event.get("type") == "diagnosis" and "code" in event
+                ]
             )
-            row.update(icd_features)
-
-            # Temporal lab features
-            lab_df = pd.DataFrame(patient_data.get("lab_results", []))
-            if not lab_df.empty and "name" in lab_df.columns:
-                creatinine_df = lab_df[lab_df["name"] == "Creatinine"].copy()
-                if not creatinine_df.empty:
-                    creatinine_df = creatinine_df.rename(
-                        columns={"date": "timestamp", "value": "creatinine_value"}
-                    )
-                    creatinine_df["timestamp"] = pd.to_datetime(
-                        creatinine_df["timestamp"]
-                    )
-                    reference_time = creatinine_df["timestamp"].max()
-                    creatinine_extractor = TemporalFeatureExtractor(
-                        value_column="creatinine_value",
-                        aggregation_functions=["mean", "min", "max", "std", "count"],
-                    )
-                    temporal_features = creatinine_extractor._extract_window_features(
-                        creatinine_df, reference_time=reference_time
-                    )
-                    row.update(temporal_features)
+
+            # Temporal lab features, taken straight from the lab dicts rather
+            # than through a throwaway DataFrame per patient
+            creatinine = [
+                lab
+                for lab in patient_data.get("lab_results", [])
+                if lab.get("name") == "Creatinine"
+            ]
+            if creatinine:
+                lab_patients.append(len(flat_data))
+                lab_values.extend(lab.get("value") for lab in creatinine)
+                lab_dates.extend(lab.get("date") for lab in creatinine)
+                lab_bounds.append(len(lab_values))
 
             flat_data.append(row)
 
-        feature_df = pd.DataFrame(flat_data)
-        feature_df.fillna(0, inplace=True)
+        # Lab window features are written into float arrays allocated up front
+        # for every feature the extractor can emit, so each batch has the same
+        # columns whatever labs it happened to contain.
+        lab_columns = {
+            name: np.full(len(flat_data), np.nan)
+            for name in self.creatinine_extractor.window_feature_names()
+        }
+        if lab_patients:
+            # One vectorised parse for the whole batch; the explicit format
+            # skips pandas' per-call format inference.
+            timestamps = pd.to_datetime(lab_dates, utc=True, format="ISO8601").to_numpy(
+                dtype="datetime64[ns]"
+            )
+            values = np.array(lab_values, dtype=float)
+            for k, patient in enumerate(lab_patients):
+                start, end = lab_bounds[k], lab_bounds[k + 1]
+                patient_times = timestamps[start:end]
+                observed = patient_times[~np.isnat(patient_times)]
+                reference_time = observed.max() if observed.size else pd.NaT
+                features = self.creatinine_extractor._extract_window_features_raw(
+                    values[start:end], patient_times, reference_time
+                )
+                for name, value in features.items():
+                    lab_columns[name][patient] = value
+
+        icd_matrix, icd_columns = self.icd10_encoder.encode_codes_binary_batch(
+            all_icd_codes, level="group"
+        )
+        feature_df = pd.concat(
+            [
+                pd.DataFrame(flat_data),
+                pd.DataFrame(lab_columns, index=range(len(flat_data))),
+                pd.DataFrame(icd_matrix.toarray(), columns=icd_columns),
+            ],
+            axis=1,
+        )
+        # Only the lab window features can be missing among the numeric
+        # columns; demographics keep their missing values instead of mixing a
+        # 0 into text columns.
+        float_cols = feature_df.select_dtypes(include="floating").columns
+        feature_df[float_cols] = feature_df[float_cols].fillna(0)
         logger.info(
             f"Transformation complete: {feature_df.shape[0]} rows, {feature_df.shape[1]} cols."
         )
         return feature_df
 
+    def _makedirs(self, directory: str) -> None:
+        if directory not in self._created_dirs:
+            os.makedirs(directory, exist_ok=True)
+            self._created_dirs.add(directory)
+
     def load(self, feature_df: pd.DataFrame, output_path: Optional[str] = None) -> str:
         logger.info(f"Loading {feature_df.shape[0]} rows to feature store.")
+        if output_path is None and self.output_dir and _PYARROW_AVAILABLE:
+            return self._append_to_dataset(feature_df)
         if output_path is None:
-            os.makedirs("data/processed", exist_ok=True)
-            output_path = "data/processed/features.parquet"
-        else:
-            os.makedirs(
-                os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
-                exist_ok=True,
-            )
+            output_path = DEFAULT_FEATURES_PATH
+        self._makedirs(os.path.dirname(output_path) or ".")
 
         try:
-            feature_df.to_parquet(output_path, index=False)
+            if not _PYARROW_AVAILABLE:
+                raise ImportError("pyarrow is not installed")
+            pq.write_table(
+                pa.Table.from_pandas(feature_df, preserve_index=False),
+                output_path,
+                row_group_size=PARQUET_ROW_GROUP_SIZE,
+                compression="zstd",
+            )
         except Exception:
             output_path = output_path.replace(".parquet", ".csv")
             feature_df.to_csv(output_path, index=False)
         logger.info(f"Features saved to {output_path}")
         return output_path
 
+    def _append_to_dataset(self, feature_df: pd.DataFrame) -> str:
+        """Write a batch as new files under output_dir without touching earlier batches."""
+        table = pa.Table.from_pandas(
+            feature_df.assign(ingest_date=date.today().isoformat()),
+            preserve_index=False,
+        )
+        # A unique file name per batch lets concurrent loads share a partition
+        pq.write_to_dataset(
+            table,
+            root_path=self.output_dir,
+            partition_cols=["ingest_date"],
+            basename_template=f"part-{uuid.uuid4().hex}-{{i}}.parquet",
+            existing_data_behavior="overwrite_or_ignore",
+            max_rows_per_group=PARQUET_ROW_GROUP_SIZE,
+            compression="zstd",
+        )
+        logger.info(f"Features appended to {self.output_dir}")
+        return self.output_dir
+
+    def read_features(
+        self,
+        path: str = DEFAULT_FEATURES_PATH,
+        columns: Optional[List[str]] = None,
+        row_filter: Optional[Any] = None,
+    ) -> pd.DataFrame:
+        """
+        Read features written by load(), decoding only what the caller needs.
+
+        Args:
+            path: Parquet file or directory of Parquet files; ingest_date
+                partitions written by load() come back as a column
+            columns: Columns to read; None reads all of them
+            row_filter: pyarrow.compute expression, e.g.
+                ``pc.field("age") >= 65``; row groups whose statistics rule it
+                out are never read
+
+        Returns:
+            DataFrame of the selected rows and columns
+        """
+        if path.endswith(".csv") or not _PYARROW_AVAILABLE:
+            if row_filter is not None:
+                raise ValueError("row_filter requires Parquet features and pyarrow")
+            return pd.read_csv(path, usecols=columns)
+        dataset = ds.dataset(path, format="parquet", partitioning="hive")
+        return dataset.to_table(columns=columns, filter=row_filter).to_pandas()
+
     def run_pipeline(self, patient_ids: List[str]) -> pd.DataFrame:
         raw_data = self.extract(patient_ids)
         feature_df = self.transform(raw_data)
@@ -8,8 +8,9 @@ testing, and demonstration purposes.
 
 import logging
 import os
+import re
 from datetime import datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 import numpy as np
 import pandas as pd
@@ -24,6 +25,28 @@ except ImportError:
     _FAKER_AVAILABLE = False
     _Faker = None  # type: ignore
 
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    _PYARROW_AVAILABLE = True
+except ImportError:
+    _PYARROW_AVAILABLE = False
+
+# Rows per Parquet row group; keeps min/max statistics fine-grained enough for
+# readers to skip row groups when filtering.
+PARQUET_ROW_GROUP_SIZE = 65536
+
+_NAME_TOKEN = re.compile("\\{\\{\\s*(\\w+)\\s*\\}\\}")
+# Name format tokens and the provider attribute holding their elements; a
+# _male/_female token reads the gendered attribute first.
+_NAME_ELEMENT_LISTS = {
+    "first_name": "first_names",
+    "last_name": "last_names",
+    "prefix": "prefixes",
+    "suffix": "suffixes",
+}
+
 
 class _SimpleFaker:
     """Minimal faker fallback using random data when Faker is not installed."""
@@ -70,6 +93,10 @@ class _SimpleFaker:
     ]
     _STATES = ["NY", "CA", "IL", "TX", "AZ", "PA", "TX", "CA", "TX", "CA"]
 
+    formats = ("{{first_name}} {{last_name}}",)
+    first_names = _FIRST_NAMES
+    last_names = _LAST_NAMES
+
     def __init__(self, rng: np.random.Generator) -> None:
         self._rng = rng
 
@@ -102,6 +129,89 @@ class _SimpleFaker:
         return f"patient{u}@{d}"
 
 
+def _weighted_elements(elements: Any) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """Split a provider element list into values and probabilities (None if uniform)."""
+    values = np.array(list(elements), dtype=object)
+    if isinstance(elements, dict):
+        weights = np.fromiter(elements.values(), dtype=float, count=len(elements))
+        return values, weights / weights.sum()
+    return values, None
+
+
+def _compile_name_sampler(
+    provider: Any,
+) -> Optional[Callable[[np.random.Generator, int], np.ndarray]]:
+    """
+    Resolve a person provider's name formats into a vectorised sampler.
+
+    Faker parses a weighted format template and draws every token separately
+    for each name. The formats and element lists are fixed per provider, so
+    they are resolved once here and whole columns of names are then drawn
+    with a handful of RNG calls per format.
+
+    Args:
+        provider: Person provider with ``formats`` and element lists such as
+            ``first_names`` and ``last_names``
+
+    Returns:
+        Function of (rng, n) returning n names, or None if a format uses
+        tokens this resolver does not know
+    """
+    formats = getattr(provider, "formats", None)
+    if not formats:
+        return None
+    compiled: List[List[Any]] = []
+    for fmt in formats:
+        pieces = _NAME_TOKEN.split(fmt)
+        if "{{" in "".join(pieces[::2]):
+            return None
+        parts: List[Any] = []
+        for i, piece in enumerate(pieces):
+            if i % 2 == 0:
+                if piece:
+                    parts.append(piece)
+                continue
+            base, _, gender = piece.rpartition("_")
+            if gender not in ("male", "female"):
+                base, gender = piece, ""
+            attribute = _NAME_ELEMENT_LISTS.get(base)
+            if attribute is None:
+                return None
+            candidates = [f"{attribute}_{gender}", attribute] if gender else [attribute]
+            elements = next(
+                (
+                    getattr(provider, a)
+                    for a in candidates
+                    if getattr(provider, a, None)
+                ),
+                None,
+            )
+            if elements is None:
+                return None
+            parts.append(_weighted_elements(elements))
+        compiled.append(parts)
+    format_weights = _weighted_elements(formats)[1]
+
+    def sample(rng: np.random.Generator, n: int) -> np.ndarray:
+        names = np.empty(n, dtype=object)
+        chosen = rng.choice(len(compiled), n, p=format_weights)
+        for k, parts in enumerate(compiled):
+            rows = np.flatnonzero(chosen == k)
+            if not len(rows):
+                continue
+            out = np.full(len(rows), "", dtype=object)
+            for part in parts:
+                if isinstance(part, str):
+                    out = out + part
+                else:
+                    values, p = part
+                    out = out + values[rng.choice(len(values), len(rows), p=p)]
+            names[rows] = out
+        return names
+
+    return sample
+
+
 class ClinicalDataGenerator:
     """
     Generator for synthetic clinical data.
@@ -154,6 +264,14 @@ class ClinicalDataGenerator:
         else:
             self._faker = _SimpleFaker(self.rng)
             logger.warning("faker not installed; using built-in data generator.")
+        if isinstance(self._faker, _SimpleFaker):
+            person_provider = self._faker
+        else:
+            person_provider = next(
+                (p for p in self._faker.get_providers() if hasattr(p, "last_names")),
+                None,
+            )
+        self._sample_names = _compile_name_sampler(person_provider)
         logger.info(f"Initialized ClinicalDataGenerator with seed={seed}")
 
     def _random_date(self, start_year: int = 2020, end_year: int = 2024) -> str:
@@ -167,76 +285,96 @@ class ClinicalDataGenerator:
         d = datetime(year, 1, 1) + timedelta(days=day_of_year)
         return d.strftime("%Y-%m-%d")
 
+    def _sample_joined(
+        self, options: List[str], n: int, low: int, high: int
+    ) -> List[str]:
+        """Draw low..high-1 distinct options per record, joined with '|'."""
+        # Sorting a row of uniform keys per record shuffles the options, so the
+        # leading k of each row is a sample without replacement.
+        counts = self.rng.integers(low, high, n)
+        ranked = np.asarray(options)[
+            np.argsort(self.rng.random((n, len(options))), axis=1)
+        ]
+        return ["|".join(row[:k]) for row, k in zip(ranked.tolist(), counts.tolist())]
+
     def generate_patient_records(
         self, n: int = 1000, output_path: Optional[str] = None
     ) -> pd.DataFrame:
         logger.info(f"Generating {n} synthetic patient records...")
 
         patient_ids = [f"PAT{str(i).zfill(6)}" for i in range(1, n + 1)]
-        ages = self.rng.integers(18, 95, n)
-        genders = self.rng.choice(["M", "F"], n)
-
-        diagnoses = []
-        for _ in range(n):
-            num_diagnoses = int(self.rng.integers(1, 4))
-            codes = self.rng.choice(
-                self.COMMON_ICD10_CODES, num_diagnoses, replace=False
-            ).tolist()
-            diagnoses.append("|".join(codes))
-
-        medications = []
-        for _ in range(n):
-            num_meds = int(self.rng.integers(1, 6))
-            meds = self.rng.choice(
-                self.COMMON_MEDICATIONS, num_meds, replace=False
-            ).tolist()
-            medications.append("|".join(meds))
-
-        admission_dates = [self._random_date(2022, 2024) for _ in range(n)]
-        los = self.rng.integers(1, 15, n)
-        discharge_dates = [
-            (datetime.strptime(ad, "%Y-%m-%d") + timedelta(days=int(l))).strftime(
-                "%Y-%m-%d"
-            )
-            for ad, l in zip(admission_dates, los)
-        ]
+        # Narrow dtypes keep the columns small in memory and on disk.
+        ages = self.rng.integers(18, 95, n).astype(np.int8)
+        genders = pd.Categorical(self.rng.choice(["M", "F"], n), categories=["M", "F"])
+
+        diagnoses = self._sample_joined(self.COMMON_ICD10_CODES, n, 1, 4)
+        medications = self._sample_joined(self.COMMON_MEDICATIONS, n, 1, 6)
+
+        admission_offsets = self.rng.integers(0, 365 * 2, n).astype("timedelta64[D]")
+        admission_days = np.datetime64("2022-01-01", "D") + admission_offsets
+        los = self.rng.integers(1, 15, n).astype(np.int8)
+        discharge_days = admission_days + los.astype("timedelta64[D]")
+        admission_dates = np.datetime_as_string(admission_days, unit="D")
+        discharge_dates = np.datetime_as_string(discharge_days, unit="D")
 
         readmission_prob = np.where(ages > 65, 0.25, 0.12)
-        readmission = self.rng.binomial(1, readmission_prob).tolist()
+        readmission = self.rng.binomial(1, readmission_prob).astype(np.int8)
         mortality_prob = np.where(ages > 75, 0.08, 0.03)
-        mortality = self.rng.binomial(1, mortality_prob).tolist()
-
-        creatinine = np.round(self.rng.uniform(0.6, 2.5, n), 2)
-        hba1c = np.round(self.rng.uniform(5.0, 10.0, n), 1)
+        mortality = self.rng.binomial(1, mortality_prob).astype(np.int8)
 
-        names = [self._faker.name() for _ in range(n)]
-        birth_dates = [self._random_birthdate(int(a)) for a in ages]
+        # float32 holds the rounded lab values exactly to their printed
+        # precision at half the width; float16 would not (2.47 -> 2.469)
+        creatinine = np.round(self.rng.uniform(0.6, 2.5, n), 2).astype(np.float32)
+        hba1c = np.round(self.rng.uniform(5.0, 10.0, n), 1).astype(np.float32)
 
-        df = pd.DataFrame(
-            {
-                "patient_id": patient_ids,
-                "name": names,
-                "age": ages,
-                "gender": genders,
-                "birth_date": birth_dates,
-                "diagnoses": diagnoses,
-                "medications": medications,
-                "admission_date": admission_dates,
-                "discharge_date": discharge_dates,
-                "length_of_stay": los,
-                "readmission_30d": readmission,
-                "in_hospital_mortality": mortality,
-                "creatinine": creatinine,
-                "hba1c": hba1c,
-            }
+        if self._sample_names is not None:
+            names = self._sample_names(self.rng, n).tolist()
+        else:
+            names = [self._faker.name() for _ in range(n)]
+        birth_years = (datetime.now().year - ages.astype(np.int64) - 1970).astype(
+            "datetime64[Y]"
         )
+        birth_days = birth_years.astype("datetime64[D]") + self.rng.integers(
+            1, 365, n
+        ).astype("timedelta64[D]")
+        birth_dates = np.datetime_as_string(birth_days, unit="D")
+
+        data = {
+            "patient_id": patient_ids,
+            "name": names,
+            "age": ages,
+            "gender": genders,
+            "birth_date": birth_dates,
+            "diagnoses": diagnoses,
+            "medications": medications,
+            "admission_date": admission_dates,
+            "discharge_date": discharge_dates,
+            "length_of_stay": los,
+            "readmission_30d": readmission,
+            "in_hospital_mortality": mortality,
+            "creatinine": creatinine,
+            "hba1c": hba1c,
+        }
+        df = pd.DataFrame(data)
 
         if output_path:
             os.makedirs(
                 os.path.dirname(output_path) if os.path.dirname(output_path) else ".",
                 exist_ok=True,
             )
-            df.to_csv(output_path, index=False)
+            if output_path.endswith(".parquet") and _PYARROW_AVAILABLE:
+                # Build the Arrow table from the column arrays directly rather
+                # than converting the DataFrame, which copies every column.
+                pq.write_table(
+                    pa.Table.from_pydict(data),
+                    output_path,
+                    row_group_size=PARQUET_ROW_GROUP_SIZE,
+                    use_dictionary=True,
+                    compression="zstd",
+                    compression_level=3,
+                )
+            else:
+                df.to_csv(output_path, index=False)
             logger.info(f"Saved {n} records to {output_path}")
 
         logger.info(f"Generated {n} synthetic patient records.")
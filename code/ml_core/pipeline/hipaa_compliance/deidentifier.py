@@ -7,14 +7,79 @@ as specified in the HIPAA Privacy Rule (45 CFR 164.514(b)(2)).
 
 import hashlib
 import re
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 import numpy as np
 import pandas as pd
 
 
+def _any_of(patterns: List[str], flags: int = re.IGNORECASE) -> "re.Pattern[str]":
+    """Compile patterns into one alternation that matches where any of them would."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+# Column-name and value heuristics, one alternation per check compiled at
+# import instead of a re.search per pattern through re's cache on every call.
+_PHI_COLUMN_PATTERN = _any_of(
+    [
+        "name",
+        "address",
+        "birth",
+        "dob",
+        "phone",
+        "email",
+        "ssn",
+        "social",
+        "mrn",
+        "medical.?record",
+        "patient.?id",
+        "zip",
+        "postal",
+        "city",
+        "state",
+        "date",
+        "age",
+        "identifier",
+        "license",
+        "account",
+        "url",
+        "ip.?address",
+        "device",
+    ]
+)
+_DATE_VALUE_PATTERN = _any_of(
+    ["\\d{4}-\\d{2}-\\d{2}", "\\d{2}/\\d{2}/\\d{4}", "\\d{2}-\\d{2}-\\d{4}"], flags=0
+)
+_AGE_COLUMN_PATTERN = _any_of(
+    ["^age$", "age[_\\s]", "[_\\s]age$", "patient[_\\s]age", "age[_\\s]years"]
+)
+_ADDRESS_COLUMN_PATTERN = _any_of(
+    ["address", "street", "city", "state", "zip", "postal"]
+)
+_NAME_COLUMN_PATTERN = _any_of(
+    [
+        "name",
+        "first[_\\s]name",
+        "last[_\\s]name",
+        "middle[_\\s]name",
+        "patient[_\\s]name",
+    ]
+)
+_CONTACT_COLUMN_PATTERN = _any_of(
+    ["phone", "email", "fax", "contact", "mobile", "cell"]
+)
+_ID_COLUMN_PATTERN = _any_of(["id$", "identifier", "number", "code", "key"])
+_MRN_COLUMN_PATTERN = _any_of(["mrn", "medical[_\\s]record", "record[_\\s]number"])
+_SSN_COLUMN_PATTERN = _any_of(["ssn", "social[_\\s]security", "tax[_\\s]id"])
+_DEVICE_ID_COLUMN_PATTERN = _any_of(
+    ["device[_\\s]id", "serial[_\\s]number", "imei", "uuid"]
+)
+
+
 class DeidentificationConfig:
     """Configuration for PHI de-identification."""
 
@@ -104,6 +169,13 @@ class PHIDeidentifier:
         """
         self.config = config if config else DeidentificationConfig()
         self.patient_date_shifts: Dict[str, int] = {}
+        self._salt_bytes = self.config.salt.encode()
+        # Digests by identifier text, shared by every hashing path within one
+        # DataFrame or bundle call so an ID seen in several columns or
+        # resources is hashed once. It maps plaintext IDs to their digests,
+        # so it is dropped when the call returns rather than kept around.
+        # Calls may run concurrently, so each thread keeps its own
+        self._local = threading.local()
         self.global_date_shift = np.random.randint(
             -self.config.max_date_shift_days, self.config.max_date_shift_days
         )
@@ -125,49 +197,50 @@ class PHIDeidentifier:
         Returns:
             De-identified DataFrame
         """
-        result = df.copy()
-        if not phi_cols:
-            phi_cols = self._detect_phi_columns(result)
-        if patient_id_col and patient_id_col in result.columns:
-            if self.config.hash_patient_ids:
-                result[patient_id_col] = result[patient_id_col].apply(
-                    lambda x: self._hash_identifier(str(x))
-                )
-        for col in phi_cols:
-            if col not in result.columns:
-                continue
-            if self._is_date_column(result[col]):
-                if self.config.shift_dates:
-                    result[col] = self._shift_dates(
-                        result[col], result.get(patient_id_col)
-                    )
-            elif self._is_age_column(col):
-                result[col] = self._truncate_ages(result[col])
-            elif self._is_address_column(col) and self.config.remove_addresses:
-                result[col] = "[REDACTED]"
-            elif self._is_name_column(col) and self.config.remove_names:
-                result[col] = "[REDACTED]"
-            elif self._is_contact_info_column(col) and self.config.remove_contact_info:
-                result[col] = "[REDACTED]"
-            elif self._is_id_column(col):
-                if (
-                    self._is_mrn_column(col)
-                    and self.config.remove_mrns
-                    or (self._is_ssn_column(col) and self.config.remove_ssn)
-                    or (
-                        self._is_device_id_column(col) and self.config.remove_device_ids
-                    )
+        with self._digest_cache():
+            result = df.copy()
+            if not phi_cols:
+                phi_cols = self._detect_phi_columns(result)
+            if patient_id_col and patient_id_col in result.columns:
+                if self.config.hash_patient_ids:
+                    result[patient_id_col] = self._hash_series(result[patient_id_col])
+            for col in phi_cols:
+                if col not in result.columns:
+                    continue
+                if self._is_date_column(result[col]):
+                    if self.config.shift_dates:
+                        result[col] = self._shift_dates(
+                            result[col], result.get(patient_id_col)
+                        )
+                elif self._is_age_column(col):
+                    result[col] = self._truncate_ages(result[col])
+                elif self._is_address_column(col) and self.config.remove_addresses:
+                    result[col] = "[REDACTED]"
+                elif self._is_name_column(col) and self.config.remove_names:
+                    result[col] = "[REDACTED]"
+                elif (
+                    self._is_contact_info_column(col)
+                    and self.config.remove_contact_info
                 ):
                     result[col] = "[REDACTED]"
+                elif self._is_id_column(col):
+                    if (
+                        self._is_mrn_column(col)
+                        and self.config.remove_mrns
+                        or (self._is_ssn_column(col) and self.config.remove_ssn)
+                        or (
+                            self._is_device_id_column(col)
+                            and self.config.remove_device_ids
+                        )
+                    ):
+                        result[col] = "[REDACTED]"
+                    else:
+                        result[col] = self._hash_series(result[col], keep_missing=True)
                 else:
-                    result[col] = result[col].apply(
-                        lambda x: self._hash_identifier(str(x)) if pd.notna(x) else x
-                    )
-            else:
-                result[col] = "[REDACTED]"
-        if self.config.k_anonymity_threshold > 1:
-            result = self._apply_k_anonymity(result)
-        return result
+                    result[col] = "[REDACTED]"
+            if self.config.k_anonymity_threshold > 1:
+                result = self._apply_k_anonymity(result)
+            return result
 
     def deidentify_fhir_bundle(self, bundle: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -181,23 +254,50 @@ class PHIDeidentifier:
         """
         import copy
 
-        result = copy.deepcopy(bundle)
-        if "entry" in result and isinstance(result["entry"], list):
-            for entry in result["entry"]:
-                if "resource" in entry:
-                    resource = entry["resource"]
-                    resource_type = resource.get("resourceType")
-                    if resource_type == "Patient":
-                        self._deidentify_patient_resource(resource)
-                    elif resource_type == "Observation":
-                        self._deidentify_observation_resource(resource)
-                    elif resource_type == "Encounter":
-                        self._deidentify_encounter_resource(resource)
-                    elif resource_type == "Condition":
-                        self._deidentify_condition_resource(resource)
-                    elif resource_type == "MedicationRequest":
-                        self._deidentify_medication_request_resource(resource)
-        return result
+        with self._digest_cache():
+            result = copy.deepcopy(bundle)
+            if "entry" in result and isinstance(result["entry"], list):
+                for entry in result["entry"]:
+                    if "resource" in entry:
+                        resource = entry["resource"]
+                        resource_type = resource.get("resourceType")
+                        if resource_type == "Patient":
+                            self._deidentify_patient_resource(resource)
+                        elif resource_type == "Observation":
+                            self._deidentify_observation_resource(resource)
+                        elif resource_type == "Encounter":
+                            self._deidentify_encounter_resource(resource)
+                        elif resource_type == "Condition":
+                            self._deidentify_condition_resource(resource)
+                        elif resource_type == "MedicationRequest":
+                            self._deidentify_medication_request_resource(resource)
+            return result
+
+    @contextmanager
+    def _digest_cache(self) -> Iterator[None]:
+        """Cache identifier digests for the duration of one public call."""
+        if self._digests is not None:
+            yield
+            return
+        self._local.digests = {}
+        try:
+            yield
+        finally:
+            self._local.digests = None
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        del state["_local"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    @property
+    def _digests(self) -> Optional[Dict[str, str]]:
+        """The calling thread's digest cache, or None outside a public call."""
+        return getattr(self._local, "digests", None)
 
     def _deidentify_patient_resource(self, resource: Dict[str, Any]) -> None:
         """De-identify a FHIR Patient resource."""
@@ -212,24 +312,57 @@ class PHIDeidentifier:
         if "telecom" in resource and self.config.remove_contact_info:
             resource["telecom"] = []
         if "birthDate" in resource and self.config.remove_dates_of_birth:
-            if self.config.shift_dates:
-                patient_id = self._extract_patient_id_from_resource(resource)
-                resource["birthDate"] = self._shift_date_string(
-                    resource["birthDate"], patient_id
-                )
-            else:
-                birth_year = (
-                    resource["birthDate"][:4]
-                    if len(resource["birthDate"]) >= 4
-                    else None
-                )
-                if (
-                    birth_year
-                    and self._calculate_age(resource["birthDate"])
-                    >= self.config.age_threshold
-                ):
-                    birth_year = str(int(birth_year) - int(birth_year) % 10)
-                resource["birthDate"] = birth_year if birth_year else "[REDACTED]"
+            resource["birthDate"] = self._deidentify_birth_date(
+                resource["birthDate"], self._extract_patient_id_from_resource(resource)
+            )
+
+    def _deidentify_birth_date(
+        self, birth_date: str, patient_id: Optional[str] = None
+    ) -> str:
+        """De-identify a birth date by shifting it or reducing it to a year."""
+        if self.config.shift_dates:
+            return self._shift_date_string(birth_date, patient_id)
+        birth_year = birth_date[:4] if len(birth_date) >= 4 else None
+        if birth_year and self._calculate_age(birth_date) >= self.config.age_threshold:
+            birth_year = str(int(birth_year) - int(birth_year) % 10)
+        return birth_year if birth_year else "[REDACTED]"
+
+    def deidentify_patient_data(self, patient_data: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        De-identify a patient record in the structure built by FHIRConnector.get_patient_data.
+
+        The patient ID is hashed, the birth date handled as for Patient resources,
+        and event and lab dates shifted with the patient's consistent offset so
+        intervals between them are preserved.
+
+        Args:
+            patient_data: Patient record with patient_id, demographics,
+                clinical_events, lab_results and medications
+
+        Returns:
+            De-identified copy of the record
+        """
+        patient_id = patient_data.get("patient_id")
+        result = dict(patient_data)
+        if patient_id and self.config.hash_patient_ids:
+            result["patient_id"] = self._hash_identifier(str(patient_id))
+        demographics = dict(patient_data.get("demographics") or {})
+        if demographics.get("birthDate") and self.config.remove_dates_of_birth:
+            demographics["birthDate"] = self._deidentify_birth_date(
+                demographics["birthDate"], patient_id
+            )
+        result["demographics"] = demographics
+        for section in ("clinical_events", "lab_results"):
+            entries = []
+            for entry in patient_data.get(section) or []:
+                if entry.get("date") and self.config.shift_dates:
+                    entry = {
+                        **entry,
+                        "date": self._shift_date_string(entry["date"], patient_id),
+                    }
+                entries.append(entry)
+            result[section] = entries
+        return result
 
     def _deidentify_observation_resource(self, resource: Dict[str, Any]) -> None:
         """De-identify a FHIR Observation resource."""
@@ -329,34 +462,9 @@ class PHIDeidentifier:
         Returns:
             List of column names that might contain PHI
         """
-        phi_patterns = [
-            "(?i)name",
-            "(?i)address",
-            "(?i)birth",
-            "(?i)dob",
-            "(?i)phone",
-            "(?i)email",
-            "(?i)ssn",
-            "(?i)social",
-            "(?i)mrn",
-            "(?i)medical.?record",
-            "(?i)patient.?id",
-            "(?i)zip",
-            "(?i)postal",
-            "(?i)city",
-            "(?i)state",
-            "(?i)date",
-            "(?i)age",
-            "(?i)identifier",
-            "(?i)license",
-            "(?i)account",
-            "(?i)url",
-            "(?i)ip.?address",
-            "(?i)device",
-        ]
         phi_cols = []
         for col in df.columns:
-            if any((re.search(pattern, col) for pattern in phi_patterns)):
+            if _PHI_COLUMN_PATTERN.search(col):
                 phi_cols.append(col)
         return phi_cols
 
@@ -366,88 +474,42 @@ class PHIDeidentifier:
             return True
         if series.dtype == "object":
             sample = series.dropna().head(10)
-            date_patterns = [
-                "\\d{4}-\\d{2}-\\d{2}",
-                "\\d{2}/\\d{2}/\\d{4}",
-                "\\d{2}-\\d{2}-\\d{4}",
-            ]
             for val in sample:
-                if isinstance(val, str) and any(
-                    (re.search(pattern, val) for pattern in date_patterns)
-                ):
+                if isinstance(val, str) and _DATE_VALUE_PATTERN.search(val):
                     return True
         return False
 
     def _is_age_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains age values."""
-        age_patterns = [
-            "(?i)^age$",
-            "(?i)age[_\\s]",
-            "(?i)[_\\s]age$",
-            "(?i)patient[_\\s]age",
-            "(?i)age[_\\s]years",
-        ]
-        return any((re.search(pattern, col_name) for pattern in age_patterns))
+        return bool(_AGE_COLUMN_PATTERN.search(col_name))
 
     def _is_address_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains address values."""
-        address_patterns = [
-            "(?i)address",
-            "(?i)street",
-            "(?i)city",
-            "(?i)state",
-            "(?i)zip",
-            "(?i)postal",
-        ]
-        return any((re.search(pattern, col_name) for pattern in address_patterns))
+        return bool(_ADDRESS_COLUMN_PATTERN.search(col_name))
 
     def _is_name_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains name values."""
-        name_patterns = [
-            "(?i)name",
-            "(?i)first[_\\s]name",
-            "(?i)last[_\\s]name",
-            "(?i)middle[_\\s]name",
-            "(?i)patient[_\\s]name",
-        ]
-        return any((re.search(pattern, col_name) for pattern in name_patterns))
+        return bool(_NAME_COLUMN_PATTERN.search(col_name))
 
     def _is_contact_info_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains contact information."""
-        contact_patterns = [
-            "(?i)phone",
-            "(?i)email",
-            "(?i)fax",
-            "(?i)contact",
-            "(?i)mobile",
-            "(?i)cell",
-        ]
-        return any((re.search(pattern, col_name) for pattern in contact_patterns))
+        return bool(_CONTACT_COLUMN_PATTERN.search(col_name))
 
     def _is_id_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains ID values."""
-        id_patterns = ["(?i)id$", "(?i)identifier", "(?i)number", "(?i)code", "(?i)key"]
-        return any((re.search(pattern, col_name) for pattern in id_patterns))
+        return bool(_ID_COLUMN_PATTERN.search(col_name))
 
     def _is_mrn_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains medical record numbers."""
-        mrn_patterns = ["(?i)mrn", "(?i)medical[_\\s]record", "(?i)record[_\\s]number"]
-        return any((re.search(pattern, col_name) for pattern in mrn_patterns))
+        return bool(_MRN_COLUMN_PATTERN.search(col_name))
 
     def _is_ssn_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains social security numbers."""
-        ssn_patterns = ["(?i)ssn", "(?i)social[_\\s]security", "(?i)tax[_\\s]id"]
-        return any((re.search(pattern, col_name) for pattern in ssn_patterns))
+        return bool(_SSN_COLUMN_PATTERN.search(col_name))
 
     def _is_device_id_column(self, col_name: str) -> bool:
         """Check if a column name suggests it contains device identifiers."""
-        device_patterns = [
-            "(?i)device[_\\s]id",
-            "(?i)serial[_\\s]number",
-            "(?i)imei",
-            "(?i)uuid",
-        ]
-        return any((re.search(pattern, col_name) for pattern in device_patterns))
+        return bool(_DEVICE_ID_COLUMN_PATTERN.search(col_name))
 
     def _hash_identifier(self, value: str) -> str:
         """
@@ -461,10 +523,77 @@ class PHIDeidentifier:
         """
         if not value:
             return value
-        salted = f"{value}{self.config.salt}"
-        hashed = hashlib.sha256(salted.encode()).hexdigest()
+        text = f"{value}"
+        cache = self._digests
+        hashed = cache.get(text) if cache is not None else None
+        if hashed is None:
+            hashed = hashlib.sha256(text.encode() + self._salt_bytes).hexdigest()
+            if cache is not None:
+                cache[text] = hashed
         return hashed
 
+    def _hash_series(self, values: pd.Series, keep_missing: bool = False) -> pd.Series:
+        """
+        Hash a column of identifiers as ``_hash_identifier(str(value))`` would.
+
+        Identifier columns repeat values heavily, so each distinct value is
+        looked up once in the current call's digest cache, only unseen values are
+        hashed, and the digests are broadcast back.
+
+        Args:
+            values: Identifiers to hash
+            keep_missing: Whether to leave missing values as they are rather
+                than hashing their string form
+
+        Returns:
+            Series of hashed values
+        """
+        if isinstance(values.dtype, pd.CategoricalDtype):
+            # Distinct categories can share a text form (1 and "1"), so map
+            # the codes onto the distinct digests instead of renaming
+            digests = self._hash_series(pd.Series(values.cat.categories))
+            digest_codes, uniques = pd.factorize(digests.to_numpy())
+            codes = np.append(digest_codes, -1)[values.cat.codes.to_numpy()]
+            return pd.Series(
+                pd.Categorical.from_codes(codes, categories=uniques),
+                index=values.index,
+                name=values.name,
+            )
+        original = values.astype(object).to_numpy()
+        if (isinstance(values.dtype, np.dtype) and values.dtype.kind in "biuf") or (
+            pd.api.types.infer_dtype(original, skipna=True) == "string"
+        ):
+            # Grouping the raw values matches grouping their text here
+            keys = values.to_numpy()
+        else:
+            # Mixed objects can compare equal across types (1 == 1.0 == True)
+            # while their text differs, so group on the text instead
+            keys = np.array(
+                [None if pd.isna(v) else str(v) for v in original], dtype=object
+            )
+        codes, uniques = pd.factorize(keys)
+        sha256 = hashlib.sha256
+        salt = self._salt_bytes
+        cache = self._digests if self._digests is not None else {}
+        digests = np.empty(len(uniques), dtype=object)
+        for i, unique in enumerate(uniques):
+            text = str(unique)
+            digest = cache.get(text)
+            if digest is None:
+                digest = sha256(text.encode() + salt).hexdigest() if text else text
+                cache[text] = digest
+            digests[i] = digest
+        hashed = digests[codes]
+        missing = codes < 0
+        if missing.any():
+            if keep_missing:
+                hashed[missing] = original[missing]
+            else:
+                hashed[missing] = [
+                    self._hash_identifier(str(v)) for v in original[missing]
+                ]
+        return pd.Series(hashed, index=values.index, name=values.name)
+
     def _shift_dates(
         self, date_series: pd.Series, patient_id_series: Optional[pd.Series] = None
     ) -> pd.Series:
@@ -484,16 +613,23 @@ class PHIDeidentifier:
             and patient_id_series is not None
         ):
             result = dates.copy()
-            for i, (date, patient_id) in enumerate(zip(dates, patient_id_series)):
-                if pd.isna(date) or pd.isna(patient_id):
-                    continue
-                if patient_id not in self.patient_date_shifts:
-                    self.patient_date_shifts[patient_id] = np.random.randint(
-                        -self.config.max_date_shift_days,
-                        self.config.max_date_shift_days,
-                    )
-                shift_days = self.patient_date_shifts[patient_id]
-                result.iloc[i] = date + pd.Timedelta(days=shift_days)
+            patient_ids = np.asarray(patient_id_series, dtype=object)
+            valid = dates.notna().to_numpy() & pd.notna(patient_ids)
+            # Patients in order of first appearance, so new patients draw their
+            # shifts in the same order as a row-by-row pass would
+            codes, patients = pd.factorize(patient_ids[valid])
+            new_patients = [p for p in patients if p not in self.patient_date_shifts]
+            if new_patients:
+                new_shifts = np.random.randint(
+                    -self.config.max_date_shift_days,
+                    self.config.max_date_shift_days,
+                    size=len(new_patients),
+                )
+                self.patient_date_shifts.update(zip(new_patients, new_shifts.tolist()))
+            shift_days = np.array(
+                [self.patient_date_shifts[p] for p in patients], dtype=np.int64
+            )
+            result[valid] = dates[valid] + pd.to_timedelta(shift_days[codes], unit="D")
             return result
         else:
             return dates + pd.Timedelta(days=self.global_date_shift)
@@ -8,11 +8,14 @@ de-identification into the existing clinical data pipeline.
 import logging
 from typing import Any, Dict, List, Optional
 
+import pandas as pd
+
 from ml_core.pipeline.hipaa_compliance.deidentifier import (
     DeidentificationConfig,
     PHIDeidentifier,
 )
 from ml_core.pipeline.hipaa_compliance.phi_detector import PHIDetector
+from ml_core.pipeline.temporal_features import sliding_window_features
 
 logger = logging.getLogger(__name__)
 
@@ -136,6 +139,28 @@ class HIPAACompliantHealthcareETL(_beam_ptransform_base()):
             )
         )
 
+    def transform_batch(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        De-identify a bounded batch and compute its sliding-window features.
+
+        Bounded input needs none of Beam's windowing or per-element dispatch,
+        so the whole batch goes through one vectorised pass; expand() remains
+        the path for unbounded input. Window options are read from the
+        pipeline config's "sliding_window" entry.
+        """
+        # One de-identifier across batches keeps each patient's date shift
+        # stable from one batch to the next
+        if not hasattr(self, "deidentifier"):
+            self.deidentifier = PHIDeidentifier(self.deidentification_config)
+        deidentified = self.deidentifier.deidentify_dataframe(
+            df, patient_id_col=self.patient_id_col, phi_cols=self.phi_cols
+        )
+        return sliding_window_features(
+            deidentified,
+            patient_id_column=self.patient_id_col or "patient_id",
+            **self.pipeline_config.get("sliding_window", {}),
+        )
+
 
 def create_hipaa_compliant_etl(
     pipeline_config: Optional[Dict[str, Any]] = None,
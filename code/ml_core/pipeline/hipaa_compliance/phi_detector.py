@@ -10,6 +10,29 @@ from typing import Any, Dict, List, Set
 
 import pandas as pd
 
+# Compiled once at import: compiled patterns are immutable and safe to scan
+# from several threads, so every detector can share them.
+_PHI_PATTERNS = {
+    "name": re.compile("\\b[A-Z][a-z]+ [A-Z][a-z]+\\b"),
+    "ssn": re.compile("\\b\\d{3}[-\\s]?\\d{2}[-\\s]?\\d{4}\\b"),
+    "phone": re.compile(
+        "\\b(\\+\\d{1,2}\\s)?\\(?\\d{3}\\)?[\\s.-]?\\d{3}[\\s.-]?\\d{4}\\b"
+    ),
+    "email": re.compile("\\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}\\b"),
+    "address": re.compile(
+        "\\b\\d+\\s+[A-Za-z\\s]+,\\s+[A-Za-z\\s]+,\\s+[A-Z]{2}\\s+\\d{5}(-\\d{4})?\\b"
+    ),
+    "date": re.compile(
+        "\\b\\d{1,2}[-/]\\d{1,2}[-/]\\d{2,4}\\b|\\b\\d{4}[-/]\\d{1,2}[-/]\\d{1,2}\\b"
+    ),
+    "mrn": re.compile(
+        "\\b(MRN|mrn|Medical Record Number|medical record number)[:# ]?\\s*\\d+\\b"
+    ),
+    "ip_address": re.compile("\\b\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\b"),
+    "url": re.compile('\\bhttps?://[^\\s<>"]+|www\\.[^\\s<>"]+\\b'),
+    "zipcode": re.compile("\\b\\d{5}(-\\d{4})?\\b"),
+}
+
 
 class PHIDetector:
     """
@@ -21,28 +44,8 @@ class PHIDetector:
 
     def __init__(self) -> None:
         """Initialize the PHI detector."""
-        self.patterns = {
-            "name": re.compile("\\b[A-Z][a-z]+ [A-Z][a-z]+\\b"),
-            "ssn": re.compile("\\b\\d{3}[-\\s]?\\d{2}[-\\s]?\\d{4}\\b"),
-            "phone": re.compile(
-                "\\b(\\+\\d{1,2}\\s)?\\(?\\d{3}\\)?[\\s.-]?\\d{3}[\\s.-]?\\d{4}\\b"
-            ),
-            "email": re.compile(
-                "\\b[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\\.[a-zA-Z]{2,}\\b"
-            ),
-            "address": re.compile(
-                "\\b\\d+\\s+[A-Za-z\\s]+,\\s+[A-Za-z\\s]+,\\s+[A-Z]{2}\\s+\\d{5}(-\\d{4})?\\b"
-            ),
-            "date": re.compile(
-                "\\b\\d{1,2}[-/]\\d{1,2}[-/]\\d{2,4}\\b|\\b\\d{4}[-/]\\d{1,2}[-/]\\d{1,2}\\b"
-            ),
-            "mrn": re.compile(
-                "\\b(MRN|mrn|Medical Record Number|medical record number)[:# ]?\\s*\\d+\\b"
-            ),
-            "ip_address": re.compile("\\b\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\.\\d{1,3}\\b"),
-            "url": re.compile('\\bhttps?://[^\\s<>"]+|www\\.[^\\s<>"]+\\b'),
-            "zipcode": re.compile("\\b\\d{5}(-\\d{4})?\\b"),
-        }
+        # The compiled patterns are shared; each detector gets its own dict
+        self.patterns = dict(_PHI_PATTERNS)
 
     def detect_phi_in_text(self, text: str) -> Dict[str, List[str]]:
         """
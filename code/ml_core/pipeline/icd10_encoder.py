@@ -9,9 +9,11 @@ feature engineering based on ICD-10 hierarchical structure.
 import logging
 import re
 from collections import defaultdict
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
+import numpy as np
 import pandas as pd
+from scipy import sparse
 
 logger = logging.getLogger(__name__)
 
@@ -191,6 +193,14 @@ class ICD10Encoder:
         self.custom_code_groups = custom_code_groups or {}
         self.code_groups = {**self.CHRONIC_CONDITION_GROUPS, **self.custom_code_groups}
         self.chapter_lookup = self._build_chapter_lookup()
+        self.chapter_ranges: Dict[str, str] = {}
+        for chapter_range, chapter_name in self.ICD10_CHAPTERS.items():
+            self.chapter_ranges.setdefault(chapter_name, chapter_range)
+        # Group membership is a prefix match against the normalized group
+        # codes; normalizing them once here leaves one dict probe per
+        # distinct prefix length on the lookup path.
+        self._group_lookup = self._build_prefix_lookup(self.code_groups)
+        self._custom_lookup = self._build_prefix_lookup(self.custom_code_groups)
         logger.info(
             f"Initialized ICD10Encoder with {len(self.code_groups)} code groups"
         )
@@ -237,6 +247,40 @@ class ICD10Encoder:
                 current_letter = chr(ord(current_letter) + 1)
         return chapter_lookup
 
+    def _build_prefix_lookup(
+        self, groups: Dict[str, List[str]]
+    ) -> Tuple[List[str], Dict[str, List[int]], List[int]]:
+        """
+        Index code groups by their normalized code prefixes.
+
+        Args:
+            groups: Mapping of group names to ICD-10 code prefixes
+
+        Returns:
+            Tuple of the group names, a mapping of each normalized prefix to the
+            positions of the groups containing it, and the distinct prefix lengths
+        """
+        prefixes: Dict[str, List[int]] = defaultdict(list)
+        for position, code_list in enumerate(groups.values()):
+            for c in code_list:
+                norm_c = self.normalize_icd10(c)
+                if norm_c and position not in prefixes[norm_c]:
+                    prefixes[norm_c].append(position)
+        return list(groups), dict(prefixes), sorted({len(p) for p in prefixes})
+
+    @staticmethod
+    def _match_prefix_groups(
+        normalized: str, lookup: Tuple[List[str], Dict[str, List[int]], List[int]]
+    ) -> List[str]:
+        """Get the groups, in definition order, with a prefix of a normalized code."""
+        names, prefixes, lengths = lookup
+        positions = set()
+        for length in lengths:
+            if length > len(normalized):
+                break
+            positions.update(prefixes.get(normalized[:length], ()))
+        return [names[p] for p in sorted(positions)]
+
     def normalize_icd10(self, code: str) -> str:
         """
         Normalize an ICD-10 code by standardizing format.
@@ -303,15 +347,7 @@ class ICD10Encoder:
         normalized = self.normalize_icd10(code)
         if not normalized:
             return []
-        matching_groups = []
-        for group_name, code_list in self.code_groups.items():
-            if any(
-                (norm_c and normalized.startswith(norm_c))
-                for c in code_list
-                for norm_c in [self.normalize_icd10(c)]
-            ):
-                matching_groups.append(group_name)
-        return matching_groups
+        return self._match_prefix_groups(normalized, self._group_lookup)
 
     def encode_codes_binary(
         self, codes: List[str], level: str = "chapter"
@@ -328,64 +364,117 @@ class ICD10Encoder:
         """
         if not codes:
             return {}
-        features = {}
-        if level == "chapter":
-            for chapter_range, chapter_name in self.ICD10_CHAPTERS.items():
-                feature_name = f"icd10_chapter_{chapter_range}"
-                features[feature_name] = 0
-            for code in codes:
-                chapter = self.get_chapter(code)
-                if chapter:
-                    for chapter_range, chapter_name in self.ICD10_CHAPTERS.items():
-                        if chapter_name == chapter:
-                            feature_name = f"icd10_chapter_{chapter_range}"
-                            features[feature_name] = 1
-                            break
-        elif level == "category":
-            unique_categories = set()
-            for code in codes:
-                normalized = self.normalize_icd10(code)
-                if normalized:
-                    category = normalized[:3] if len(normalized) >= 3 else normalized
-                    category = category.replace(".", "")
-                    unique_categories.add(category)
-            for category in unique_categories:
-                feature_name = f"icd10_category_{category}"
+        feature_names = self._binary_feature_columns(level)
+        if feature_names is None:
+            return {}
+        features = dict.fromkeys(feature_names, 0)
+        for code in codes:
+            for feature_name in self._binary_feature_names(code, level):
                 features[feature_name] = 1
-        elif level == "group":
-            for group_name in self.code_groups.keys():
-                feature_name = f"icd10_group_{group_name}"
-                features[feature_name] = 0
-            for code in codes:
-                groups = self.get_code_group(code)
-                for group in groups:
-                    feature_name = f"icd10_group_{group}"
-                    features[feature_name] = 1
-        elif level == "custom":
+        return features
+
+    def _binary_feature_columns(self, level: str) -> Optional[List[str]]:
+        """
+        Get the binary feature names that are always present at a given level.
+
+        Args:
+            level: Level of encoding ('chapter', 'category', 'group', or 'custom')
+
+        Returns:
+            List of feature names (empty for 'category', whose features depend
+            on the codes seen), or None if the level is unsupported
+        """
+        if level == "chapter":
+            return [f"icd10_chapter_{r}" for r in self.ICD10_CHAPTERS]
+        if level == "category":
+            return []
+        if level == "group":
+            return [f"icd10_group_{g}" for g in self.code_groups]
+        if level == "custom":
             if not self.custom_code_groups:
                 logger.warning(
                     "No custom code groups defined for 'custom' level encoding"
                 )
-                return {}
-            for group_name in self.custom_code_groups.keys():
-                feature_name = f"icd10_custom_{group_name}"
-                features[feature_name] = 0
-            for code in codes:
-                normalized = self.normalize_icd10(code)
-                if not normalized:
-                    continue
-                for group_name, code_list in self.custom_code_groups.items():
-                    if any(
-                        (norm_c and normalized.startswith(norm_c))
-                        for c in code_list
-                        for norm_c in [self.normalize_icd10(c)]
-                    ):
-                        feature_name = f"icd10_custom_{group_name}"
-                        features[feature_name] = 1
+            return [f"icd10_custom_{g}" for g in self.custom_code_groups]
+        logger.error(f"Unsupported encoding level: {level}")
+        return None
+
+    def _binary_feature_names(self, code: str, level: str) -> List[str]:
+        """
+        Get the binary feature names a single code switches on at a given level.
+
+        Args:
+            code: The ICD-10 code
+            level: Level of encoding ('chapter', 'category', 'group', or 'custom')
+
+        Returns:
+            List of feature names set to 1 by this code
+        """
+        if level == "chapter":
+            chapter = self.get_chapter(code)
+            if chapter in self.chapter_ranges:
+                return [f"icd10_chapter_{self.chapter_ranges[chapter]}"]
+            return []
+        normalized = self.normalize_icd10(code)
+        if not normalized:
+            return []
+        if level == "category":
+            category = normalized[:3] if len(normalized) >= 3 else normalized
+            return [f"icd10_category_{category.replace('.', '')}"]
+        if level == "group":
+            lookup = self._group_lookup
         else:
-            logger.error(f"Unsupported encoding level: {level}")
-            return {}
-        return features
+            lookup = self._custom_lookup
+        return [
+            f"icd10_{level}_{group}"
+            for group in self._match_prefix_groups(normalized, lookup)
+        ]
+
+    def encode_codes_binary_batch(
+        self, code_lists: List[List[str]], level: str = "chapter"
+    ) -> Tuple[sparse.csr_matrix, List[str]]:
+        """
+        Encode the ICD-10 codes of many patients as one sparse binary matrix.
+
+        Each distinct code is resolved once for the whole batch instead of once
+        per patient. Row i matches ``encode_codes_binary(code_lists[i], level)``,
+        except that patients without codes get an all-zero row.
+
+        Args:
+            code_lists: One list of ICD-10 codes per patient
+            level: Level of encoding ('chapter', 'category', 'group', or 'custom')
+
+        Returns:
+            Tuple of a (len(code_lists), n_features) CSR matrix of 0/1 values and
+            the feature name for each column
+        """
+        feature_names = self._binary_feature_columns(level)
+        if feature_names is None:
+            feature_names = []
+            code_lists = [[] for _ in code_lists]
+        columns = {name: i for i, name in enumerate(feature_names)}
+        code_columns: Dict[str, List[int]] = {}
+        rows: List[int] = []
+        cols: List[int] = []
+        for i, codes in enumerate(code_lists):
+            patient_cols = set()
+            for code in codes:
+                if code not in code_columns:
+                    indices = []
+                    for name in self._binary_feature_names(code, level):
+                        if name not in columns:
+                            columns[name] = len(feature_names)
+                            feature_names.append(name)
+                        indices.append(columns[name])
+                    code_columns[code] = indices
+                patient_cols.update(code_columns[code])
+            rows.extend([i] * len(patient_cols))
+            cols.extend(patient_cols)
+        matrix = sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.int8), (rows, cols)),
+            shape=(len(code_lists), len(feature_names)),
+        )
+        return matrix, feature_names
 
     def encode_codes_count(
         self, codes: List[str], level: str = "chapter"
@@ -16,6 +16,121 @@ from sklearn.base import BaseEstimator, TransformerMixin
 
 logger = logging.getLogger(__name__)
 
+try:
+    from numba import njit
+
+    _NUMBA_AVAILABLE = True
+except ImportError:
+    _NUMBA_AVAILABLE = False
+
+NS_PER_DAY = 86_400 * 10**9
+
+# Aggregations that can be answered from a window summary alone
+_SUMMARY_AGGREGATIONS = frozenset(
+    ["mean", "min", "max", "std", "var", "count", "sum", "range"]
+)
+
+
+def _window_summary_py(
+    timestamps: np.ndarray, values: np.ndarray, reference: int, window: int
+) -> tuple:
+    """
+    Summarise the observations with reference - window <= timestamp <= reference.
+
+    Written as a plain loop so numba can compile it; NaT (int64 min) always
+    falls outside the window.
+
+    Args:
+        timestamps: Observation times as int64 nanoseconds
+        values: Observed values, NaN where missing
+        reference: Reference time as int64 nanoseconds
+        window: Window length in nanoseconds
+
+    Returns:
+        Tuple of (rows, count, total, m2, min, max, first, last), where rows
+        counts observations in the window, count those with a value, m2 is the
+        sum of squared deviations from the mean, and first/last are the
+        earliest and latest observation times
+    """
+    start = reference - window
+    rows = 0
+    count = 0
+    total = 0.0
+    vmin = np.inf
+    vmax = -np.inf
+    first = reference
+    last = start
+    for i in range(timestamps.shape[0]):
+        t = timestamps[i]
+        if t < start or t > reference:
+            continue
+        rows += 1
+        first = min(first, t)
+        last = max(last, t)
+        v = values[i]
+        if np.isnan(v):
+            continue
+        count += 1
+        total += v
+        vmin = min(vmin, v)
+        vmax = max(vmax, v)
+    m2 = 0.0
+    if count > 1:
+        mean = total / count
+        for i in range(timestamps.shape[0]):
+            t = timestamps[i]
+            if t < start or t > reference or np.isnan(values[i]):
+                continue
+            m2 += (values[i] - mean) ** 2
+    return rows, count, total, m2, vmin, vmax, first, last
+
+
+_window_summary = njit(cache=True)(_window_summary_py) if _NUMBA_AVAILABLE else None
+
+
+def warm_window_kernel() -> None:
+    """Compile (or load from numba's cache) the window kernel ahead of first use."""
+    if _window_summary is not None:
+        _window_summary(np.zeros(1, dtype=np.int64), np.zeros(1), 0, NS_PER_DAY)
+
+
+def _aggregate_summary(
+    agg_func: str, count: int, total: float, m2: float, vmin: float, vmax: float
+) -> float:
+    """
+    Compute an aggregation from a window summary, matching _aggregate_values.
+
+    Args:
+        agg_func: Aggregation function name (one of _SUMMARY_AGGREGATIONS)
+        count: Number of non-missing values
+        total: Sum of the values
+        m2: Sum of squared deviations from the mean
+        vmin: Minimum value
+        vmax: Maximum value
+
+    Returns:
+        Aggregated value
+    """
+    if agg_func == "count":
+        return count
+    if agg_func == "sum":
+        return total
+    if count == 0:
+        return np.nan
+    if agg_func == "mean":
+        return total / count
+    if agg_func == "min":
+        return vmin
+    if agg_func == "max":
+        return vmax
+    if agg_func == "range":
+        return vmax - vmin
+    if count < 2:
+        return np.nan
+    if agg_func == "var":
+        return m2 / (count - 1)
+    return np.sqrt(m2 / (count - 1))
+
 
 class TemporalFeatureExtractor(BaseEstimator, TransformerMixin):
     """
@@ -145,35 +260,60 @@ class TemporalFeatureExtractor(BaseEstimator, TransformerMixin):
         """
         if series.empty:
             return np.nan
+        return self._aggregate_values(series.to_numpy(dtype=float), agg_func)
+
+    def _aggregate_values(self, values: np.ndarray, agg_func: str) -> float:
+        """
+        Compute an aggregation over a float array, skipping NaN like pandas does.
+
+        Args:
+            values: Input values
+            agg_func: Aggregation function name
+
+        Returns:
+            Aggregated value
+        """
+        if agg_func == "slope":
+            if len(values) < 2:
+                return 0
+            x = np.arange(len(values))
+            slope, _, _, _, _ = stats.linregress(x, values)
+            return slope
+        valid = values[~np.isnan(values)]
+        n = valid.size
+        if agg_func == "count":
+            return n
+        elif agg_func == "sum":
+            return valid.sum()
+        elif agg_func not in (
+            "mean",
+            "min",
+            "max",
+            "median",
+            "std",
+            "var",
+            "range",
+            "iqr",
+        ):
+            raise ValueError(f"Unsupported aggregation function: {agg_func}")
+        if n == 0:
+            return np.nan
         if agg_func == "mean":
-            return series.mean()
+            return valid.mean()
         elif agg_func == "min":
-            return series.min()
+            return valid.min()
         elif agg_func == "max":
-            return series.max()
+            return valid.max()
         elif agg_func == "median":
-            return series.median()
+            return np.median(valid)
         elif agg_func == "std":
-            return series.std()
+            return valid.std(ddof=1) if n > 1 else np.nan
         elif agg_func == "var":
-            return series.var()
-        elif agg_func == "count":
-            return series.count()
-        elif agg_func == "sum":
-            return series.sum()
+            return valid.var(ddof=1) if n > 1 else np.nan
         elif agg_func == "range":
-            return series.max() - series.min()
-        elif agg_func == "iqr":
-            q75, q25 = np.percentile(series.dropna(), [75, 25])
-            return q75 - q25
-        elif agg_func == "slope":
-            if len(series) < 2:
-                return 0
-            x = np.arange(len(series))
-            slope, _, _, _, _ = stats.linregress(x, series)
-            return slope
-        else:
-            raise ValueError(f"Unsupported aggregation function: {agg_func}")
+            return valid.max() - valid.min()
+        q75, q25 = np.percentile(valid, [75, 25])
+        return q75 - q25
 
     def _extract_window_features(
         self, patient_data: pd.DataFrame, reference_time: pd.Timestamp
@@ -185,45 +325,131 @@ class TemporalFeatureExtractor(BaseEstimator, TransformerMixin):
             patient_data: DataFrame containing a single patient's data
             reference_time: Reference time for window calculation
 
+        Returns:
+            Dictionary of extracted features
+        """
+        if not self.value_column:
+            return {}
+        return self._extract_window_features_raw(
+            patient_data[self.value_column].to_numpy(dtype=float),
+            patient_data[self.time_column].to_numpy(dtype="datetime64[ns]"),
+            reference_time,
+        )
+
+    def window_feature_names(self) -> List[str]:
+        """
+        Get the names of every feature the window extraction can produce.
+
+        Returns:
+            Feature names in the order the window extraction emits them
+        """
+        if not self.value_column:
+            return []
+        names = []
+        for window_size in self.window_sizes:
+            prefix = f"{self.value_column}_{window_size}d"
+            names.extend(
+                f"{prefix}_{agg_func}" for agg_func in self.aggregation_functions
+            )
+            if self.include_trends:
+                names.extend(
+                    f"{prefix}_{suffix}"
+                    for suffix in (
+                        "time_since_first",
+                        "time_since_last",
+                        "slope",
+                        "r_squared",
+                        "p_value",
+                    )
+                )
+        return names
+
+    def _extract_window_features_raw(
+        self,
+        values: np.ndarray,
+        timestamps: np.ndarray,
+        reference_time: pd.Timestamp,
+    ) -> Dict[str, float]:
+        """
+        Extract window features from a patient's values and timestamps as arrays.
+
+        Lets callers that hold raw observations skip building a DataFrame per
+        patient; ``_extract_window_features`` delegates here.
+
+        Args:
+            values: Float array of observed values
+            timestamps: datetime64[ns] array of observation times, aligned with values
+            reference_time: Reference time for window calculation
+
         Returns:
             Dictionary of extracted features
         """
         features: Dict[str, float] = {}
         if not self.value_column:
             return features
+        timestamps = np.asarray(timestamps, dtype="datetime64[ns]")
+        reference = np.datetime64(pd.Timestamp(reference_time).to_datetime64(), "ns")
+        one_day = np.timedelta64(1, "D")
+        # The compiled kernel answers the moment-style aggregations in one pass
+        # per window without building masks or intermediate arrays
+        use_kernel = (
+            _window_summary is not None
+            and not np.isnat(reference)
+            and _SUMMARY_AGGREGATIONS.issuperset(self.aggregation_functions)
+        )
         for window_size in self.window_sizes:
-            window_start = reference_time - pd.Timedelta(days=window_size)
-            window_data = patient_data[
-                (patient_data[self.time_column] >= window_start)
-                & (patient_data[self.time_column] <= reference_time)
-            ]
-            if window_data.empty:
+            window_start = reference - window_size * one_day
+            in_window = None
+            if use_kernel:
+                summary = _window_summary(
+                    timestamps.view(np.int64),
+                    values,
+                    reference.view(np.int64),
+                    window_size * NS_PER_DAY,
+                )
+                rows, count, total, m2, vmin, vmax, first, last = summary
+                aggregates = {
+                    agg_func: _aggregate_summary(agg_func, count, total, m2, vmin, vmax)
+                    for agg_func in self.aggregation_functions
+                }
+            else:
+                in_window = (timestamps >= window_start) & (timestamps <= reference)
+                window_values = values[in_window]
+                rows = window_values.size
+                aggregates = {
+                    agg_func: self._aggregate_values(window_values, agg_func)
+                    for agg_func in self.aggregation_functions
+                }
+            if rows == 0:
                 for agg_func in self.aggregation_functions:
                     feature_name = f"{self.value_column}_{window_size}d_{agg_func}"
                     features[feature_name] = np.nan
                 continue
-            for agg_func in self.aggregation_functions:
+            for agg_func, value in aggregates.items():
                 feature_name = f"{self.value_column}_{window_size}d_{agg_func}"
-                features[feature_name] = self._compute_aggregation(
-                    window_data[self.value_column], agg_func
-                )
-            if self.include_trends and len(window_data) >= 2:
-                first_time = window_data[self.time_column].min()
-                last_time = window_data[self.time_column].max()
+                features[feature_name] = value
+            if self.include_trends and rows >= 2:
+                if in_window is None:
+                    first_time = np.datetime64(int(first), "ns")
+                    last_time = np.datetime64(int(last), "ns")
+                else:
+                    window_times = timestamps[in_window]
+                    first_time = window_times.min()
+                    last_time = window_times.max()
                 features[f"{self.value_column}_{window_size}d_time_since_first"] = (
-                    reference_time - first_time
-                ).total_seconds() / 86400
+                    reference - first_time
+                ) / one_day
                 features[f"{self.value_column}_{window_size}d_time_since_last"] = (
-                    reference_time - last_time
-                ).total_seconds() / 86400
-                if len(window_data) >= 3:
-                    window_data = window_data.copy()
-                    window_data["days_from_start"] = (
-                        window_data[self.time_column]
-                        - window_data[self.time_column].min()
-                    ).dt.total_seconds() / 86400
+                    reference - last_time
+                ) / one_day
+                if rows >= 3:
+                    if in_window is None:
+                        in_window = (timestamps >= window_start) & (
+                            timestamps <= reference
+                        )
+                    days_from_start = (timestamps[in_window] - first_time) / one_day
                     slope, intercept, r_value, p_value, std_err = stats.linregress(
-                        window_data["days_from_start"], window_data[self.value_column]
+                        days_from_start, values[in_window]
                     )
                     features[f"{self.value_column}_{window_size}d_slope"] = slope
                     features[f"{self.value_column}_{window_size}d_r_squared"] = (
@@ -498,3 +724,109 @@ class MultiVariateTemporalFeatures:
             result = pd.concat(all_features_dfs, axis=1)
             result = result.loc[:, ~result.columns.duplicated()]
         return result
+
+
+def sliding_window_features(
+    df: pd.DataFrame,
+    patient_id_column: str = "patient_id",
+    time_column: str = "timestamp",
+    value_column: str = "value",
+    window: Any = "1h",
+    period: Any = "15min",
+    aggregation_functions: Optional[List[str]] = None,
+) -> pd.DataFrame:
+    """
+    Aggregate values over sliding windows for a bounded batch of observations.
+
+    Matches Beam's SlidingWindows(size=window, period=period): each window is
+    [end - window, end) with ends on period boundaries. Observations are first
+    bucketed into patient x period slots, and one grouped rolling pass then
+    combines the slots of each window, so no per-record Python call is needed.
+    Only windows whose last slot contains an observation are returned.
+
+    Args:
+        df: Long-format DataFrame of observations
+        patient_id_column: Column name for patient ID
+        time_column: Column name containing timestamps
+        value_column: Column name containing the values to aggregate
+        window: Window length, anything pd.Timedelta accepts
+        period: Slide between window starts, anything pd.Timedelta accepts
+        aggregation_functions: Any of mean, std, var, count, sum, min, max;
+            defaults to mean and std
+
+    Returns:
+        DataFrame with patient ID, window_end and one column per aggregation
+    """
+    if aggregation_functions is None:
+        aggregation_functions = ["mean", "std"]
+    window = pd.Timedelta(window)
+    period = pd.Timedelta(period)
+    unsupported = set(aggregation_functions) - {
+        "mean",
+        "std",
+        "var",
+        "count",
+        "sum",
+        "min",
+        "max",
+    }
+    if unsupported:
+        raise ValueError(f"Unsupported aggregation functions: {sorted(unsupported)}")
+
+    values = pd.to_numeric(df[value_column], errors="coerce")
+    slot = pd.to_datetime(df[time_column]).dt.floor(period)
+    # Sums of squares are taken about each patient's mean: variance does not
+    # depend on the offset, and large-magnitude values no longer cancel
+    centered = values - values.groupby(df[patient_id_column].to_numpy()).transform(
+        "mean"
+    )
+    grouped = (
+        pd.DataFrame(
+            {
+                patient_id_column: df[patient_id_column].to_numpy(),
+                "slot": slot.to_numpy(),
+                "value": values.to_numpy(),
+                "centered": centered.to_numpy(),
+                "square": (centered**2).to_numpy(),
+            }
+        )
+        .groupby([patient_id_column, "slot"], sort=True)
+        .agg(
+            count=("value", "count"),
+            sum=("value", "sum"),
+            centered=("centered", "sum"),
+            square=("square", "sum"),
+            min=("value", "min"),
+            max=("value", "max"),
+        )
+        .reset_index(level=patient_id_column)
+        .groupby(patient_id_column, sort=False)
+    )
+    # A window ending after slot s holds the slots in (s - window, s]
+    rolling = grouped.rolling(window)
+    sums = rolling[["count", "sum", "centered", "square"]].sum()
+    count = sums["count"]
+    mean = sums["sum"] / count.where(count > 0)
+    centered_mean = sums["centered"] / count.where(count > 0)
+    # Clipping only removes rounding residue around a zero variance
+    var = (
+        (sums["square"] - sums["centered"] * centered_mean)
+        / (count - 1).where(count > 1)
+    ).clip(lower=0)
+    stats_by_name = {
+        "count": count,
+        "sum": sums["sum"],
+        "mean": mean,
+        "var": var,
+        "std": np.sqrt(var),
+        "min": rolling["min"].min(),
+        "max": rolling["max"].max(),
+    }
+    result = pd.DataFrame(
+        {
+            f"{value_column}_{agg_func}": stats_by_name[agg_func]
+            for agg_func in aggregation_functions
+        }
+    ).reset_index()
+    result["slot"] = result["slot"] + period
+    return result.rename(columns={"slot": "window_end"})
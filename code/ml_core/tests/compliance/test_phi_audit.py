@@ -1,4 +1,5 @@
 import os
+import sqlite3
 import sys
 from datetime import datetime, timedelta, timezone
 
@@ -136,3 +137,124 @@ def test_report_column_names(audit_logger):
         "model",
     ]:
         assert col in df.columns, f"Missing column: {col}"
+
+
+def test_batched_logging_visible_to_queries(tmp_path):
+    logger = PHIAuditLogger(db_path=str(tmp_path / "batched.db"), batch_size=10)
+    for i in range(3):
+        logger.log_prediction_request(
+            patient_id="BATCH", user_id=f"user_{i}", model_used="m"
+        )
+    assert len(logger._buffer) == 3
+    df = logger.get_patient_access_history("BATCH")
+    assert len(df) == 3
+    assert len(logger._buffer) == 0
+    logger.close()
+
+
+def test_batched_logging_flushed_on_close(tmp_path):
+    db_path = str(tmp_path / "batched_close.db")
+    logger = PHIAuditLogger(db_path=db_path, batch_size=100)
+    logger.log_prediction_request(patient_id="CLOSE", user_id="u", model_used="m")
+    logger.close()
+    reopened = PHIAuditLogger(db_path=db_path)
+    assert len(reopened.get_patient_access_history("CLOSE")) == 1
+    reopened.close()
+
+
+def test_log_access_many(audit_logger):
+    audit_logger.log_access_many(
+        [
+            ("u1", "BULK", "Patient", "READ", "Review", "m1"),
+            ("u2", "BULK", "Observation", "WRITE", "Charting"),
+        ]
+    )
+    df = audit_logger.get_patient_access_history("BULK")
+    assert len(df) == 2
+    assert set(df["user"]) == {"u1", "u2"}
+    assert df.loc[df["user"] == "u2", "model"].isna().all()
+
+
+class _FailingInsertConnection:
+    """Delegates to a real connection but fails every batched insert."""
+
+    def __init__(self, conn, error=sqlite3.OperationalError("disk I/O error")):
+        self._conn = conn
+        self._error = error
+
+    def executemany(self, *args, **kwargs):
+        raise self._error
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
+
+
+def test_failed_flush_keeps_buffered_records(tmp_path):
+    logger = PHIAuditLogger(db_path=str(tmp_path / "failing.db"), batch_size=10)
+    logger.log_prediction_request(patient_id="KEEP", user_id="u1", model_used="m")
+    logger.log_prediction_request(patient_id="KEEP", user_id="u2", model_used="m")
+    conn = logger.conn
+    logger.conn = _FailingInsertConnection(conn)
+    with pytest.raises(sqlite3.Error):
+        logger.flush()
+    logger.conn = conn
+    assert len(logger._buffer) == 2
+    assert len(logger.get_patient_access_history("KEEP")) == 2
+    logger.close()
+
+
+def test_rejected_flush_drops_the_batch(tmp_path):
+    logger = PHIAuditLogger(db_path=str(tmp_path / "rejected.db"), batch_size=10)
+    logger.log_prediction_request(patient_id="DROP", user_id="u1", model_used="m")
+    conn = logger.conn
+    logger.conn = _FailingInsertConnection(
+        conn, sqlite3.IntegrityError("CHECK constraint failed")
+    )
+    with pytest.raises(sqlite3.IntegrityError):
+        logger.flush()
+    logger.conn = conn
+    assert logger._buffer == []
+    logger.log_prediction_request(patient_id="AFTER", user_id="u2", model_used="m")
+    assert len(logger.get_patient_access_history("AFTER")) == 1
+    logger.close()
+
+
+def test_null_field_does_not_wedge_logger(tmp_path):
+    for batch_size in (1, 10):
+        logger = PHIAuditLogger(
+            db_path=str(tmp_path / f"null_{batch_size}.db"), batch_size=batch_size
+        )
+        logger.log_prediction_request(patient_id="NULL", user_id="u1", model_used="m")
+        with pytest.raises(sqlite3.IntegrityError):
+            logger.log_access("u", "NULL", "r", "read", None)
+        logger.log_prediction_request(patient_id="NULL", user_id="u2", model_used="m")
+        history = logger.get_patient_access_history("NULL")
+        assert sorted(history["user"]) == ["u1", "u2"]
+        logger.close()
+
+
+def test_log_access_many_rejects_malformed_row(tmp_path):
+    logger = PHIAuditLogger(db_path=str(tmp_path / "malformed.db"), batch_size=10)
+    logger.log_prediction_request(patient_id="PRIOR", user_id="u1", model_used="m")
+    logger.log_prediction_request(patient_id="PRIOR", user_id="u2", model_used="m")
+    with pytest.raises(ValueError):
+        logger.log_access_many([("u3", "PRIOR", "Patient", "READ")])
+    assert len(logger._buffer) == 2
+    assert len(logger.get_patient_access_history("PRIOR")) == 2
+    logger.close()
+
+
+def test_log_access_many_rejects_null_field(tmp_path):
+    logger = PHIAuditLogger(db_path=str(tmp_path / "null_many.db"), batch_size=10)
+    logger.log_prediction_request(patient_id="PRIOR", user_id="u1", model_used="m")
+    with pytest.raises(sqlite3.IntegrityError):
+        logger.log_access_many(
+            [
+                ("u2", "PRIOR", "Patient", "READ", "Review"),
+                ("u3", None, "Patient", "READ", "Review"),
+            ]
+        )
+    assert len(logger._buffer) == 1
+    logger.log_prediction_request(patient_id="PRIOR", user_id="u4", model_used="m")
+    assert sorted(logger.get_patient_access_history("PRIOR")["user"]) == ["u1", "u4"]
+    logger.close()
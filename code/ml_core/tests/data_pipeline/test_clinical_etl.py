@@ -93,6 +93,50 @@ def test_clinical_etl_transform_single_patient(monkeypatch):
     assert df.iloc[0]["patient_id"] == "PAT001"
 
 
+def test_clinical_etl_transform_creatinine_window_features():
+    """transform() aggregates only the creatinine labs into window features."""
+    from ml_core.pipeline.clinical_etl import ClinicalETL
+
+    raw = [
+        {
+            "patient_id": "PAT001",
+            "demographics": {},
+            "clinical_events": [],
+            "lab_results": [
+                {"name": "Creatinine", "value": 1.0, "date": "2023-06-01"},
+                {"name": "HbA1c", "value": 7.5, "date": "2023-06-02"},
+                {"name": "Creatinine", "value": 2.0, "date": "2023-06-03"},
+                {"name": "Creatinine", "value": 9.0, "date": "2023-01-01"},
+            ],
+        }
+    ]
+
+    etl = ClinicalETL()
+    row = etl.transform(raw).iloc[0]
+    assert row["creatinine_value_3d_mean"] == 1.5
+    assert row["creatinine_value_3d_count"] == 2
+    assert row["creatinine_value_30d_max"] == 2.0
+    assert row["creatinine_value_3d_time_since_first"] == 2.0
+
+
+def test_clinical_etl_transform_fills_only_numeric_gaps():
+    """transform() zero-fills missing lab features but not missing demographics."""
+    from ml_core.pipeline.clinical_etl import ClinicalETL
+
+    raw = [
+        {
+            "patient_id": "PAT001",
+            "demographics": {"gender": "female"},
+            "lab_results": [{"name": "Creatinine", "value": 1.0, "date": "2023-06-01"}],
+        },
+        {"patient_id": "PAT002", "lab_results": []},
+    ]
+
+    df = ClinicalETL().transform(raw)
+    assert df.loc[1, "creatinine_value_1d_mean"] == 0
+    assert pd.isna(df.loc[1, "gender"])
+
+
 def test_clinical_etl_transform_multiple_patients(monkeypatch):
     """transform() handles multiple patients."""
     from ml_core.pipeline.clinical_etl import ClinicalETL
@@ -140,6 +184,28 @@ def test_clinical_etl_extract_handles_error(monkeypatch):
     assert len(result) == 2
 
 
+def test_clinical_etl_extract_preserves_order():
+    """extract() returns records in patient_ids order despite fetching concurrently."""
+    import time
+
+    from ml_core.pipeline import clinical_etl as etl_module
+
+    _real_connector = _MockFHIRConnector()
+
+    def slow_get(pid):
+        # Earlier patients finish last
+        time.sleep(0.01 * (5 - int(pid[-1])))
+        return _real_connector.get_patient_data(pid)
+
+    etl = etl_module.ClinicalETL({"fhir_workers": 4})
+    etl.fhir_connector = type(
+        "_Connector", (), {"get_patient_data": staticmethod(slow_get)}
+    )()
+    ids = [f"PAT00{i}" for i in range(5)]
+    result = etl.extract(ids)
+    assert [r["patient_id"] for r in result] == ids
+
+
 def test_clinical_etl_load_creates_file(tmp_path, monkeypatch):
     """load() writes the feature file (parquet or csv fallback)."""
     from ml_core.pipeline.clinical_etl import ClinicalETL
@@ -180,3 +246,68 @@ def test_clinical_etl_run_pipeline(monkeypatch):
     assert isinstance(result, pd.DataFrame)
     assert calls["extract"] == 1
     assert calls["load"] == 1
+
+
+def test_clinical_etl_read_features_projects_and_filters(tmp_path):
+    """read_features() returns only the requested columns and matching rows."""
+    import pyarrow.compute as pc
+
+    from ml_core.pipeline.clinical_etl import ClinicalETL
+
+    etl = ClinicalETL()
+    df = pd.DataFrame(
+        {"patient_id": ["P1", "P2", "P3"], "age": [40, 70, 80], "bmi": [22.0] * 3}
+    )
+    path = etl.load(df, output_path=str(tmp_path / "features.parquet"))
+    result = etl.read_features(
+        path, columns=["patient_id", "age"], row_filter=pc.field("age") >= 65
+    )
+    assert list(result.columns) == ["patient_id", "age"]
+    assert result["patient_id"].tolist() == ["P2", "P3"]
+
+
+def test_clinical_etl_extract_deidentifies_on_extract():
+    """extract() hashes IDs and shifts dates consistently when configured."""
+    from ml_core.pipeline import clinical_etl as etl_module
+
+    etl = etl_module.ClinicalETL({"deidentify_on_extract": True})
+    etl.fhir_connector = _MockFHIRConnector()
+    record = etl.extract(["PAT001"])[0]
+    assert record["patient_id"] != "PAT001"
+    shift = pd.Timestamp(record["lab_results"][0]["date"]) - pd.Timestamp("2023-06-01")
+    event_shift = pd.Timestamp(record["clinical_events"][0]["date"]) - pd.Timestamp(
+        "2023-01-01"
+    )
+    assert shift == event_shift
+
+
+def test_clinical_etl_load_appends_batches_to_dataset(tmp_path):
+    """load() appends each batch to the partitioned dataset instead of rewriting it."""
+    from ml_core.pipeline.clinical_etl import ClinicalETL
+
+    etl = ClinicalETL({"features_dataset_dir": str(tmp_path / "features")})
+    etl.load(pd.DataFrame({"patient_id": ["P1"], "age": [40]}))
+    path = etl.load(pd.DataFrame({"patient_id": ["P2"], "age": [70]}))
+    result = etl.read_features(path)
+    assert sorted(result["patient_id"]) == ["P1", "P2"]
+    assert "ingest_date" in result.columns
+
+
+def test_clinical_etl_transform_columns_do_not_depend_on_labs():
+    """transform() emits every lab window feature even when no labs are present."""
+    from ml_core.pipeline.clinical_etl import ClinicalETL
+
+    etl = ClinicalETL()
+    with_labs = etl.transform(
+        [
+            {
+                "patient_id": "PAT001",
+                "lab_results": [
+                    {"name": "Creatinine", "value": 1.0, "date": "2023-06-01"}
+                ],
+            }
+        ]
+    )
+    without_labs = etl.transform([{"patient_id": "PAT002", "lab_results": []}])
+    assert list(with_labs.columns) == list(without_labs.columns)
+    assert without_labs.loc[0, "creatinine_value_30d_slope"] == 0
@@ -1,4 +1,4 @@
-"""Tests for data_pipeline: DataValidator, ClinicalETL."""
+"""Tests for data_pipeline: DataValidator, ClinicalETL, ICD10Encoder, TemporalFeatureExtractor."""
 
 import os
 import sys
@@ -7,11 +7,14 @@ sys.path.insert(
     0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
 )
 
+import numpy as np
 import pandas as pd
 import pytest
 
+from ml_core.pipeline import temporal_features
 from ml_core.pipeline.clinical_etl import ClinicalETL
 from ml_core.pipeline.data_validation import DataValidator
+from ml_core.pipeline.icd10_encoder import ICD10Encoder
 
 # ──────────────────────────────── DataValidator ───────────────────────────────
 
@@ -284,3 +287,91 @@ def test_etl_load(tmp_path):
     out_path = str(tmp_path / "features.parquet")
     result = etl.load(df, output_path=out_path)
     assert os.path.exists(result)
+
+
+# ──────────────────────────────── ICD10Encoder ────────────────────────────────
+
+
+@pytest.mark.parametrize("level", ["chapter", "category", "group"])
+def test_icd10_binary_batch_matches_per_patient(level):
+    encoder = ICD10Encoder()
+    code_lists = [["I10", "E11.9"], [], ["J44", "I10", "bad"], ["N18.3"]]
+    matrix, columns = encoder.encode_codes_binary_batch(code_lists, level=level)
+    assert matrix.shape == (len(code_lists), len(columns))
+    dense = matrix.toarray()
+    for i, codes in enumerate(code_lists):
+        expected = encoder.encode_codes_binary(codes, level=level)
+        row = dict(zip(columns, dense[i]))
+        if not codes:
+            assert not any(row.values())
+            continue
+        assert {k for k, v in row.items() if v} == {k for k, v in expected.items() if v}
+
+
+# ─────────────────────────── TemporalFeatureExtractor ──────────────────────────
+
+
+def test_window_kernel_matches_numpy_path(monkeypatch):
+    timestamps = pd.to_datetime(
+        ["2023-05-01", "2023-05-20", "2023-05-28", "2023-05-30", "2023-06-01"]
+    ).to_numpy()
+    values = np.array([1.0, np.nan, 2.5, 1.5, 3.0])
+    extractor = temporal_features.TemporalFeatureExtractor(
+        value_column="v", aggregation_functions=["mean", "min", "std", "count", "var"]
+    )
+    monkeypatch.setattr(temporal_features, "_window_summary", None)
+    expected = extractor._extract_window_features_raw(
+        values, timestamps, timestamps.max()
+    )
+    monkeypatch.setattr(
+        temporal_features, "_window_summary", temporal_features._window_summary_py
+    )
+    result = extractor._extract_window_features_raw(
+        values, timestamps, timestamps.max()
+    )
+    assert result.keys() == expected.keys()
+    for name, value in expected.items():
+        assert np.isclose(result[name], value, equal_nan=True), name
+
+
+def test_sliding_window_features_match_window_contents():
+    df = pd.DataFrame(
+        {
+            "patient_id": ["A", "A", "A", "B"],
+            "timestamp": pd.to_datetime(
+                [
+                    "2023-01-01 00:05",
+                    "2023-01-01 00:50",
+                    "2023-01-01 01:10",
+                    "2023-01-01 00:20",
+                ]
+            ),
+            "value": [1.0, 3.0, 5.0, 2.0],
+        }
+    )
+    result = temporal_features.sliding_window_features(
+        df, aggregation_functions=["mean", "std", "count"]
+    ).set_index(["patient_id", "window_end"])
+    # Window [00:15, 01:15) drops the 00:05 reading
+    row = result.loc[("A", pd.Timestamp("2023-01-01 01:15"))]
+    assert row["value_mean"] == 4.0
+    assert row["value_count"] == 2
+    assert np.isclose(row["value_std"], np.sqrt(2.0))
+    assert result.loc[("B", pd.Timestamp("2023-01-01 00:30")), "value_count"] == 1
+
+
+def test_sliding_window_variance_keeps_precision_for_large_values():
+    df = pd.DataFrame(
+        {
+            "patient_id": ["A", "A", "A"],
+            "timestamp": pd.to_datetime(
+                ["2023-01-01 00:05", "2023-01-01 00:20", "2023-01-01 00:50"]
+            ),
+            "value": [1e9 + 1, 1e9 + 3, 1e9 + 2],
+        }
+    )
+    result = temporal_features.sliding_window_features(
+        df, aggregation_functions=["var"]
+    ).set_index("window_end")
+    assert result.loc[pd.Timestamp("2023-01-01 00:30"), "value_var"] == 2.0
+    assert result.loc[pd.Timestamp("2023-01-01 01:00"), "value_var"] == 1.0
@@ -0,0 +1,137 @@
+"""Tests for the PHIDeidentifier DataFrame paths."""
+
+import os
+import pickle
+import sys
+import threading
+
+sys.path.insert(
+    0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+)
+
+import numpy as np
+import pandas as pd
+
+from ml_core.pipeline.hipaa_compliance.deidentifier import (
+    DeidentificationConfig,
+    PHIDeidentifier,
+)
+from ml_core.pipeline.hipaa_compliance.integration import HIPAACompliantHealthcareETL
+
+
+def _deidentifier(**kwargs):
+    return PHIDeidentifier(
+        DeidentificationConfig(salt="test-salt", k_anonymity_threshold=1, **kwargs)
+    )
+
+
+def test_hash_series_matches_hash_identifier():
+    deid = _deidentifier()
+    values = np.array(["P1", "P2", "P1", "", 7, None, np.nan], dtype=object)
+    hashed = deid._hash_series(pd.Series(values))
+    assert list(hashed) == [deid._hash_identifier(str(v)) for v in values]
+    kept = deid._hash_series(pd.Series(values), keep_missing=True)
+    assert kept[5] is None and pd.isna(kept[6])
+    assert kept[0] == hashed[0]
+
+
+def test_deidentify_dataframe_hashes_id_columns():
+    deid = _deidentifier(shift_dates=False)
+    df = pd.DataFrame(
+        {"patient_id": ["P1", "P2", "P1"], "account_number": ["A1", None, "A1"]}
+    )
+    result = deid.deidentify_dataframe(
+        df, patient_id_col="patient_id", phi_cols=["account_number"]
+    )
+    assert result["patient_id"].tolist() == [
+        deid._hash_identifier("P1"),
+        deid._hash_identifier("P2"),
+        deid._hash_identifier("P1"),
+    ]
+    assert result.loc[0, "account_number"] == deid._hash_identifier("A1")
+    assert result.loc[1, "account_number"] is None
+
+
+def test_digest_cache_is_scoped_to_one_call():
+    deid = _deidentifier(shift_dates=False)
+    df = pd.DataFrame({"patient_id": ["P1", "P2", "P1"]})
+    first = deid.deidentify_dataframe(df, patient_id_col="patient_id", phi_cols=[])
+    assert deid._digests is None
+    deid.deidentify_fhir_bundle(
+        {"entry": [{"resource": {"resourceType": "Patient", "id": "P3"}}]}
+    )
+    assert deid._digests is None
+    second = deid.deidentify_dataframe(df, patient_id_col="patient_id", phi_cols=[])
+    assert first["patient_id"].tolist() == second["patient_id"].tolist()
+
+
+def test_digest_cache_is_per_thread():
+    deid = _deidentifier(shift_dates=False)
+    entered, released = threading.Event(), threading.Event()
+
+    def hold_other_call():
+        with deid._digest_cache():
+            entered.set()
+            released.wait()
+
+    other = threading.Thread(target=hold_other_call)
+    other.start()
+    entered.wait()
+    with deid._digest_cache():
+        cache = deid._digests
+        released.set()
+        other.join()
+        assert deid._digests is cache
+        deid._hash_identifier("P1")
+        assert list(cache) == ["P1"]
+    assert deid._digests is None
+    restored = pickle.loads(pickle.dumps(deid))
+    assert restored._hash_identifier("P1") == deid._hash_identifier("P1")
+
+
+def test_hash_series_keeps_categorical_columns():
+    deid = _deidentifier()
+    values = pd.Series(["P2", "P1", "P2"], dtype="category")
+    hashed = deid._hash_series(values)
+    assert isinstance(hashed.dtype, pd.CategoricalDtype)
+    assert hashed.tolist() == [deid._hash_identifier(v) for v in values]
+
+
+def test_hash_series_merges_categories_with_the_same_text():
+    deid = _deidentifier()
+    values = pd.Series(pd.Categorical([1, "1", None, "2"]))
+    hashed = deid._hash_series(values)
+    assert isinstance(hashed.dtype, pd.CategoricalDtype)
+    assert hashed[0] == hashed[1] == deid._hash_identifier("1")
+    assert pd.isna(hashed[2])
+    assert hashed[3] == deid._hash_identifier("2")
+    assert len(hashed.cat.categories) == 2
+
+
+def test_shift_dates_uses_one_offset_per_patient():
+    deid = _deidentifier()
+    deid.patient_date_shifts["P1"] = 10
+    dates = pd.Series(["2023-01-01", "2023-01-05", None, "2023-02-01"])
+    patients = pd.Series(["P1", "P2", "P2", "P2"])
+    shifted = deid._shift_dates(dates, patients)
+    assert shifted[0] == pd.Timestamp("2023-01-11")
+    assert pd.isna(shifted[2])
+    p2_shift = pd.Timedelta(days=deid.patient_date_shifts["P2"])
+    assert shifted[1] - pd.Timestamp("2023-01-05") == p2_shift
+    assert shifted[3] - pd.Timestamp("2023-02-01") == p2_shift
+
+
+def test_transform_batch_keeps_date_shifts_across_batches():
+    etl = HIPAACompliantHealthcareETL(
+        {}, _deidentifier().config, patient_id_col="patient_id", phi_cols=["timestamp"]
+    )
+    batch = pd.DataFrame(
+        {
+            "patient_id": ["P1", "P1"],
+            "timestamp": pd.to_datetime(["2023-01-01 00:05", "2023-01-01 00:50"]),
+            "value": [1.0, 3.0],
+        }
+    )
+    first = etl.transform_batch(batch)
+    second = etl.transform_batch(batch)
+    assert first["window_end"].tolist() == second["window_end"].tolist()
@@ -20,6 +20,25 @@ import requests
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson
+
+    _ORJSON_AVAILABLE = True
+except ImportError:
+    _ORJSON_AVAILABLE = False
+
+
+def _loads(data: Any) -> Any:
+    """Decode JSON text or bytes, with orjson when it is installed."""
+    if _ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _response_json(response: requests.Response) -> Any:
+    """Decode a response body straight from its bytes, skipping text decoding."""
+    return _loads(response.content)
+
 
 class FHIRConnector:
     """
@@ -322,7 +341,7 @@ class FHIRConnector:
         )
         all_resources = []
         response = self._make_request("GET", resource_type, params=search_params)
-        bundle = response.json()
+        bundle = _response_json(response)
         if "entry" in bundle:
             resources = [entry["resource"] for entry in bundle["entry"]]
             all_resources.extend(resources)
@@ -338,7 +357,7 @@ class FHIRConnector:
             next_params = parse_qs(parsed_url.query)
             next_params = {k: v[0] for k, v in next_params.items()}
             response = self._make_request("GET", resource_type, params=next_params)
-            bundle = response.json()
+            bundle = _response_json(response)
             if "entry" in bundle:
                 resources = [entry["resource"] for entry in bundle["entry"]]
                 all_resources.extend(resources)
@@ -362,7 +381,7 @@ class FHIRConnector:
             logger.warning(f"Unknown resource type: {resource_type}")
         endpoint = f"{resource_type}/{resource_id}"
         response = self._make_request("GET", endpoint)
-        return response.json()
+        return _response_json(response)
 
     def create(self, resource: Dict) -> Dict:
         """
@@ -1071,7 +1090,7 @@ class FHIRConnector:
                 for line in f:
                     line = line.strip()
                     if line:
-                        resources.append(json.loads(line))
+                        resources.append(_loads(line))
         else:
             raise ValueError(f"Unsupported file format: {file_path}")
         stats["total"] = len(resources)
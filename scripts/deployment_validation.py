@@ -16,6 +16,7 @@ Options:
     --notify                Send notifications on validation failures
     --rollback              Automatically rollback failed deployments
     --timeout SECONDS       Timeout for validation checks (default: 300)
+    --results-stream PATH   Write each validation result as NDJSON while running
     --verbose               Enable verbose output
     --help                  Show this help message
 
@@ -26,18 +27,39 @@ Examples:
 """
 
 import argparse
+import asyncio
+import collections
+import concurrent.futures
+import configparser
 import datetime
+import functools
+import html
+import io
+import itertools
 import json
 import logging
+import operator
 import os
 import socket
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, TextIO, Tuple
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 try:
     import requests
 
@@ -57,7 +79,7 @@ try:
 except ImportError:
     POSTGRES_AVAILABLE = False
 try:
-    from kubernetes import client, config
+    from kubernetes import client, config, watch
 
     K8S_CLIENT_AVAILABLE = True
 except ImportError:
@@ -70,6 +92,297 @@ logging.basicConfig(
 )
 logger = logging.getLogger("deployment_validation")
 
+DNS_CACHE_TTL = 60.0
+MAX_VALIDATION_WORKERS = 32
+SECRET_WATCH_RETRY_DELAY = 5.0
+# Watch requests end server-side after this long so a stopped watch notices
+SECRET_WATCH_TIMEOUT = 60
+# Keys before the first section header land in INI_ROOT_SECTION and are
+# flattened to the top level; a literal [DEFAULT] stays an ordinary section.
+INI_ROOT_SECTION = "__root__"
+INI_NO_DEFAULT_SECTION = "__no_default__"
+_MISSING = object()
+# Presence-only checks on YAML files at least this large walk parse events
+# instead of building the whole document.
+STREAM_SCAN_MIN_BYTES = 1024 * 1024
+YAML_TAG_PREFIX = "tag:yaml.org,2002:"
+YAML_STR_TAG = "tag:yaml.org,2002:str"
+YAML_NULL_TAG = "tag:yaml.org,2002:null"
+YAML_MAP_TAG = "tag:yaml.org,2002:map"
+YAML_SEQ_TAG = "tag:yaml.org,2002:seq"
+YAML_MERGE_TAG = "tag:yaml.org,2002:merge"
+
+TEXT_REPORT_HEADER = """\
+================================================================================
+NEXORA DEPLOYMENT VALIDATION REPORT - {env}
+Date: {timestamp}
+Status: {status}
+================================================================================"""
+TEXT_REPORT_DEPLOYMENT_INFO = """
+
+DEPLOYMENT INFORMATION:
+Name: {name}
+Environment: {environment}
+Expected Version: {expected_version}
+Actual Version: {actual_version}
+Timestamp: {timestamp}"""
+TEXT_REPORT_CATEGORY = """
+
+================================================================================
+{category} VALIDATIONS:
+--------------------------------------------------------------------------------"""
+TEXT_REPORT_ROLLBACK = """
+
+================================================================================
+ROLLBACK INFORMATION:
+--------------------------------------------------------------------------------
+Status: {status}
+Message: {message}"""
+
+HTML_REPORT_HEAD = """\
+<!DOCTYPE html>
+<html lang='en'>
+<head>
+  <meta charset='UTF-8'>
+  <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+  <title>Nexora Deployment Validation Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 20px; }
+    h1, h2, h3 { color: #333; }
+    .report-header { margin-bottom: 20px; }
+    .status { font-weight: bold; }
+    .status-PASS { color: green; }
+    .status-FAIL { color: red; }
+    .status-ERROR { color: darkred; }
+    .status-WARN, .status-UNKNOWN { color: orange; }
+    .status-INFO { color: blue; }
+    .validation { margin-bottom: 10px; border: 1px solid #ddd; padding: 10px; border-radius: 5px; }
+    .validation-header { display: flex; justify-content: space-between; }
+    .validation-details { margin-top: 10px; }
+    .validation-message { margin: 5px 0; }
+    .summary { margin: 20px 0; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background-color: #f2f2f2; }
+    .category { margin-top: 30px; }
+    .toggle-btn { cursor: pointer; background: none; border: none; font-size: 16px; }
+    .deployment-info { margin: 20px 0; }
+    .rollback-info { margin: 20px 0; }
+    pre { background-color: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }
+  </style>
+  <script>
+    function toggleDetails(id) {
+      const details = document.getElementById(id);
+      const btn = document.getElementById(id + '-btn');
+      if (details.style.display === 'none') {
+        details.style.display = 'block';
+        btn.textContent = '▼';
+      } else {
+        details.style.display = 'none';
+        btn.textContent = '►';
+      }
+    }
+  </script>
+</head>
+<body>
+"""
+HTML_REPORT_HEADER = """\
+  <div class='report-header'>
+    <h1>Nexora Deployment Validation Report - {env}</h1>
+    <p><strong>Date:</strong> {timestamp}</p>
+    <p><strong>Status:</strong> <span class='status status-{status}'>{status}</span></p>
+  </div>
+"""
+HTML_REPORT_DEPLOYMENT_INFO = """\
+  <div class='deployment-info'>
+    <h2>Deployment Information</h2>
+    <table>
+      <tr><th>Name</th><td>{name}</td></tr>
+      <tr><th>Environment</th><td>{environment}</td></tr>
+      <tr><th>Expected Version</th><td>{expected_version}</td></tr>
+      <tr><th>Actual Version</th><td>{actual_version}</td></tr>
+      <tr><th>Timestamp</th><td>{timestamp}</td></tr>
+    </table>
+  </div>
+"""
+HTML_REPORT_SUMMARY = """\
+  <div class='summary'>
+    <h2>Summary</h2>
+    <table>
+      <tr><th>Total Validations</th><td>{total}</td></tr>
+"""
+HTML_REPORT_SUMMARY_ROW = "      <tr><th>{status}</th><td>{count}</td></tr>\n"
+HTML_REPORT_SUMMARY_END = "    </table>\n  </div>\n"
+HTML_REPORT_CATEGORY = "  <div class='category'>\n    <h2>{category} Validations</h2>\n"
+HTML_REPORT_DETAIL = "        <div><strong>{key}:</strong> {value}</div>\n"
+HTML_REPORT_VALIDATION = """\
+    <div class='validation'>
+      <div class='validation-header'>
+        <h3>{name}</h3>
+        <span class='status status-{status}'>{status}</span>
+      </div>
+      <div class='validation-message'>{message}</div>
+      <button id='validation-{id}-btn' class='toggle-btn' onclick="toggleDetails('validation-{id}-details')">▼</button>
+      <div id='validation-{id}-details' class='validation-details'>
+{details}\
+      </div>
+    </div>
+"""
+HTML_REPORT_ROLLBACK = """\
+  <div class='rollback-info'>
+    <h2>Rollback Information</h2>
+    <table>
+      <tr><th>Status</th><td><span class='status status-{status}'>{status}</span></td></tr>
+      <tr><th>Message</th><td>{message}</td></tr>
+    </table>
+"""
+HTML_REPORT_OUTPUT = "    <h3>{title}</h3>\n    <pre>{output}</pre>\n"
+HTML_REPORT_FOOTER = """\
+  <div class='footer'>
+    <p>Generated by Nexora Deployment Validation Script</p>
+  </div>
+</body>
+</html>"""
+
+SERVICE_DEFAULT_TIMEOUTS = {"http": 10, "tcp": 5, "command": 30}
+# required_settings "type" names and the Python types they accept
+SETTING_TYPES: Dict[str, Any] = {
+    "string": str,
+    "number": (int, float),
+    "boolean": bool,
+    "array": list,
+    "object": dict,
+}
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON with orjson when available, falling back to json"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option, default=str).decode("utf-8")
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=str
+    )
+
+
+def json_loads(raw: bytes) -> Any:
+    """Parse JSON with orjson when available, falling back to json"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+class StreamingResults(dict):
+    """Validation results for one category, echoed as NDJSON as they are set"""
+
+    def __init__(self, kind: str, stream: Optional[Any] = None) -> None:
+        super().__init__()
+        self.kind = kind
+        self.stream = stream
+
+    def __setitem__(self, name: str, record: Dict) -> None:
+        super().__setitem__(name, record)
+        if self.stream is not None:
+            line = json_dumps({"kind": self.kind, "name": name, **record})
+            self.stream.write(line + "\n")
+            self.stream.flush()
+
+
+SettingsCheck = Callable[[Any], Tuple[List[str], List[str]]]
+
+
+@dataclass(frozen=True)
+class ServiceSpec:
+    """Service entry from the environment config with defaults filled in"""
+
+    name: str
+    type: str
+    timeout: int
+    url: Optional[str] = None
+    method: str = "GET"
+    expected_status: int = 200
+    headers: Dict = field(default_factory=dict)
+    content_check: Optional[str] = None
+    content_check_bytes: Optional[bytes] = None
+    host: str = "localhost"
+    port: Optional[int] = None
+    command: Optional[str] = None
+    expected_exit_code: int = 0
+
+
+@dataclass(frozen=True)
+class ApiEndpointSpec:
+    """API endpoint entry from the environment config with defaults filled in"""
+
+    name: str
+    url: Optional[str]
+    method: str = "GET"
+    headers: Dict = field(default_factory=dict)
+    data: Any = None
+    expected_status: int = 200
+    timeout: int = 10
+    content_check: Optional[str] = None
+    content_check_bytes: Optional[bytes] = None
+    schema_validation: Optional[Dict] = None
+
+
+@dataclass(frozen=True)
+class DatabaseSpec:
+    """Database entry from the environment config with defaults filled in"""
+
+    name: str
+    type: str
+    host: str = "localhost"
+    port: Optional[int] = None
+    database: Optional[str] = None
+    user: Optional[str] = None
+    password: Optional[str] = None
+    timeout: int = 5
+    ssl_mode: str = "prefer"
+    validation_query: str = "SELECT 1"
+    uri: Optional[str] = None
+    validation_collection: Optional[str] = None
+    exact_count: bool = False
+
+
+@dataclass(frozen=True)
+class SecretSummary:
+    """What Secret validation reports about a Secret; its values are not kept"""
+
+    name: str
+    type: Optional[str]
+    data_keys: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_secret(cls, secret: Any) -> "SecretSummary":
+        return cls(secret.metadata.name, secret.type, tuple(secret.data or ()))
+
+
+@dataclass
+class ValidationResult:
+    """Outcome of a single configuration validation"""
+
+    status: str
+    type: str
+    message: Optional[str] = None
+    file_path: Optional[str] = None
+    command: Optional[str] = None
+    details: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Flatten into the report record, omitting unset fields"""
+        record = {"status": self.status, "type": self.type}
+        if self.message is not None:
+            record["message"] = self.message
+        if self.file_path is not None:
+            record["file_path"] = self.file_path
+        if self.command is not None:
+            record["command"] = self.command
+        record.update(self.details)
+        return record
+
 
 class DeploymentValidator:
     """Main class for validating deployments"""
@@ -81,6 +394,8 @@ class DeploymentValidator:
         timeout: int = 300,
         rollback: bool = False,
         verbose: bool = False,
+        results_stream: Optional[str] = None,
+        watch_secrets: bool = False,
     ) -> None:
         """
         Initialize the deployment validator with configuration
@@ -91,13 +406,27 @@ class DeploymentValidator:
             timeout: Timeout for validation checks in seconds
             rollback: Whether to automatically rollback failed deployments
             verbose: Enable verbose output
+            results_stream: Optional path to write each validation result to as
+                NDJSON while the run progresses
+            watch_secrets: Keep each namespace's Secret cache current from a
+                background watch, for validators reused across runs; close()
+                stops the watches
         """
         self.config_path = config_path
         self.env = env
         self.timeout = timeout
         self.rollback = rollback
         self.verbose = verbose
-        self.config = self._load_config()
+        self.results_stream = results_stream
+        self._results_fp = None
+        self._dns_cache: Dict[Tuple[str, int], Tuple[str, float]] = {}
+        self.watch_secrets = watch_secrets
+        self._secret_cache: Dict[str, Dict[str, SecretSummary]] = {}
+        self._secret_cache_lock = threading.Lock()
+        self._secret_watch_stop = threading.Event()
+        self._secret_watches: List[Tuple[threading.Thread, Any]] = []
+        self._settings_checks: Dict[str, SettingsCheck] = {}
+        self._flat_results: List[Tuple[str, str, Dict]] = []
         self.results = {
             "timestamp": datetime.datetime.now().isoformat(),
             "environment": env,
@@ -109,6 +438,16 @@ class DeploymentValidator:
             logger.setLevel(logging.DEBUG)
         logger.info(f"Initializing deployment validation for {env} environment")
 
+    @functools.cached_property
+    def config(self) -> Dict:
+        """Deployment configuration, loaded from disk on first access"""
+        return self._load_config()
+
+    @property
+    def _env_config(self) -> Dict:
+        """Configuration of the selected environment"""
+        return self.config["environments"][self.env]
+
     def _load_config(self) -> Dict:
         """Load configuration from YAML file"""
         try:
@@ -137,28 +476,125 @@ class DeploymentValidator:
                         }
                     }
                 }
-            with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f)
+            with open(self.config_path, "rb") as f:
+                config = yaml.load(f, Loader=YamlSafeLoader)
             if not config or "environments" not in config:
                 logger.error("Invalid configuration format")
                 raise ValueError("Invalid configuration format")
             if self.env not in config["environments"]:
                 logger.error(f"Environment '{self.env}' not found in configuration")
                 raise ValueError(f"Environment '{self.env}' not found in configuration")
+            # Only the selected environment is ever read; drop the others
+            config["environments"] = {self.env: config["environments"][self.env]}
             return config
         except Exception as e:
             logger.error(f"Error loading configuration: {str(e)}")
             raise
 
+    @functools.cached_property
+    def _services(self) -> List[ServiceSpec]:
+        """Service entries of the selected environment resolved into specs"""
+        return [
+            self._service_spec(service)
+            for service in self._env_config.get("services", [])
+        ]
+
+    @functools.cached_property
+    def _api_endpoints(self) -> List[ApiEndpointSpec]:
+        """API endpoint entries of the selected environment resolved into specs"""
+        return [
+            self._api_endpoint_spec(endpoint)
+            for endpoint in self._env_config.get("api_endpoints", [])
+        ]
+
+    @functools.cached_property
+    def _databases(self) -> List[DatabaseSpec]:
+        """Database entries of the selected environment resolved into specs"""
+        return [self._database_spec(db) for db in self._env_config.get("databases", [])]
+
+    @staticmethod
+    def _encode_content_check(content_check: Optional[str]) -> Optional[bytes]:
+        """Encode a content check so responses can be scanned as raw bytes"""
+        return content_check.encode("utf-8") if content_check else None
+
+    def _service_spec(self, service: Dict) -> ServiceSpec:
+        """Build a ServiceSpec from a raw service entry"""
+        service_type = service.get("type", "http")
+        content_check = service.get("content_check")
+        return ServiceSpec(
+            name=service.get("name", "unknown"),
+            type=service_type,
+            timeout=service.get(
+                "timeout", SERVICE_DEFAULT_TIMEOUTS.get(service_type, 10)
+            ),
+            url=service.get("url"),
+            method=service.get("method", "GET"),
+            expected_status=service.get("expected_status", 200),
+            headers=service.get("headers", {}),
+            content_check=content_check,
+            content_check_bytes=self._encode_content_check(content_check),
+            host=service.get("host", "localhost"),
+            port=service.get("port"),
+            command=service.get("command"),
+            expected_exit_code=service.get("expected_exit_code", 0),
+        )
+
+    def _api_endpoint_spec(self, endpoint: Dict) -> ApiEndpointSpec:
+        """Build an ApiEndpointSpec from a raw endpoint entry"""
+        content_check = endpoint.get("content_check")
+        return ApiEndpointSpec(
+            name=endpoint.get("name", "unknown"),
+            url=endpoint.get("url"),
+            method=endpoint.get("method", "GET"),
+            headers=endpoint.get("headers", {}),
+            data=endpoint.get("data"),
+            expected_status=endpoint.get("expected_status", 200),
+            timeout=endpoint.get("timeout", 10),
+            content_check=content_check,
+            content_check_bytes=self._encode_content_check(content_check),
+            schema_validation=endpoint.get("schema_validation"),
+        )
+
+    def _database_spec(self, db: Dict) -> DatabaseSpec:
+        """Build a DatabaseSpec from a raw database entry"""
+        db_type = db.get("type", "unknown")
+        if db_type == "mongodb":
+            port, database, user, password = 27017, "admin", None, None
+        else:
+            port, database, user, password = 5432, "postgres", "postgres", ""
+        return DatabaseSpec(
+            name=db.get("name", "unknown"),
+            type=db_type,
+            host=db.get("host", "localhost"),
+            port=db.get("port", port),
+            database=db.get("database", database),
+            user=db.get("user", user),
+            password=db.get("password", password),
+            timeout=db.get("timeout", 5),
+            ssl_mode=db.get("ssl_mode", "prefer"),
+            validation_query=db.get("validation_query", "SELECT 1"),
+            uri=db.get("uri"),
+            validation_collection=db.get("validation_collection"),
+            exact_count=db.get("exact_count", False),
+        )
+
     def run_all_validations(self) -> Dict:
         """Run all deployment validations and return results"""
         logger.info("Starting deployment validations")
-        self._get_deployment_info()
-        self.validate_kubernetes()
-        self.validate_services()
-        self.validate_api_endpoints()
-        self.validate_databases()
-        self.validate_configurations()
+        if self.results_stream:
+            self._results_fp = open(self.results_stream, "w")
+        try:
+            self._get_deployment_info()
+            self.validate_kubernetes()
+            self.validate_services()
+            self.validate_api_endpoints()
+            self.validate_databases()
+            self.validate_configurations()
+        finally:
+            if self._results_fp is not None:
+                self._results_fp.close()
+                self._results_fp = None
+        self._flatten_results()
         self._calculate_overall_status()
         if self.rollback and self.results["status"] in ["FAIL", "ERROR"]:
             self._perform_rollback()
@@ -167,9 +603,13 @@ class DeploymentValidator:
         )
         return self.results
 
+    def _results_sink(self, kind: str) -> StreamingResults:
+        """Create the result dict for a validation category"""
+        return StreamingResults(kind, self._results_fp)
+
     def _get_deployment_info(self) -> None:
         """Get information about the current deployment"""
-        deployment_config = self.config["environments"][self.env].get("deployment", {})
+        deployment_config = self._env_config.get("deployment", {})
         deployment_name = deployment_config.get("name", f"nexora-{self.env}")
         deployment_version = deployment_config.get("version", "latest")
         actual_version = self._get_actual_version()
@@ -183,7 +623,7 @@ class DeploymentValidator:
 
     def _get_actual_version(self) -> str:
         """Try to determine the actual deployed version"""
-        k8s_config = self.config["environments"][self.env].get("kubernetes", {})
+        k8s_config = self._env_config.get("kubernetes", {})
         if k8s_config.get("enabled", False) and K8S_CLIENT_AVAILABLE:
             try:
                 if k8s_config.get("in_cluster", False):
@@ -196,9 +636,7 @@ class DeploymentValidator:
                 namespace = k8s_config.get("namespace", "nexora")
                 apps_v1 = client.AppsV1Api()
                 deployments = apps_v1.list_namespaced_deployment(namespace).items
-                deployment_config = self.config["environments"][self.env].get(
-                    "deployment", {}
-                )
+                deployment_config = self._env_config.get("deployment", {})
                 deployment_name = deployment_config.get("name", f"nexora-{self.env}")
                 for deployment in deployments:
                     if deployment.metadata.name == deployment_name:
@@ -221,7 +659,7 @@ class DeploymentValidator:
                                 return image.split(":")[-1]
             except Exception as e:
                 logger.debug(f"Error getting version from Kubernetes: {str(e)}")
-        version_endpoint = self.config["environments"][self.env].get("version_endpoint")
+        version_endpoint = self._env_config.get("version_endpoint")
         if version_endpoint and REQUESTS_AVAILABLE:
             try:
                 response = requests.get(version_endpoint, timeout=10)
@@ -236,7 +674,7 @@ class DeploymentValidator:
     def validate_kubernetes(self) -> None:
         """Validate Kubernetes resources"""
         logger.info("Validating Kubernetes resources")
-        k8s_config = self.config["environments"][self.env].get("kubernetes", {})
+        k8s_config = self._env_config.get("kubernetes", {})
         if not k8s_config.get("enabled", False):
             logger.debug("Kubernetes validation not enabled")
             return
@@ -257,7 +695,7 @@ class DeploymentValidator:
             core_v1 = client.CoreV1Api()
             apps_v1 = client.AppsV1Api()
             namespace = k8s_config.get("namespace", "nexora")
-            k8s_validations = {}
+            k8s_validations = self._results_sink("kubernetes")
             if k8s_config.get("validate_deployments", True):
                 deployments_status, deployments_details = (
                     self._validate_k8s_deployments(
@@ -690,25 +1128,20 @@ class DeploymentValidator:
     ) -> Tuple[str, Dict]:
         """Validate Kubernetes Secrets"""
         try:
-            secrets = core_v1.list_namespaced_secret(namespace).items
+            secrets = self._get_cached_secrets(core_v1, namespace)
             secret_statuses = []
             missing_secrets = []
-            found_secrets = set((s.metadata.name for s in secrets))
+            found_secrets = set((s.name for s in secrets))
             for expected in expected_secrets:
                 if expected not in found_secrets:
                     missing_secrets.append(expected)
             for secret in secrets:
-                secret_name = secret.metadata.name
-                secret_type = secret.type
-                data_keys = []
-                if secret.data:
-                    data_keys = list(secret.data.keys())
                 secret_statuses.append(
                     {
-                        "name": secret_name,
-                        "type": secret_type,
-                        "data_keys": data_keys,
-                        "expected": secret_name in expected_secrets,
+                        "name": secret.name,
+                        "type": secret.type,
+                        "data_keys": list(secret.data_keys),
+                        "expected": secret.name in expected_secrets,
                     }
                 )
             if missing_secrets:
@@ -736,23 +1169,104 @@ class DeploymentValidator:
                 {"message": f"Error validating Kubernetes Secrets: {str(e)}"},
             )
 
+    def _get_cached_secrets(self, core_v1: Any, namespace: str) -> List[SecretSummary]:
+        """Return a namespace's Secret summaries, from the watch cache if enabled"""
+        if not self.watch_secrets:
+            return [
+                SecretSummary.from_secret(secret)
+                for secret in core_v1.list_namespaced_secret(namespace).items
+            ]
+        with self._secret_cache_lock:
+            cache = self._secret_cache.get(namespace)
+        if cache is None:
+            resource_version = self._list_secrets_into_cache(core_v1, namespace)
+            if not self._secret_watch_stop.is_set():
+                secret_watch = watch.Watch()
+                thread = threading.Thread(
+                    target=self._watch_secrets,
+                    args=(core_v1, namespace, resource_version, secret_watch),
+                    name=f"secret-watch-{namespace}",
+                    daemon=True,
+                )
+                self._secret_watches.append((thread, secret_watch))
+                thread.start()
+        with self._secret_cache_lock:
+            return list(self._secret_cache[namespace].values())
+
+    def _list_secrets_into_cache(self, core_v1: Any, namespace: str) -> str:
+        """List Secrets into the cache and return the list's resource version"""
+        secret_list = core_v1.list_namespaced_secret(namespace)
+        with self._secret_cache_lock:
+            self._secret_cache[namespace] = {
+                secret.metadata.name: SecretSummary.from_secret(secret)
+                for secret in secret_list.items
+            }
+        return secret_list.metadata.resource_version
+
+    def _watch_secrets(
+        self,
+        core_v1: Any,
+        namespace: str,
+        resource_version: str,
+        secret_watch: Any,
+    ) -> None:
+        """Keep the Secret cache for a namespace current until close()"""
+        while not self._secret_watch_stop.is_set():
+            try:
+                for event in secret_watch.stream(
+                    core_v1.list_namespaced_secret,
+                    namespace,
+                    resource_version=resource_version,
+                    allow_watch_bookmarks=True,
+                    timeout_seconds=SECRET_WATCH_TIMEOUT,
+                ):
+                    secret = event["object"]
+                    resource_version = secret.metadata.resource_version
+                    with self._secret_cache_lock:
+                        cache = self._secret_cache[namespace]
+                        if event["type"] == "DELETED":
+                            cache.pop(secret.metadata.name, None)
+                        elif event["type"] in ("ADDED", "MODIFIED"):
+                            cache[secret.metadata.name] = SecretSummary.from_secret(
+                                secret
+                            )
+            except Exception as e:
+                logger.debug(f"Secret watch for {namespace} interrupted: {str(e)}")
+                if self._secret_watch_stop.wait(SECRET_WATCH_RETRY_DELAY):
+                    break
+                try:
+                    resource_version = self._list_secrets_into_cache(core_v1, namespace)
+                except Exception as e:
+                    logger.debug(f"Error relisting Secrets in {namespace}: {str(e)}")
+
+    def close(self) -> None:
+        """Stop any Secret watches started with watch_secrets"""
+        self._secret_watch_stop.set()
+        watches, self._secret_watches = self._secret_watches, []
+        for _, secret_watch in watches:
+            secret_watch.stop()
+        for thread, _ in watches:
+            thread.join(timeout=SECRET_WATCH_RETRY_DELAY)
+
     def validate_services(self) -> None:
         """Validate services"""
         logger.info("Validating services")
-        services_config = self.config["environments"][self.env].get("services", [])
-        service_validations = {}
-        for service in services_config:
-            service_name = service.get("name", "unknown")
-            service_type = service.get("type", "http")
+        service_validations = self._results_sink("services")
+        command_results = iter(
+            self._run_commands(
+                [
+                    (service.command, service.expected_exit_code, service.timeout)
+                    for service in self._services
+                    if service.type == "command" and service.command
+                ]
+            )
+        )
+        for service in self._services:
+            service_name = service.name
+            service_type = service.type
             logger.debug(f"Validating service: {service_name} (type: {service_type})")
             if service_type == "http":
-                url = service.get("url")
-                method = service.get("method", "GET")
-                expected_status = service.get("expected_status", 200)
-                timeout = service.get("timeout", 10)
-                headers = service.get("headers", {})
-                content_check = service.get("content_check")
-                if not url:
+                if not service.url:
                     service_validations[service_name] = {
                         "status": "ERROR",
                         "type": "http",
@@ -760,51 +1274,51 @@ class DeploymentValidator:
                     }
                     continue
                 status, details = self._validate_http_service(
-                    url, method, expected_status, timeout, headers, content_check
+                    service.url,
+                    service.method,
+                    service.expected_status,
+                    service.timeout,
+                    service.headers,
+                    service.content_check,
+                    service.content_check_bytes,
                 )
                 service_validations[service_name] = {
                     "status": status,
                     "type": "http",
-                    "url": url,
+                    "url": service.url,
                     **details,
                 }
             elif service_type == "tcp":
-                host = service.get("host", "localhost")
-                port = service.get("port")
-                timeout = service.get("timeout", 5)
-                if not port:
+                if not service.port:
                     service_validations[service_name] = {
                         "status": "ERROR",
                         "type": "tcp",
                         "message": "No port specified",
                     }
                     continue
-                status, details = self._validate_tcp_service(host, port, timeout)
+                status, details = self._validate_tcp_service(
+                    service.host, service.port, service.timeout
+                )
                 service_validations[service_name] = {
                     "status": status,
                     "type": "tcp",
-                    "host": host,
-                    "port": port,
+                    "host": service.host,
+                    "port": service.port,
                     **details,
                 }
             elif service_type == "command":
-                command = service.get("command")
-                expected_exit_code = service.get("expected_exit_code", 0)
-                timeout = service.get("timeout", 30)
-                if not command:
+                if not service.command:
                     service_validations[service_name] = {
                         "status": "ERROR",
                         "type": "command",
                         "message": "No command specified",
                     }
                     continue
-                status, details = self._validate_command(
-                    command, expected_exit_code, timeout
-                )
+                status, details = next(command_results)
                 service_validations[service_name] = {
                     "status": status,
                     "type": "command",
-                    "command": command,
+                    "command": service.command,
                     **details,
                 }
             else:
@@ -823,6 +1337,7 @@ class DeploymentValidator:
         timeout: int,
         headers: Dict,
         content_check: Optional[str],
+        content_check_bytes: Optional[bytes] = None,
     ) -> Tuple[str, Dict]:
         """Validate HTTP service"""
         if not REQUESTS_AVAILABLE:
@@ -832,14 +1347,35 @@ class DeploymentValidator:
             )
         try:
             start_time = time.time()
+            needs_body = bool(content_check)
+            request_method = method
+            if method.upper() == "GET" and not needs_body:
+                request_method = "HEAD"
             response = requests.request(
-                method=method, url=url, headers=headers, timeout=timeout
+                method=request_method,
+                url=url,
+                headers=headers,
+                timeout=timeout,
+                stream=not needs_body,
             )
+            if request_method != method and response.status_code in (405, 501):
+                response.close()
+                response = requests.request(
+                    method=method,
+                    url=url,
+                    headers=headers,
+                    timeout=timeout,
+                    stream=True,
+                )
             response_time = time.time() - start_time
+            if not needs_body:
+                response.close()
             status_check = response.status_code == expected_status
             content_check_result = True
             if content_check and status_check:
-                if content_check in response.text:
+                if content_check_bytes is None:
+                    content_check_bytes = content_check.encode("utf-8")
+                if content_check_bytes in response.content:
                     content_check_message = f"Response contains '{content_check}'"
                 else:
                     content_check_result = False
@@ -882,15 +1418,27 @@ class DeploymentValidator:
                 {"message": f"Error validating HTTP service {url}: {str(e)}"},
             )
 
+    def _resolve(self, host: str, port: int) -> str:
+        """Resolve a host to an IPv4 address, caching the result for DNS_CACHE_TTL"""
+        now = time.monotonic()
+        cached = self._dns_cache.get((host, port))
+        if cached and cached[1] > now:
+            return cached[0]
+        addrinfo = socket.getaddrinfo(host, port, socket.AF_INET, socket.SOCK_STREAM)
+        address = addrinfo[0][4][0]
+        self._dns_cache[host, port] = (address, now + DNS_CACHE_TTL)
+        return address
+
     def _validate_tcp_service(
         self, host: str, port: int, timeout: int
     ) -> Tuple[str, Dict]:
         """Validate TCP service"""
         try:
             start_time = time.time()
+            address = self._resolve(host, port)
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             sock.settimeout(timeout)
-            result = sock.connect_ex((host, port))
+            result = sock.connect_ex((address, port))
             sock.close()
             connection_time = time.time() - start_time
             if result == 0:
@@ -930,33 +1478,92 @@ class DeploymentValidator:
                 command, shell=True, capture_output=True, text=True, timeout=timeout
             )
             execution_time = time.time() - start_time
-            if process.returncode == expected_exit_code:
-                return (
-                    "PASS",
-                    {
-                        "message": f"Command executed successfully with exit code {process.returncode}",
-                        "exit_code": process.returncode,
-                        "execution_time": f"{execution_time:.3f}s",
-                        "stdout": process.stdout.strip(),
-                        "stderr": process.stderr.strip(),
-                    },
-                )
-            else:
-                return (
-                    "FAIL",
-                    {
-                        "message": f"Command failed with exit code {process.returncode}, expected {expected_exit_code}",
-                        "exit_code": process.returncode,
-                        "execution_time": f"{execution_time:.3f}s",
-                        "stdout": process.stdout.strip(),
-                        "stderr": process.stderr.strip(),
-                    },
-                )
+            return self._command_result(
+                process.returncode,
+                expected_exit_code,
+                execution_time,
+                process.stdout,
+                process.stderr,
+            )
         except subprocess.TimeoutExpired:
             return ("FAIL", {"message": f"Command timed out after {timeout}s"})
         except Exception as e:
             return ("ERROR", {"message": f"Error running command: {str(e)}"})
 
+    async def _validate_command_async(
+        self, command: str, expected_exit_code: int, timeout: int
+    ) -> Tuple[str, Dict]:
+        """Validate using command without blocking other command validations"""
+        try:
+            start_time = time.time()
+            process = await asyncio.create_subprocess_shell(
+                command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+            )
+            try:
+                stdout, stderr = await asyncio.wait_for(process.communicate(), timeout)
+            except asyncio.TimeoutError:
+                process.kill()
+                await process.wait()
+                return ("FAIL", {"message": f"Command timed out after {timeout}s"})
+            execution_time = time.time() - start_time
+            return self._command_result(
+                process.returncode,
+                expected_exit_code,
+                execution_time,
+                stdout.decode(errors="replace"),
+                stderr.decode(errors="replace"),
+            )
+        except Exception as e:
+            return ("ERROR", {"message": f"Error running command: {str(e)}"})
+
+    def _run_commands(
+        self, commands: List[Tuple[str, int, int]]
+    ) -> List[Tuple[str, Dict]]:
+        """Run (command, expected_exit_code, timeout) validations concurrently"""
+        if not commands:
+            return []
+
+        async def gather() -> List[Tuple[str, Dict]]:
+            return await asyncio.gather(
+                *(self._validate_command_async(*command) for command in commands)
+            )
+
+        return asyncio.run(gather())
+
+    def _command_result(
+        self,
+        returncode: int,
+        expected_exit_code: int,
+        execution_time: float,
+        stdout: str,
+        stderr: str,
+    ) -> Tuple[str, Dict]:
+        """Build the validation result for a finished command"""
+        if returncode == expected_exit_code:
+            return (
+                "PASS",
+                {
+                    "message": f"Command executed successfully with exit code {returncode}",
+                    "exit_code": returncode,
+                    "execution_time": f"{execution_time:.3f}s",
+                    "stdout": stdout.strip(),
+                    "stderr": stderr.strip(),
+                },
+            )
+        else:
+            return (
+                "FAIL",
+                {
+                    "message": f"Command failed with exit code {returncode}, expected {expected_exit_code}",
+                    "exit_code": returncode,
+                    "execution_time": f"{execution_time:.3f}s",
+                    "stdout": stdout.strip(),
+                    "stderr": stderr.strip(),
+                },
+            )
+
     def validate_api_endpoints(self) -> None:
         """Validate API endpoints"""
         logger.info("Validating API endpoints")
@@ -966,41 +1573,30 @@ class DeploymentValidator:
                 "message": "requests library not available for API endpoint validation",
             }
             return
-        endpoints_config = self.config["environments"][self.env].get(
-            "api_endpoints", []
-        )
-        endpoint_validations = {}
-        for endpoint in endpoints_config:
-            endpoint_name = endpoint.get("name", "unknown")
-            url = endpoint.get("url")
-            method = endpoint.get("method", "GET")
-            headers = endpoint.get("headers", {})
-            data = endpoint.get("data")
-            expected_status = endpoint.get("expected_status", 200)
-            timeout = endpoint.get("timeout", 10)
-            content_check = endpoint.get("content_check")
-            schema_validation = endpoint.get("schema_validation")
-            logger.debug(f"Validating API endpoint: {endpoint_name} ({url})")
-            if not url:
-                endpoint_validations[endpoint_name] = {
+        endpoint_validations = self._results_sink("api_endpoints")
+        for endpoint in self._api_endpoints:
+            logger.debug(f"Validating API endpoint: {endpoint.name} ({endpoint.url})")
+            if not endpoint.url:
+                endpoint_validations[endpoint.name] = {
                     "status": "ERROR",
                     "message": "No URL specified",
                 }
                 continue
             status, details = self._validate_api_endpoint(
-                url,
-                method,
-                headers,
-                data,
-                expected_status,
-                timeout,
-                content_check,
-                schema_validation,
+                endpoint.url,
+                endpoint.method,
+                endpoint.headers,
+                endpoint.data,
+                endpoint.expected_status,
+                endpoint.timeout,
+                endpoint.content_check,
+                endpoint.schema_validation,
+                endpoint.content_check_bytes,
             )
-            endpoint_validations[endpoint_name] = {
+            endpoint_validations[endpoint.name] = {
                 "status": status,
-                "url": url,
-                "method": method,
+                "url": endpoint.url,
+                "method": endpoint.method,
                 **details,
             }
         self.results["validations"]["api_endpoints"] = endpoint_validations
@@ -1015,6 +1611,7 @@ class DeploymentValidator:
         timeout: int,
         content_check: Optional[str],
         schema_validation: Optional[Dict],
+        content_check_bytes: Optional[bytes] = None,
     ) -> Tuple[str, Dict]:
         """Validate API endpoint"""
         try:
@@ -1030,7 +1627,9 @@ class DeploymentValidator:
             status_check = response.status_code == expected_status
             content_check_result = True
             if content_check and status_check:
-                if content_check in response.text:
+                if content_check_bytes is None:
+                    content_check_bytes = content_check.encode("utf-8")
+                if content_check_bytes in response.content:
                     content_check_message = f"Response contains '{content_check}'"
                 else:
                     content_check_result = False
@@ -1135,11 +1734,10 @@ class DeploymentValidator:
     def validate_databases(self) -> None:
         """Validate databases"""
         logger.info("Validating databases")
-        databases_config = self.config["environments"][self.env].get("databases", [])
-        database_validations = {}
-        for db in databases_config:
-            db_name = db.get("name", "unknown")
-            db_type = db.get("type", "unknown")
+        database_validations = self._results_sink("databases")
+        for db in self._databases:
+            db_name = db.name
+            db_type = db.type
             logger.debug(f"Validating database: {db_name} (type: {db_type})")
             if db_type == "postgresql":
                 if not POSTGRES_AVAILABLE:
@@ -1149,30 +1747,22 @@ class DeploymentValidator:
                         "message": "psycopg2 not available for PostgreSQL validation",
                     }
                     continue
-                host = db.get("host", "localhost")
-                port = db.get("port", 5432)
-                database = db.get("database", "postgres")
-                user = db.get("user", "postgres")
-                password = db.get("password", "")
-                ssl_mode = db.get("ssl_mode", "prefer")
-                timeout = db.get("timeout", 5)
-                validation_query = db.get("validation_query", "SELECT 1")
                 status, details = self._validate_postgresql(
-                    host,
-                    port,
-                    database,
-                    user,
-                    password,
-                    ssl_mode,
-                    timeout,
-                    validation_query,
+                    db.host,
+                    db.port,
+                    db.database,
+                    db.user,
+                    db.password,
+                    db.ssl_mode,
+                    db.timeout,
+                    db.validation_query,
                 )
                 database_validations[db_name] = {
                     "status": status,
                     "type": db_type,
-                    "host": host,
-                    "port": port,
-                    "database": database,
+                    "host": db.host,
+                    "port": db.port,
+                    "database": db.database,
                     **details,
                 }
             elif db_type == "mongodb":
@@ -1183,35 +1773,28 @@ class DeploymentValidator:
                         "message": "pymongo not available for MongoDB validation",
                     }
                     continue
-                uri = db.get("uri")
-                host = db.get("host", "localhost")
-                port = db.get("port", 27017)
-                database = db.get("database", "admin")
-                user = db.get("user")
-                password = db.get("password")
-                timeout = db.get("timeout", 5)
-                validation_collection = db.get("validation_collection")
-                if uri:
+                if db.uri:
                     status, details = self._validate_mongodb_uri(
-                        uri, timeout, validation_collection
+                        db.uri, db.timeout, db.validation_collection, db.exact_count
                     )
                 else:
                     status, details = self._validate_mongodb(
-                        host,
-                        port,
-                        database,
-                        user,
-                        password,
-                        timeout,
-                        validation_collection,
+                        db.host,
+                        db.port,
+                        db.database,
+                        db.user,
+                        db.password,
+                        db.timeout,
+                        db.validation_collection,
+                        db.exact_count,
                     )
                 database_validations[db_name] = {
                     "status": status,
                     "type": db_type,
                     **(
-                        {"uri": uri}
-                        if uri
-                        else {"host": host, "port": port, "database": database}
+                        {"uri": db.uri}
+                        if db.uri
+                        else {"host": db.host, "port": db.port, "database": db.database}
                     ),
                     **details,
                 }
@@ -1251,23 +1834,21 @@ class DeploymentValidator:
             cursor.fetchone()
             cursor.execute("SELECT version();")
             version = cursor.fetchone()[0]
-            has_migrations_table = False
+            cursor.execute(
+                "SELECT EXISTS (SELECT FROM information_schema.tables WHERE table_name = %s);",
+                ("migrations",),
+            )
+            has_migrations_table = cursor.fetchone()[0]
             latest_migration = None
-            try:
-                cursor.execute(
-                    "\n                    SELECT EXISTS (\n                        SELECT FROM information_schema.tables\n                        WHERE table_name = 'migrations'\n                    );\n                "
-                )
-                has_migrations_table = cursor.fetchone()[0]
-                if has_migrations_table:
-                    try:
-                        cursor.execute(
-                            "SELECT version FROM migrations ORDER BY id DESC LIMIT 1;"
-                        )
-                        latest_migration = cursor.fetchone()[0]
-                    except Exception:
-                        pass
-            except Exception:
-                pass
+            if has_migrations_table:
+                try:
+                    cursor.execute(
+                        "SELECT version FROM migrations ORDER BY id DESC LIMIT 1;"
+                    )
+                    row = cursor.fetchone()
+                    latest_migration = row[0] if row else None
+                except psycopg2.Error as e:
+                    logger.debug(f"Error reading latest migration: {str(e)}")
             cursor.close()
             conn.close()
             connection_time = time.time() - start_time
@@ -1297,7 +1878,11 @@ class DeploymentValidator:
             )
 
     def _validate_mongodb_uri(
-        self, uri: str, timeout: int, validation_collection: Optional[str]
+        self,
+        uri: str,
+        timeout: int,
+        validation_collection: Optional[str],
+        exact_count: bool = False,
     ) -> Tuple[str, Dict]:
         """Validate MongoDB database using URI"""
         try:
@@ -1308,16 +1893,9 @@ class DeploymentValidator:
             if validation_collection:
                 db_name, coll_name = validation_collection.split(".", 1)
                 db = client[db_name]
-                coll = db[coll_name]
-                collection_exists = coll_name in db.list_collection_names()
-                if collection_exists:
-                    doc_count = coll.count_documents({})
-                    collection_validation = {
-                        "exists": True,
-                        "document_count": doc_count,
-                    }
-                else:
-                    collection_validation = {"exists": False}
+                collection_validation = self._validate_mongodb_collection(
+                    db, coll_name, exact_count
+                )
             connection_time = time.time() - start_time
             return (
                 "PASS",
@@ -1352,6 +1930,7 @@ class DeploymentValidator:
         password: str,
         timeout: int,
         validation_collection: Optional[str],
+        exact_count: bool = False,
     ) -> Tuple[str, Dict]:
         """Validate MongoDB database"""
         try:
@@ -1377,16 +1956,9 @@ class DeploymentValidator:
                 else:
                     db_name, coll_name = (database, validation_collection)
                 db = client[db_name]
-                coll = db[coll_name]
-                collection_exists = coll_name in db.list_collection_names()
-                if collection_exists:
-                    doc_count = coll.count_documents({})
-                    collection_validation = {
-                        "exists": True,
-                        "document_count": doc_count,
-                    }
-                else:
-                    collection_validation = {"exists": False}
+                collection_validation = self._validate_mongodb_collection(
+                    db, coll_name, exact_count
+                )
             connection_time = time.time() - start_time
             return (
                 "PASS",
@@ -1412,148 +1984,190 @@ class DeploymentValidator:
                 {"message": f"Error validating MongoDB database: {str(e)}"},
             )
 
+    def _validate_mongodb_collection(
+        self, db: Any, coll_name: str, exact_count: bool
+    ) -> Dict:
+        """Check that a MongoDB collection exists and report its document count"""
+        if not db.list_collection_names(filter={"name": coll_name}):
+            return {"exists": False}
+        coll = db[coll_name]
+        if exact_count:
+            doc_count = coll.count_documents({})
+        else:
+            doc_count = coll.estimated_document_count()
+        return {
+            "exists": True,
+            "document_count": doc_count,
+            "exact_count": exact_count,
+        }
+
     def validate_configurations(self) -> None:
         """Validate configuration settings"""
         logger.info("Validating configurations")
-        config_validations = self.config["environments"][self.env].get(
-            "config_validations", []
+        config_validations = self._env_config.get("config_validations", [])
+        configuration_results = self._results_sink("configurations")
+        dir_entries = self._scan_config_dirs(
+            [
+                validation["file_path"]
+                for validation in config_validations
+                if validation.get("type", "file") == "file"
+                and validation.get("file_path")
+            ]
         )
-        configuration_results = {}
-        for validation in config_validations:
-            validation_name = validation.get("name", "unknown")
-            validation_type = validation.get("type", "file")
-            logger.debug(
-                f"Validating configuration: {validation_name} (type: {validation_type})"
+        # Commands run together on the event loop; everything else goes to the
+        # thread pool, which keeps working while the main thread awaits them.
+        command_validations = [
+            validation
+            for validation in config_validations
+            if validation.get("type", "file") == "command" and validation.get("command")
+        ]
+        pooled_validations = [
+            validation
+            for validation in config_validations
+            if not (
+                validation.get("type", "file") == "command"
+                and validation.get("command")
             )
-            if validation_type == "file":
-                file_path = validation.get("file_path")
-                required_settings = validation.get("required_settings", [])
-                if not file_path:
-                    configuration_results[validation_name] = {
-                        "status": "ERROR",
-                        "type": validation_type,
-                        "message": "No file path specified",
-                    }
-                    continue
-                status, details = self._validate_config_file(
-                    file_path, required_settings
+        ]
+        pooled_results: Dict[int, concurrent.futures.Future] = {}
+        command_results: Dict[int, ValidationResult] = {}
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, min(MAX_VALIDATION_WORKERS, len(pooled_validations)))
+        ) as executor:
+            for validation in pooled_validations:
+                pooled_results[id(validation)] = executor.submit(
+                    self._validate_configuration, validation, dir_entries
                 )
-                configuration_results[validation_name] = {
-                    "status": status,
-                    "type": validation_type,
-                    "file_path": file_path,
-                    **details,
-                }
-            elif validation_type == "env":
-                required_vars = validation.get("required_vars", [])
-                status, details = self._validate_env_vars(required_vars)
-                configuration_results[validation_name] = {
-                    "status": status,
-                    "type": validation_type,
-                    **details,
-                }
-            elif validation_type == "command":
-                command = validation.get("command")
-                expected_exit_code = validation.get("expected_exit_code", 0)
-                timeout = validation.get("timeout", 30)
-                if not command:
-                    configuration_results[validation_name] = {
-                        "status": "ERROR",
-                        "type": validation_type,
-                        "message": "No command specified",
-                    }
-                    continue
-                status, details = self._validate_command(
-                    command, expected_exit_code, timeout
+            outcomes = self._run_commands(
+                [
+                    (
+                        validation["command"],
+                        validation.get("expected_exit_code", 0),
+                        validation.get("timeout", 30),
+                    )
+                    for validation in command_validations
+                ]
+            )
+            for validation, (status, details) in zip(command_validations, outcomes):
+                command_results[id(validation)] = ValidationResult(
+                    status, "command", command=validation["command"], details=details
+                )
+            for validation in config_validations:
+                key = id(validation)
+                result = (
+                    command_results[key]
+                    if key in command_results
+                    else pooled_results[key].result()
+                )
+                configuration_results[validation.get("name", "unknown")] = (
+                    result.to_dict()
                 )
-                configuration_results[validation_name] = {
-                    "status": status,
-                    "type": validation_type,
-                    "command": command,
-                    **details,
-                }
-            else:
-                configuration_results[validation_name] = {
-                    "status": "ERROR",
-                    "type": validation_type,
-                    "message": f"Unsupported validation type: {validation_type}",
-                }
         self.results["validations"]["configurations"] = configuration_results
 
+    def _scan_config_dirs(
+        self, file_paths: List[str]
+    ) -> Dict[str, Optional[os.DirEntry]]:
+        """Map config file paths to their DirEntry (None if absent), one scandir per directory"""
+        directories: Dict[str, Dict[str, os.DirEntry]] = {}
+        entries = {}
+        for file_path in file_paths:
+            dirname, basename = os.path.split(file_path)
+            if dirname not in directories:
+                try:
+                    with os.scandir(dirname or ".") as it:
+                        directories[dirname] = {entry.name: entry for entry in it}
+                except OSError:
+                    directories[dirname] = {}
+            entries[file_path] = directories[dirname].get(basename)
+        return entries
+
+    def _validate_configuration(
+        self, validation: Dict, dir_entries: Dict[str, Optional[os.DirEntry]]
+    ) -> ValidationResult:
+        """Run a single configuration validation and return its result"""
+        validation_name = validation.get("name", "unknown")
+        validation_type = validation.get("type", "file")
+        logger.debug(
+            f"Validating configuration: {validation_name} (type: {validation_type})"
+        )
+        if validation_type == "file":
+            file_path = validation.get("file_path")
+            required_settings = validation.get("required_settings", [])
+            if not file_path:
+                return ValidationResult(
+                    "ERROR", validation_type, message="No file path specified"
+                )
+            status, details = self._validate_config_file(
+                file_path, required_settings, dir_entries.get(file_path, _MISSING)
+            )
+            return ValidationResult(
+                status, validation_type, file_path=file_path, details=details
+            )
+        elif validation_type == "env":
+            required_vars = validation.get("required_vars", [])
+            status, details = self._validate_env_vars(required_vars)
+            return ValidationResult(status, validation_type, details=details)
+        elif validation_type == "command":
+            command = validation.get("command")
+            expected_exit_code = validation.get("expected_exit_code", 0)
+            timeout = validation.get("timeout", 30)
+            if not command:
+                return ValidationResult(
+                    "ERROR", validation_type, message="No command specified"
+                )
+            status, details = self._validate_command(
+                command, expected_exit_code, timeout
+            )
+            return ValidationResult(
+                status, validation_type, command=command, details=details
+            )
+        else:
+            return ValidationResult(
+                "ERROR",
+                validation_type,
+                message=f"Unsupported validation type: {validation_type}",
+            )
+
     def _validate_config_file(
-        self, file_path: str, required_settings: List[Dict]
+        self,
+        file_path: str,
+        required_settings: List[Dict],
+        dir_entry: Any = _MISSING,
     ) -> Tuple[str, Dict]:
         """Validate configuration file"""
         try:
-            if not os.path.exists(file_path):
+            try:
+                if dir_entry is _MISSING:
+                    st = os.stat(file_path)
+                elif dir_entry is None:
+                    raise FileNotFoundError(file_path)
+                else:
+                    st = dir_entry.stat()
+            except FileNotFoundError:
                 return (
                     "FAIL",
                     {"message": f"Configuration file not found: {file_path}"},
                 )
-            file_ext = os.path.splitext(file_path)[1].lower()
-            config_data = None
-            if file_ext in [".yaml", ".yml"]:
-                with open(file_path, "r") as f:
-                    config_data = yaml.safe_load(f)
-            elif file_ext == ".json":
-                with open(file_path, "r") as f:
-                    config_data = json.load(f)
-            elif file_ext in [".ini", ".conf", ".cfg"]:
-                config_data = {}
-                current_section = None
-                with open(file_path, "r") as f:
-                    for line in f:
-                        line = line.strip()
-                        if not line or line.startswith("#") or line.startswith(";"):
-                            continue
-                        if line.startswith("[") and line.endswith("]"):
-                            current_section = line[1:-1]
-                            config_data[current_section] = {}
-                        elif "=" in line:
-                            key, value = line.split("=", 1)
-                            if current_section:
-                                config_data[current_section][
-                                    key.strip()
-                                ] = value.strip()
-                            else:
-                                config_data[key.strip()] = value.strip()
-            else:
-                with open(file_path, "r") as f:
-                    content = f.read()
-                config_data = {"content": content}
-            missing_settings = []
+            missing_settings = None
             invalid_settings = []
-            for setting in required_settings:
-                path = setting.get("path", "")
-                expected_value = setting.get("value")
-                expected_type = setting.get("type")
-                actual_value = self._get_value_by_path(config_data, path)
-                if actual_value is None:
-                    missing_settings.append(path)
-                    continue
-                if expected_type:
-                    type_valid = False
-                    if expected_type == "string" and isinstance(actual_value, str):
-                        type_valid = True
-                    elif expected_type == "number" and isinstance(
-                        actual_value, (int, float)
-                    ):
-                        type_valid = True
-                    elif expected_type == "boolean" and isinstance(actual_value, bool):
-                        type_valid = True
-                    elif expected_type == "array" and isinstance(actual_value, list):
-                        type_valid = True
-                    elif expected_type == "object" and isinstance(actual_value, dict):
-                        type_valid = True
-                    if not type_valid:
-                        invalid_settings.append(
-                            f"{path} (expected type: {expected_type})"
-                        )
-                        continue
-                if expected_value is not None and actual_value != expected_value:
-                    invalid_settings.append(
-                        f"{path} (expected: {expected_value}, actual: {actual_value})"
-                    )
+            if (
+                st.st_size >= STREAM_SCAN_MIN_BYTES
+                and os.path.splitext(file_path)[1].lower() in (".yaml", ".yml")
+                and all(
+                    setting.get("type") is None and setting.get("value") is None
+                    for setting in required_settings
+                )
+            ):
+                missing_settings = self._scan_yaml_presence(
+                    file_path,
+                    [setting.get("path", "") for setting in required_settings],
+                )
+            if missing_settings is None:
+                config_data = self._load_config_file(
+                    os.path.abspath(file_path), st.st_mtime_ns, st.st_size
+                )
+                check_settings = self._get_settings_check(required_settings)
+                missing_settings, invalid_settings = check_settings(config_data)
             if missing_settings or invalid_settings:
                 return (
                     "FAIL",
@@ -1577,30 +2191,200 @@ class DeploymentValidator:
                 {"message": f"Error validating configuration file: {str(e)}"},
             )
 
+    def _scan_yaml_presence(
+        self, file_path: str, paths: List[str]
+    ) -> Optional[List[str]]:
+        """
+        Find which paths are missing (absent or null) from a YAML file by
+        walking parse events, stopping once every path has been seen.
+
+        Because the walk stops early, anything after the last wanted path is
+        not parsed: later duplicate keys or syntax errors go unnoticed.
+
+        Returns None when the document uses features the event walk does not
+        model (aliases, merge keys, non-scalar keys, custom tags, multiple
+        documents), in which case the caller falls back to a full parse.
+        """
+        wanted = {}
+        for path in paths:
+            wanted.setdefault(self._parse_path(path), path)
+        remaining = set(wanted)
+        missing = set()
+        resolver = yaml.resolver.Resolver()
+        frames: List[list] = []
+        documents = 0
+        with open(file_path, "rb") as f:
+            for event in yaml.parse(f, Loader=YamlSafeLoader):
+                if isinstance(event, yaml.DocumentStartEvent):
+                    documents += 1
+                    if documents > 1:
+                        return None
+                    continue
+                if isinstance(event, (yaml.MappingEndEvent, yaml.SequenceEndEvent)):
+                    frames.pop()
+                    continue
+                if not isinstance(event, yaml.NodeEvent):
+                    continue
+                if isinstance(event, yaml.AliasEvent):
+                    return None
+                tag = event.tag
+                if isinstance(event, yaml.ScalarEvent):
+                    if tag is None:
+                        tag = resolver.resolve(
+                            yaml.ScalarNode, event.value, event.implicit
+                        )
+                    elif tag == "!":
+                        tag = YAML_STR_TAG
+                    elif not tag.startswith(YAML_TAG_PREFIX):
+                        return None
+                elif tag not in (None, "!", YAML_MAP_TAG, YAML_SEQ_TAG):
+                    return None
+                frame = frames[-1] if frames else None
+                if frame is not None and frame[0] and frame[2]:
+                    if not isinstance(event, yaml.ScalarEvent) or tag == YAML_MERGE_TAG:
+                        return None
+                    frame[2] = False
+                    frame[3] = event.value if tag == YAML_STR_TAG else _MISSING
+                    continue
+                if frame is None:
+                    node_path = ()
+                elif frame[0]:
+                    node_path = frame[1] + ((True, frame[3]),)
+                    frame[2] = True
+                else:
+                    node_path = frame[1] + ((False, frame[2]),)
+                    frame[2] += 1
+                if node_path in remaining:
+                    remaining.discard(node_path)
+                    if tag == YAML_NULL_TAG:
+                        missing.add(node_path)
+                    if not remaining:
+                        break
+                if isinstance(event, yaml.MappingStartEvent):
+                    frames.append([True, node_path, True, None])
+                elif isinstance(event, yaml.SequenceStartEvent):
+                    frames.append([False, node_path, 0])
+        missing |= remaining
+        return [path for path in paths if self._parse_path(path) in missing]
+
+    def _get_settings_check(self, required_settings: List[Dict]) -> SettingsCheck:
+        """Get the compiled check for a required_settings list, compiling it once"""
+        key = json.dumps(required_settings, sort_keys=True, default=repr)
+        check = self._settings_checks.get(key)
+        if check is None:
+            check = self._compile_settings_check(required_settings)
+            self._settings_checks[key] = check
+        return check
+
+    def _compile_settings_check(self, required_settings: List[Dict]) -> SettingsCheck:
+        """Compile required_settings into a (missing, invalid) settings check"""
+        settings = [
+            (
+                setting.get("path", ""),
+                self._compile_path(setting.get("path", "")),
+                setting.get("type"),
+                SETTING_TYPES.get(setting.get("type")),
+                setting.get("value"),
+            )
+            for setting in required_settings
+        ]
+
+        def check(config_data: Any) -> Tuple[List[str], List[str]]:
+            missing_settings = []
+            invalid_settings = []
+            for path, get_value, expected_type, types, expected_value in settings:
+                actual_value = get_value(config_data)
+                if actual_value is None:
+                    missing_settings.append(path)
+                    continue
+                if expected_type and (
+                    types is None or not isinstance(actual_value, types)
+                ):
+                    invalid_settings.append(f"{path} (expected type: {expected_type})")
+                    continue
+                if expected_value is not None and actual_value != expected_value:
+                    invalid_settings.append(
+                        f"{path} (expected: {expected_value}, actual: {actual_value})"
+                    )
+            return missing_settings, invalid_settings
+
+        return check
+
+    @staticmethod
+    @functools.lru_cache(maxsize=128)
+    def _load_config_file(file_path: str, mtime_ns: int, size: int) -> Any:
+        """Parse a configuration file, cached by path, modification time and size"""
+        file_ext = os.path.splitext(file_path)[1].lower()
+        with open(file_path, "rb") as f:
+            raw = f.read()
+        if file_ext in [".yaml", ".yml"]:
+            config_data = yaml.load(raw, Loader=YamlSafeLoader)
+        elif file_ext == ".json":
+            config_data = json_loads(raw)
+        elif file_ext in [".ini", ".conf", ".cfg"]:
+            parser = configparser.ConfigParser(
+                strict=False,
+                interpolation=None,
+                allow_no_value=True,
+                inline_comment_prefixes=("#", ";"),
+                default_section=INI_NO_DEFAULT_SECTION,
+            )
+            parser.optionxform = str
+            parser.read_string(
+                f"[{INI_ROOT_SECTION}]\n" + raw.decode("utf-8"), file_path
+            )
+            config_data = dict(parser[INI_ROOT_SECTION])
+            for section in parser.sections():
+                if section != INI_ROOT_SECTION:
+                    config_data[section] = dict(parser[section])
+        else:
+            config_data = {"content": raw.decode("utf-8")}
+        return config_data
+
     def _get_value_by_path(self, data: Any, path: str) -> Any:
         """Get value from nested data structure using dot notation path"""
+        return self._compile_path(path)(data)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _parse_path(path: str) -> Tuple[Tuple[bool, Any], ...]:
+        """Split a dot notation path into (is_key, key or index) steps"""
         if not path:
-            return data
-        parts = path.split(".")
-        current = data
-        for part in parts:
+            return ()
+        steps = []
+        for part in path.split("."):
             if "[" in part and part.endswith("]"):
                 key, index_str = part.split("[", 1)
-                index = int(index_str[:-1])
                 if key:
-                    if isinstance(current, dict) and key in current:
-                        current = current[key]
+                    steps.append((True, key))
+                steps.append((False, int(index_str[:-1])))
+            else:
+                steps.append((True, part))
+        return tuple(steps)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile_path(path: str) -> Callable[[Any], Any]:
+        """Compile a dot notation path (e.g. "a.b[0].c") into an accessor"""
+        if not path:
+            return lambda data: data
+        steps = DeploymentValidator._parse_path(path)
+
+        def get_value(data: Any) -> Any:
+            current = data
+            for is_key, step in steps:
+                if is_key:
+                    if isinstance(current, dict) and step in current:
+                        current = current[step]
                     else:
                         return None
-                if isinstance(current, list) and 0 <= index < len(current):
-                    current = current[index]
+                elif isinstance(current, list) and 0 <= step < len(current):
+                    current = current[step]
                 else:
                     return None
-            elif isinstance(current, dict) and part in current:
-                current = current[part]
-            else:
-                return None
-        return current
+            return current
+
+        return get_value
 
     def _validate_env_vars(self, required_vars: List[Dict]) -> Tuple[str, Dict]:
         """Validate environment variables"""
@@ -1612,10 +2396,10 @@ class DeploymentValidator:
                 expected_value = var.get("value")
                 if not name:
                     continue
-                if name not in os.environ:
+                actual_value = os.environ.get(name, _MISSING)
+                if actual_value is _MISSING:
                     missing_vars.append(name)
-                    continue
-                if expected_value is not None and os.environ[name] != expected_value:
+                elif expected_value is not None and actual_value != expected_value:
                     invalid_vars.append(f"{name} (expected: {expected_value})")
             if missing_vars or invalid_vars:
                 return (
@@ -1640,18 +2424,34 @@ class DeploymentValidator:
                 {"message": f"Error validating environment variables: {str(e)}"},
             )
 
+    def _flatten_results(self) -> None:
+        """Collect every (category, name, data) validation record in one pass"""
+        self._flat_results = [
+            (category, validation_name, validation_data)
+            for category, validations in self.results["validations"].items()
+            if isinstance(validations, dict)
+            for validation_name, validation_data in validations.items()
+            if isinstance(validation_data, dict) and "status" in validation_data
+        ]
+
+    def _results_by_category(self) -> Dict[str, List[Tuple[str, str, Dict]]]:
+        """Group the flattened validation records by category"""
+        return {
+            category: list(records)
+            for category, records in itertools.groupby(
+                self._flat_results, key=operator.itemgetter(0)
+            )
+        }
+
     def _calculate_overall_status(self) -> None:
         """Calculate overall status based on validation results"""
         status_counts = {"PASS": 0, "FAIL": 0, "ERROR": 0, "UNKNOWN": 0}
-        for category, validations in self.results["validations"].items():
-            if isinstance(validations, dict):
-                for validation_name, validation_data in validations.items():
-                    if (
-                        isinstance(validation_data, dict)
-                        and "status" in validation_data
-                    ):
-                        status = validation_data["status"]
-                        status_counts[status] = status_counts.get(status, 0) + 1
+        status_counts.update(
+            collections.Counter(
+                validation_data["status"]
+                for _, _, validation_data in self._flat_results
+            )
+        )
         if status_counts["ERROR"] > 0:
             self.results["status"] = "ERROR"
         elif status_counts["FAIL"] > 0:
@@ -1668,7 +2468,7 @@ class DeploymentValidator:
     def _perform_rollback(self) -> None:
         """Perform rollback if validation failed"""
         logger.info("Performing rollback due to validation failures")
-        deployment_config = self.config["environments"][self.env].get("deployment", {})
+        deployment_config = self._env_config.get("deployment", {})
         rollback_command = deployment_config.get("rollback_command")
         if not rollback_command:
             logger.warning("No rollback command specified in configuration")
@@ -1717,256 +2517,179 @@ class DeploymentValidator:
 
     def generate_report(
         self, format: str = "text", output_path: Optional[str] = None
-    ) -> str:
-        """Generate a report of the validation results"""
-        if format == "json":
-            report = json.dumps(self.results, indent=2)
-        elif format == "html":
-            report = self._generate_html_report()
-        else:
-            report = self._generate_text_report()
+    ) -> Optional[str]:
+        """
+        Generate a report of the validation results
+
+        With output_path the report is streamed straight into that file and
+        None is returned; otherwise the report is returned as a string.
+        """
         if output_path:
             with open(output_path, "w") as f:
-                f.write(report)
+                self.write_report(f, format)
             logger.info(f"Report saved to {output_path}")
-        return report
+            return None
+        buf = io.StringIO()
+        self.write_report(buf, format)
+        return buf.getvalue()
 
-    def _generate_text_report(self) -> str:
+    def write_report(self, out: TextIO, format: str = "text") -> None:
+        """Write a report of the validation results to a text stream"""
+        if format == "json":
+            out.write(json_dumps(self.results, indent=True))
+        elif format == "html":
+            self._generate_html_report(out)
+        else:
+            self._generate_text_report(out)
+
+    def _generate_text_report(self, out: TextIO) -> None:
         """Generate a text report"""
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"NEXORA DEPLOYMENT VALIDATION REPORT - {self.env.upper()}")
-        lines.append(f"Date: {self.results['timestamp']}")
-        lines.append(f"Status: {self.results['status']}")
-        lines.append("=" * 80)
-        if "deployment_info" in self.results:
-            info = self.results["deployment_info"]
-            lines.append("\nDEPLOYMENT INFORMATION:")
-            lines.append(f"Name: {info.get('name', 'unknown')}")
-            lines.append(f"Environment: {info.get('environment', 'unknown')}")
-            lines.append(f"Expected Version: {info.get('expected_version', 'unknown')}")
-            lines.append(f"Actual Version: {info.get('actual_version', 'unknown')}")
-            lines.append(f"Timestamp: {info.get('timestamp', 'unknown')}")
-        summary = self.results["summary"]
-        lines.append("\nSUMMARY:")
-        lines.append(f"Total validations: {summary['total_validations']}")
+        write = out.write
+        results = self.results
+        write(
+            TEXT_REPORT_HEADER.format(
+                env=self.env.upper(),
+                timestamp=results["timestamp"],
+                status=results["status"],
+            )
+        )
+        if "deployment_info" in results:
+            info = results["deployment_info"]
+            write(
+                TEXT_REPORT_DEPLOYMENT_INFO.format(
+                    name=info.get("name", "unknown"),
+                    environment=info.get("environment", "unknown"),
+                    expected_version=info.get("expected_version", "unknown"),
+                    actual_version=info.get("actual_version", "unknown"),
+                    timestamp=info.get("timestamp", "unknown"),
+                )
+            )
+        summary = results["summary"]
+        write(f"\n\nSUMMARY:\nTotal validations: {summary['total_validations']}")
         for status, count in summary["status_counts"].items():
-            lines.append(f"  {status}: {count}")
-        for category, validations in self.results["validations"].items():
+            write(f"\n  {status}: {count}")
+        results_by_category = self._results_by_category()
+        for category, validations in results["validations"].items():
             if not validations:
                 continue
-            lines.append("\n" + "=" * 80)
-            lines.append(f"{category.upper()} VALIDATIONS:")
-            lines.append("-" * 80)
+            write(TEXT_REPORT_CATEGORY.format(category=category.upper()))
             if isinstance(validations, dict):
-                for validation_name, validation_data in validations.items():
-                    if (
-                        isinstance(validation_data, dict)
-                        and "status" in validation_data
-                    ):
-                        status = validation_data["status"]
-                        message = validation_data.get("message", "No message")
-                        lines.append(f"{validation_name}: {status}")
-                        lines.append(f"  {message}")
-                        for key, value in validation_data.items():
-                            if key not in ["status", "message"] and (
-                                not isinstance(value, (dict, list))
-                            ):
-                                lines.append(f"  {key}: {value}")
-                        lines.append("")
+                for _, validation_name, validation_data in results_by_category.get(
+                    category, ()
+                ):
+                    status = validation_data["status"]
+                    message = validation_data.get("message", "No message")
+                    write(f"\n{validation_name}: {status}\n  {message}")
+                    for key, value in validation_data.items():
+                        if key not in ["status", "message"] and (
+                            not isinstance(value, (dict, list))
+                        ):
+                            write(f"\n  {key}: {value}")
+                    write("\n")
             else:
-                lines.append(f"{validations}")
-                lines.append("")
-        if "rollback" in self.results:
-            rollback = self.results["rollback"]
-            lines.append("\n" + "=" * 80)
-            lines.append("ROLLBACK INFORMATION:")
-            lines.append("-" * 80)
-            lines.append(f"Status: {rollback.get('status', 'UNKNOWN')}")
-            lines.append(f"Message: {rollback.get('message', 'No message')}")
+                write(f"\n{validations}\n")
+        if "rollback" in results:
+            rollback = results["rollback"]
+            write(
+                TEXT_REPORT_ROLLBACK.format(
+                    status=rollback.get("status", "UNKNOWN"),
+                    message=rollback.get("message", "No message"),
+                )
+            )
             if "stdout" in rollback and rollback["stdout"]:
-                lines.append("\nStandard Output:")
-                lines.append(rollback["stdout"])
+                write(f"\n\nStandard Output:\n{rollback['stdout']}")
             if "stderr" in rollback and rollback["stderr"]:
-                lines.append("\nStandard Error:")
-                lines.append(rollback["stderr"])
-        return "\n".join(lines)
+                write(f"\n\nStandard Error:\n{rollback['stderr']}")
 
-    def _generate_html_report(self) -> str:
+    def _generate_html_report(self, out: TextIO) -> None:
         """Generate an HTML report"""
-        html = []
-        html.append("<!DOCTYPE html>")
-        html.append("<html lang='en'>")
-        html.append("<head>")
-        html.append("  <meta charset='UTF-8'>")
-        html.append(
-            "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
-        )
-        html.append("  <title>Nexora Deployment Validation Report</title>")
-        html.append("  <style>")
-        html.append("    body { font-family: Arial, sans-serif; margin: 20px; }")
-        html.append("    h1, h2, h3 { color: #333; }")
-        html.append("    .report-header { margin-bottom: 20px; }")
-        html.append("    .status { font-weight: bold; }")
-        html.append("    .status-PASS { color: green; }")
-        html.append("    .status-FAIL { color: red; }")
-        html.append("    .status-ERROR { color: darkred; }")
-        html.append("    .status-WARN, .status-UNKNOWN { color: orange; }")
-        html.append("    .status-INFO { color: blue; }")
-        html.append(
-            "    .validation { margin-bottom: 10px; border: 1px solid #ddd; padding: 10px; border-radius: 5px; }"
-        )
-        html.append(
-            "    .validation-header { display: flex; justify-content: space-between; }"
-        )
-        html.append("    .validation-details { margin-top: 10px; }")
-        html.append("    .validation-message { margin: 5px 0; }")
-        html.append("    .summary { margin: 20px 0; }")
-        html.append("    table { border-collapse: collapse; width: 100%; }")
-        html.append(
-            "    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }"
-        )
-        html.append("    th { background-color: #f2f2f2; }")
-        html.append("    .category { margin-top: 30px; }")
-        html.append(
-            "    .toggle-btn { cursor: pointer; background: none; border: none; font-size: 16px; }"
-        )
-        html.append("    .deployment-info { margin: 20px 0; }")
-        html.append("    .rollback-info { margin: 20px 0; }")
-        html.append(
-            "    pre { background-color: #f5f5f5; padding: 10px; border-radius: 5px; overflow-x: auto; }"
-        )
-        html.append("  </style>")
-        html.append("  <script>")
-        html.append("    function toggleDetails(id) {")
-        html.append("      const details = document.getElementById(id);")
-        html.append("      const btn = document.getElementById(id + '-btn');")
-        html.append("      if (details.style.display === 'none') {")
-        html.append("        details.style.display = 'block';")
-        html.append("        btn.textContent = '▼';")
-        html.append("      } else {")
-        html.append("        details.style.display = 'none';")
-        html.append("        btn.textContent = '►';")
-        html.append("      }")
-        html.append("    }")
-        html.append("  </script>")
-        html.append("</head>")
-        html.append("<body>")
-        html.append("  <div class='report-header'>")
-        html.append(
-            f"    <h1>Nexora Deployment Validation Report - {self.env.upper()}</h1>"
-        )
-        html.append(f"    <p><strong>Date:</strong> {self.results['timestamp']}</p>")
-        html.append(
-            f"    <p><strong>Status:</strong> <span class='status status-{self.results['status']}'>{self.results['status']}</span></p>"
-        )
-        html.append("  </div>")
-        if "deployment_info" in self.results:
-            info = self.results["deployment_info"]
-            html.append("  <div class='deployment-info'>")
-            html.append("    <h2>Deployment Information</h2>")
-            html.append("    <table>")
-            html.append(
-                f"      <tr><th>Name</th><td>{info.get('name', 'unknown')}</td></tr>"
-            )
-            html.append(
-                f"      <tr><th>Environment</th><td>{info.get('environment', 'unknown')}</td></tr>"
+        write = out.write
+        esc = html.escape
+        results = self.results
+        write(HTML_REPORT_HEAD)
+        write(
+            HTML_REPORT_HEADER.format(
+                env=esc(self.env.upper()),
+                timestamp=esc(str(results["timestamp"])),
+                status=esc(str(results["status"])),
             )
-            html.append(
-                f"      <tr><th>Expected Version</th><td>{info.get('expected_version', 'unknown')}</td></tr>"
-            )
-            html.append(
-                f"      <tr><th>Actual Version</th><td>{info.get('actual_version', 'unknown')}</td></tr>"
-            )
-            html.append(
-                f"      <tr><th>Timestamp</th><td>{info.get('timestamp', 'unknown')}</td></tr>"
-            )
-            html.append("    </table>")
-            html.append("  </div>")
-        summary = self.results["summary"]
-        html.append("  <div class='summary'>")
-        html.append("    <h2>Summary</h2>")
-        html.append("    <table>")
-        html.append(
-            "      <tr><th>Total Validations</th><td>"
-            + str(summary["total_validations"])
-            + "</td></tr>"
         )
+        if "deployment_info" in results:
+            info = results["deployment_info"]
+            write(
+                HTML_REPORT_DEPLOYMENT_INFO.format(
+                    name=esc(str(info.get("name", "unknown"))),
+                    environment=esc(str(info.get("environment", "unknown"))),
+                    expected_version=esc(str(info.get("expected_version", "unknown"))),
+                    actual_version=esc(str(info.get("actual_version", "unknown"))),
+                    timestamp=esc(str(info.get("timestamp", "unknown"))),
+                )
+            )
+        summary = results["summary"]
+        write(HTML_REPORT_SUMMARY.format(total=summary["total_validations"]))
         for status, count in summary["status_counts"].items():
-            html.append(f"      <tr><th>{status}</th><td>{count}</td></tr>")
-        html.append("    </table>")
-        html.append("  </div>")
+            write(HTML_REPORT_SUMMARY_ROW.format(status=esc(str(status)), count=count))
+        write(HTML_REPORT_SUMMARY_END)
         validation_id = 0
-        for category, validations in self.results["validations"].items():
+        results_by_category = self._results_by_category()
+        for category, validations in results["validations"].items():
             if not validations:
                 continue
-            html.append(f"  <div class='category'>")
-            html.append(f"    <h2>{category.title()} Validations</h2>")
+            write(HTML_REPORT_CATEGORY.format(category=esc(category.title())))
             if isinstance(validations, dict):
-                for validation_name, validation_data in validations.items():
-                    if (
-                        isinstance(validation_data, dict)
-                        and "status" in validation_data
-                    ):
-                        validation_id += 1
-                        status = validation_data["status"]
-                        message = validation_data.get("message", "No message")
-                        html.append(f"    <div class='validation'>")
-                        html.append(f"      <div class='validation-header'>")
-                        html.append(f"        <h3>{validation_name}</h3>")
-                        html.append(
-                            f"        <span class='status status-{status}'>{status}</span>"
-                        )
-                        html.append(f"      </div>")
-                        html.append(
-                            f"      <div class='validation-message'>{message}</div>"
-                        )
-                        html.append(
-                            f"""      <button id='validation-{validation_id}-btn' class='toggle-btn' onclick="toggleDetails('validation-{validation_id}-details')">▼</button>"""
-                        )
-                        html.append(
-                            f"      <div id='validation-{validation_id}-details' class='validation-details'>"
+                for _, validation_name, validation_data in results_by_category.get(
+                    category, ()
+                ):
+                    validation_id += 1
+                    details = []
+                    for key, value in validation_data.items():
+                        if key not in ["status", "message"]:
+                            if isinstance(value, (dict, list)):
+                                value = json_dumps(value, indent=True)
+                                value = f"<pre>{esc(value)}</pre>"
+                            else:
+                                value = esc(str(value))
+                            details.append(
+                                HTML_REPORT_DETAIL.format(
+                                    key=esc(str(key)), value=value
+                                )
+                            )
+                    write(
+                        HTML_REPORT_VALIDATION.format(
+                            id=validation_id,
+                            name=esc(str(validation_name)),
+                            status=esc(str(validation_data["status"])),
+                            message=esc(
+                                str(validation_data.get("message", "No message"))
+                            ),
+                            details="".join(details),
                         )
-                        for key, value in validation_data.items():
-                            if key not in ["status", "message"]:
-                                if isinstance(value, (dict, list)):
-                                    html.append(
-                                        f"        <div><strong>{key}:</strong> <pre>{json.dumps(value, indent=2)}</pre></div>"
-                                    )
-                                else:
-                                    html.append(
-                                        f"        <div><strong>{key}:</strong> {value}</div>"
-                                    )
-                        html.append("      </div>")
-                        html.append("    </div>")
+                    )
             else:
-                html.append(f"    <div class='validation'>{validations}</div>")
-            html.append("  </div>")
-        if "rollback" in self.results:
-            rollback = self.results["rollback"]
-            html.append("  <div class='rollback-info'>")
-            html.append("    <h2>Rollback Information</h2>")
-            html.append("    <table>")
-            html.append(
-                f"      <tr><th>Status</th><td><span class='status status-{rollback.get('status', 'UNKNOWN')}'>{rollback.get('status', 'UNKNOWN')}</span></td></tr>"
-            )
-            html.append(
-                f"      <tr><th>Message</th><td>{rollback.get('message', 'No message')}</td></tr>"
+                write(f"    <div class='validation'>{esc(str(validations))}</div>\n")
+            write("  </div>\n")
+        if "rollback" in results:
+            rollback = results["rollback"]
+            write(
+                HTML_REPORT_ROLLBACK.format(
+                    status=esc(str(rollback.get("status", "UNKNOWN"))),
+                    message=esc(str(rollback.get("message", "No message"))),
+                )
             )
-            html.append("    </table>")
             if "stdout" in rollback and rollback["stdout"]:
-                html.append("    <h3>Standard Output</h3>")
-                html.append(f"    <pre>{rollback['stdout']}</pre>")
+                write(
+                    HTML_REPORT_OUTPUT.format(
+                        title="Standard Output", output=esc(rollback["stdout"])
+                    )
+                )
             if "stderr" in rollback and rollback["stderr"]:
-                html.append("    <h3>Standard Error</h3>")
-                html.append(f"    <pre>{rollback['stderr']}</pre>")
-            html.append("  </div>")
-        html.append("  <div class='footer'>")
-        html.append("    <p>Generated by Nexora Deployment Validation Script</p>")
-        html.append("  </div>")
-        html.append("</body>")
-        html.append("</html>")
-        return "\n".join(html)
+                write(
+                    HTML_REPORT_OUTPUT.format(
+                        title="Standard Error", output=esc(rollback["stderr"])
+                    )
+                )
+            write("  </div>\n")
+        write(HTML_REPORT_FOOTER)
 
 
 def parse_args() -> Any:
@@ -2010,6 +2733,10 @@ def parse_args() -> Any:
         default=300,
         help="Timeout for validation checks in seconds (default: 300)",
     )
+    parser.add_argument(
+        "--results-stream",
+        help="Write each validation result to this path as NDJSON while running",
+    )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
     return parser.parse_args()
 
@@ -2017,6 +2744,7 @@ def parse_args() -> Any:
 def main() -> Any:
     """Main entry point"""
     args = parse_args()
+    validator = None
     try:
         validator = DeploymentValidator(
             config_path=args.config,
@@ -2024,11 +2752,14 @@ def main() -> Any:
             timeout=args.timeout,
             rollback=args.rollback,
             verbose=args.verbose,
+            results_stream=args.results_stream,
         )
         results = validator.run_all_validations()
-        report = validator.generate_report(format=args.format, output_path=args.output)
-        if not args.output:
-            print(report)
+        if args.output:
+            validator.generate_report(format=args.format, output_path=args.output)
+        else:
+            validator.write_report(sys.stdout, format=args.format)
+            sys.stdout.write("\n")
         if args.notify and results["status"] in ["FAIL", "ERROR"]:
             logger.info("Notifications would be sent (not implemented)")
         if results["status"] == "PASS":
@@ -2040,6 +2771,9 @@ def main() -> Any:
     except Exception as e:
         logger.error(f"Error running deployment validation: {str(e)}", exc_info=True)
         return 3
+    finally:
+        if validator is not None:
+            validator.close()
 
 
 if __name__ == "__main__":
@@ -16,6 +16,7 @@ Options:
     --notify                Send notifications on failures
     --threshold PERCENT     Alert threshold for resource usage (default: 80)
     --verbose               Enable verbose output
+    --fast-fail             Stop at the first failing check category
     --help                  Show this help message
 
 Examples:
@@ -25,19 +26,51 @@ Examples:
 """
 
 import argparse
+import collections
+import concurrent.futures
 import datetime
+import errno
+import functools
+import html
+import importlib.util
+import io
 import json
 import logging
 import os
 import platform
+import selectors
+import shlex
+import shutil
 import socket
 import subprocess
 import sys
+import threading
 import time
-from typing import Any, Dict, Optional, Tuple
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlSafeLoader
+except ImportError:
+    from yaml import SafeLoader as YamlSafeLoader
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 try:
     import psutil
 
@@ -50,30 +83,13 @@ try:
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
-try:
-    import pymongo
-
-    MONGODB_AVAILABLE = True
-except ImportError:
-    MONGODB_AVAILABLE = False
-try:
-    import psycopg2
-
-    POSTGRES_AVAILABLE = True
-except ImportError:
-    POSTGRES_AVAILABLE = False
-try:
-    import redis
-
-    REDIS_AVAILABLE = True
-except ImportError:
-    REDIS_AVAILABLE = False
-try:
-    import kubernetes
-
-    K8S_AVAILABLE = True
-except ImportError:
-    K8S_AVAILABLE = False
+# Database and cluster drivers are slow to import, so they are only located
+# here and imported by the first check that uses them
+MONGODB_AVAILABLE = importlib.util.find_spec("pymongo") is not None
+POSTGRES_AVAILABLE = importlib.util.find_spec("psycopg2") is not None
+# redis-py picks up the hiredis C reply parser on its own when installed
+REDIS_AVAILABLE = importlib.util.find_spec("redis") is not None
+K8S_AVAILABLE = importlib.util.find_spec("kubernetes") is not None
 
 logging.basicConfig(
     level=logging.INFO,
@@ -82,12 +98,162 @@ logging.basicConfig(
 )
 logger = logging.getLogger("environment_health_check")
 
+MAX_CHECK_WORKERS = 32
+PORT_CHECK_TIMEOUT = 2.0
+CPU_SAMPLE_INTERVAL = 1.0
+HTTP_POOL_CONNECTIONS = 32
+HTTP_POOL_MAXSIZE = 64
+HTTP_CONTENT_CHUNK_SIZE = 1024
+HTTP_DRAIN_LIMIT = 64 * 1024
+POSTGRES_POOL_MIN_CONNECTIONS = 1
+POSTGRES_POOL_MAX_CONNECTIONS = 4
+K8S_LIST_PAGE_SIZE = 500
+K8S_POOL_MAXSIZE = 8
+# (seconds per unit, suffix) from largest to smallest for pod ages
+POD_AGE_UNITS = ((86400, "d"), (3600, "h"), (60, "m"))
+# Command strings containing any of these need /bin/sh to be interpreted
+SHELL_METACHARACTERS = frozenset("|&;<>()$`*?[]{}~#!\n")
+# Order in which check categories appear in the results and reports
+CHECK_CATEGORIES = ("system", "services", "databases", "api_endpoints", "kubernetes")
+# Host facts that cannot change while the process runs
+_HOSTNAME = socket.gethostname()
+_PLATFORM = platform.platform()
+_PYTHON_VERSION = platform.python_version()
+_CPU_COUNT = os.cpu_count() or 1
+_HAS_GETLOADAVG = callable(getattr(os, "getloadavg", None))
+# Linux exposes every process as /proc/<pid>; read it directly when available
+_HAS_PROCFS = os.path.isdir("/proc/self")
+# Last successful database check per target, shared by every HealthCheck in
+# the process: key -> (time.monotonic() of the check, result)
+_LAST_SUCCESS: Dict[Tuple, Tuple[float, Dict]] = {}
+_LAST_SUCCESS_LOCK = threading.Lock()
+
+HTML_REPORT_HEAD = """\
+<!DOCTYPE html>
+<html lang='en'>
+<head>
+  <meta charset='UTF-8'>
+  <meta name='viewport' content='width=device-width, initial-scale=1.0'>
+  <title>Nexora Environment Health Check Report</title>
+  <style>
+    body { font-family: Arial, sans-serif; margin: 20px; }
+    h1, h2, h3 { color: #333; }
+    .report-header { margin-bottom: 20px; }
+    .status { font-weight: bold; }
+    .status-PASS { color: green; }
+    .status-FAIL { color: red; }
+    .status-ERROR { color: darkred; }
+    .status-WARN, .status-UNKNOWN { color: orange; }
+    .status-INFO { color: blue; }
+    .status-SKIPPED { color: gray; }
+    .check { margin-bottom: 10px; border: 1px solid #ddd; padding: 10px; border-radius: 5px; }
+    .check-header { display: flex; justify-content: space-between; }
+    .check-details { margin-top: 10px; }
+    .check-message { margin: 5px 0; }
+    .summary { margin: 20px 0; }
+    table { border-collapse: collapse; width: 100%; }
+    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }
+    th { background-color: #f2f2f2; }
+    .category { margin-top: 30px; }
+    .toggle-btn { cursor: pointer; background: none; border: none; font-size: 16px; }
+  </style>
+  <script>
+    function toggleDetails(id) {
+      const details = document.getElementById(id);
+      const btn = document.getElementById(id + '-btn');
+      if (details.style.display === 'none') {
+        details.style.display = 'block';
+        btn.textContent = '▼';
+      } else {
+        details.style.display = 'none';
+        btn.textContent = '►';
+      }
+    }
+  </script>
+</head>
+<body>
+"""
+HTML_REPORT_HEADER = """\
+  <div class='report-header'>
+    <h1>Nexora Environment Health Check Report - {env}</h1>
+    <p><strong>Date:</strong> {timestamp}</p>
+    <p><strong>Status:</strong> <span class='status status-{status}'>{status}</span></p>
+  </div>
+"""
+HTML_REPORT_SUMMARY = """\
+  <div class='summary'>
+    <h2>Summary</h2>
+    <table>
+      <tr><th>Total Checks</th><td>{total}</td></tr>
+"""
+HTML_REPORT_SUMMARY_ROW = "      <tr><th>{status}</th><td>{count}</td></tr>\n"
+HTML_REPORT_SUMMARY_END = "    </table>\n  </div>\n"
+HTML_REPORT_CATEGORY = "  <div class='category'>\n    <h2>{category} Checks</h2>\n"
+HTML_REPORT_DETAIL = "        <div><strong>{key}:</strong> {value}</div>\n"
+HTML_REPORT_CHECK = """\
+    <div class='check'>
+      <div class='check-header'>
+        <h3>{name}</h3>
+        <span class='status status-{status}'>{status}</span>
+      </div>
+      <div class='check-message'>{message}</div>
+      <button id='check-{id}-btn' class='toggle-btn' onclick="toggleDetails('check-{id}-details')">▼</button>
+      <div id='check-{id}-details' class='check-details'>
+{details}\
+      </div>
+    </div>
+"""
+HTML_REPORT_FOOTER = """\
+  <div class='footer'>
+    <p>Generated by Nexora Environment Health Check Script</p>
+  </div>
+</body>
+</html>"""
+
+
+def json_dumps(obj: Any, indent: bool = False) -> str:
+    """Serialize to JSON with orjson when available, falling back to json"""
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_INDENT_2 if indent else 0
+        try:
+            return orjson.dumps(obj, option=option, default=str).decode("utf-8")
+        except TypeError:
+            # Check names come from YAML and may be ints; coercing keys costs
+            # extra on every dict, so it is only enabled when needed
+            option |= orjson.OPT_NON_STR_KEYS
+            return orjson.dumps(obj, option=option, default=str).decode("utf-8")
+    return json.dumps(
+        obj, indent=2 if indent else None, ensure_ascii=False, default=str
+    )
+
+
+@dataclass
+class CheckResult:
+    """Outcome of a single health check"""
+
+    status: str
+    message: Optional[str] = None
+    details: Dict = field(default_factory=dict)
+
+    def to_dict(self) -> Dict:
+        """Flatten into the report record, omitting an unset message"""
+        record = {"status": self.status}
+        if self.message is not None:
+            record["message"] = self.message
+        record.update(self.details)
+        return record
+
 
 class HealthCheck:
     """Main class for performing environment health checks"""
 
     def __init__(
-        self, config_path: str, env: str, threshold: int = 80, verbose: bool = False
+        self,
+        config_path: str,
+        env: str,
+        threshold: int = 80,
+        verbose: bool = False,
+        fast_fail: bool = False,
     ) -> None:
         """
         Initialize the health check with configuration
@@ -97,14 +263,28 @@ class HealthCheck:
             env: Target environment (dev, staging, prod)
             threshold: Alert threshold for resource usage (percentage)
             verbose: Enable verbose output
+            fast_fail: Run check categories one at a time and stop at the
+                first failure
         """
         self.config_path = config_path
         self.env = env
         self.threshold = threshold
         self.verbose = verbose
+        self.fast_fail = fast_fail
         self.config = self._load_config()
+        self._http_session = self._create_http_session() if REQUESTS_AVAILABLE else None
+        self._cpu_sample = self._start_cpu_sample() if PSUTIL_AVAILABLE else None
+        self._db_pools: Dict[Tuple, Any] = {}
+        self._db_pools_lock = threading.Lock()
+        self._mongodb_versions: Dict[Tuple, str] = {}
+        # host -> IPv4 address (or lookup error), cleared at the start of a run
+        self._addresses: Dict[str, Union[str, OSError]] = {}
+        # Status tallies per check category, kept up to date by _record_checks
+        self._status_counts: Dict[str, collections.Counter] = {}
+        # Formatted once per run and shared by every record that reports it
+        self._run_time = datetime.datetime.now().isoformat()
         self.results = {
-            "timestamp": datetime.datetime.now().isoformat(),
+            "timestamp": self._run_time,
             "environment": env,
             "status": "UNKNOWN",
             "summary": {},
@@ -134,8 +314,9 @@ class HealthCheck:
                         }
                     }
                 }
-            with open(self.config_path, "r") as f:
-                config = yaml.safe_load(f)
+            config = self._read_config(
+                self.config_path, os.stat(self.config_path).st_mtime_ns
+            )
             if not config or "environments" not in config:
                 logger.error("Invalid configuration format")
                 raise ValueError("Invalid configuration format")
@@ -147,34 +328,225 @@ class HealthCheck:
             logger.error(f"Error loading configuration: {str(e)}")
             raise
 
+    def _create_http_session(self) -> Any:
+        """Create the keep-alive HTTP session shared by all HTTP probes"""
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE,
+            max_retries=0,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _start_cpu_sample(self) -> concurrent.futures.Future:
+        """Start measuring CPU usage in the background while other checks run"""
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        future = executor.submit(psutil.cpu_percent, interval=CPU_SAMPLE_INTERVAL)
+        executor.shutdown(wait=False)
+        return future
+
+    def _get_db_pool(self, key: Tuple, factory: Callable[[], Any]) -> Any:
+        """Return the pooled client for key, creating it on first use"""
+        with self._db_pools_lock:
+            pool = self._db_pools.get(key)
+        if pool is not None:
+            return pool
+        # Connect outside the lock so slow servers don't stall other checks
+        pool = factory()
+        with self._db_pools_lock:
+            existing = self._db_pools.setdefault(key, pool)
+        if existing is not pool:
+            self._close_db_pool(key, pool)
+        return existing
+
+    def _close_db_pool(self, key: Tuple, pool: Any) -> None:
+        """Close a pooled database client"""
+        db_type = key[0]
+        if db_type == "postgresql":
+            pool.closeall()
+        elif db_type == "mongodb":
+            pool.close()
+        elif db_type == "redis":
+            pool.disconnect()
+
+    def close(self) -> None:
+        """Release pooled HTTP and database connections"""
+        if self._http_session is not None:
+            self._http_session.close()
+            self._http_session = None
+        with self._db_pools_lock:
+            pools, self._db_pools = self._db_pools, {}
+        for key, pool in pools.items():
+            try:
+                self._close_db_pool(key, pool)
+            except Exception as e:
+                logger.debug(f"Error closing {key[0]} connection pool: {str(e)}")
+
+    @staticmethod
+    @functools.lru_cache(maxsize=4)
+    def _read_config(config_path: str, mtime_ns: int) -> Any:
+        """Parse the YAML config, cached by path and modification time"""
+        with open(config_path, "rb") as f:
+            return yaml.load(f, Loader=YamlSafeLoader)
+
     def run_all_checks(self) -> Dict:
         """Run all health checks and return results"""
         logger.info("Starting health checks")
-        self.check_system_resources()
-        self.check_services()
-        self.check_databases()
-        self.check_api_endpoints()
-        self.check_kubernetes()
+        self._run_time = datetime.datetime.now().isoformat()
+        self._addresses = {}
+        checks = [
+            self.check_system_resources,
+            self.check_services,
+            self.check_databases,
+            self.check_api_endpoints,
+            self.check_kubernetes,
+        ]
+        if self.fast_fail:
+            self._run_checks_until_failure(checks)
+        else:
+            self._map_concurrently(lambda check: check(), checks)
+        checks = self.results["checks"]
+        self.results["checks"] = {
+            category: checks[category]
+            for category in CHECK_CATEGORIES
+            if category in checks
+        }
         self._calculate_overall_status()
         logger.info(f"Health checks completed with status: {self.results['status']}")
         return self.results
 
+    def _run_checks_until_failure(self, checks: List[Callable[[], None]]) -> None:
+        """Run check categories in order, skipping the rest after a failure"""
+        for index, check in enumerate(checks):
+            check()
+            self._calculate_overall_status()
+            if self.results["status"] in ("FAIL", "ERROR"):
+                break
+        else:
+            return
+        for category in CHECK_CATEGORIES[index + 1 :]:
+            self._record_checks(
+                category,
+                {
+                    "skipped": CheckResult(
+                        "SKIPPED", "Not checked after an earlier failure (fast-fail)"
+                    )
+                },
+            )
+
+    def _record_checks(
+        self, category: str, checks: Dict[str, Union[Dict, CheckResult]]
+    ) -> None:
+        """
+        Store a category's check records and tally their statuses
+
+        Every record under results["checks"][category] is a dict with a
+        "status" key, so the status tally and the reports never need to
+        inspect its shape.
+        """
+        records = {
+            name: check.to_dict() if isinstance(check, CheckResult) else check
+            for name, check in checks.items()
+        }
+        # Counted once here so the overall status never rewalks the records
+        self._status_counts[category] = collections.Counter(
+            record["status"] for record in records.values()
+        )
+        self.results["checks"][category] = records
+
+    def _map_concurrently(
+        self,
+        func: Callable[[Any], Any],
+        items: List,
+        budget: Optional[float] = None,
+        on_timeout: Optional[Callable[[Any], Any]] = None,
+    ) -> List:
+        """
+        Apply func to every item on a thread pool, returning results in order
+
+        When a budget (seconds) is given, items whose call has not finished once
+        it is spent are abandoned and reported through on_timeout instead.
+        Budgeted calls run on daemon threads, so an abandoned probe cannot
+        hold the process open after the report is written.
+        """
+        if not items:
+            return []
+        if budget is not None:
+            futures = self._submit_daemon(func, items)
+            try:
+                concurrent.futures.wait(futures, timeout=budget)
+            finally:
+                for future in futures:
+                    future.cancel()
+            return [
+                (
+                    future.result()
+                    if future.done() and not future.cancelled()
+                    else on_timeout(item)
+                )
+                for future, item in zip(futures, items)
+            ]
+        if len(items) == 1:
+            # Nothing to overlap with, so skip the pool and its thread start
+            return [func(items[0])]
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=min(MAX_CHECK_WORKERS, len(items))
+        ) as executor:
+            return list(executor.map(func, items))
+
+    @staticmethod
+    def _submit_daemon(
+        func: Callable[[Any], Any], items: List
+    ) -> List[concurrent.futures.Future]:
+        """Run func over items on daemon worker threads, one future per item"""
+        futures = [concurrent.futures.Future() for _ in items]
+        pending = collections.deque(zip(futures, items))
+
+        def work() -> None:
+            while True:
+                try:
+                    future, item = pending.popleft()
+                except IndexError:
+                    return
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(func(item))
+                except BaseException as e:
+                    future.set_exception(e)
+
+        for _ in range(min(MAX_CHECK_WORKERS, len(items))):
+            threading.Thread(target=work, name="budgeted-check", daemon=True).start()
+        return futures
+
+    def _check_budget(self) -> Optional[float]:
+        """Wall-time budget (seconds) for a database, API endpoint or Kubernetes sweep"""
+        return self.config["environments"][self.env].get("check_budget_sec")
+
     def check_system_resources(self) -> None:
         """Check system resources (CPU, memory, disk)"""
         logger.info("Checking system resources")
         system_checks = {}
         system_config = self.config["environments"][self.env].get("system", {})
+        max_cpu_load = system_config.get("max_cpu_load", 90)
+        min_memory_mb = system_config.get("min_memory_mb", 1024)
+        min_disk_gb = system_config.get("min_disk_gb", 10)
+        threshold = f"{self.threshold}%"
         if PSUTIL_AVAILABLE:
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_status = (
-                "PASS"
-                if cpu_percent < system_config.get("max_cpu_load", 90)
-                else "FAIL"
-            )
+            # The first run uses the sample started in __init__; later runs get
+            # the usage since the previous call without blocking
+            cpu_sample, self._cpu_sample = self._cpu_sample, None
+            if cpu_sample is not None:
+                cpu_percent = cpu_sample.result()
+            else:
+                cpu_percent = psutil.cpu_percent(interval=None)
+            cpu_status = "PASS" if cpu_percent < max_cpu_load else "FAIL"
             system_checks["cpu"] = {
                 "status": cpu_status,
                 "value": f"{cpu_percent}%",
-                "threshold": f"{system_config.get('max_cpu_load', 90)}%",
+                "threshold": f"{max_cpu_load}%",
                 "message": f"CPU usage is {cpu_percent}%",
             }
         else:
@@ -186,7 +558,6 @@ class HealthCheck:
             memory = psutil.virtual_memory()
             memory_percent = memory.percent
             memory_status = "PASS" if memory_percent < self.threshold else "FAIL"
-            min_memory_mb = system_config.get("min_memory_mb", 1024)
             memory_available_mb = memory.available / (1024 * 1024)
             memory_available_status = (
                 "PASS" if memory_available_mb > min_memory_mb else "FAIL"
@@ -194,7 +565,7 @@ class HealthCheck:
             system_checks["memory_percent"] = {
                 "status": memory_status,
                 "value": f"{memory_percent}%",
-                "threshold": f"{self.threshold}%",
+                "threshold": threshold,
                 "message": f"Memory usage is {memory_percent}%",
             }
             system_checks["memory_available"] = {
@@ -212,13 +583,12 @@ class HealthCheck:
             disk = psutil.disk_usage("/")
             disk_percent = disk.percent
             disk_status = "PASS" if disk_percent < self.threshold else "FAIL"
-            min_disk_gb = system_config.get("min_disk_gb", 10)
             disk_free_gb = disk.free / (1024 * 1024 * 1024)
             disk_free_status = "PASS" if disk_free_gb > min_disk_gb else "FAIL"
             system_checks["disk_percent"] = {
                 "status": disk_status,
                 "value": f"{disk_percent}%",
-                "threshold": f"{self.threshold}%",
+                "threshold": threshold,
                 "message": f"Disk usage is {disk_percent}%",
             }
             system_checks["disk_free"] = {
@@ -232,18 +602,18 @@ class HealthCheck:
                 "status": "UNKNOWN",
                 "message": "psutil not available for disk check",
             }
-        if hasattr(os, "getloadavg") and callable(getattr(os, "getloadavg")):
+        if _HAS_GETLOADAVG:
             try:
                 load1, load5, load15 = os.getloadavg()
-                cpu_count = os.cpu_count() or 1
-                normalized_load = load5 / cpu_count * 100
+                normalized_load = load5 / _CPU_COUNT * 100
                 load_status = "PASS" if normalized_load < self.threshold else "FAIL"
+                load_value = f"{load1:.2f}, {load5:.2f}, {load15:.2f}"
                 system_checks["load_average"] = {
                     "status": load_status,
-                    "value": f"{load1:.2f}, {load5:.2f}, {load15:.2f}",
+                    "value": load_value,
                     "normalized": f"{normalized_load:.2f}%",
-                    "threshold": f"{self.threshold}%",
-                    "message": f"System load average (1, 5, 15 min): {load1:.2f}, {load5:.2f}, {load15:.2f}",
+                    "threshold": threshold,
+                    "message": f"System load average (1, 5, 15 min): {load_value}",
                 }
             except Exception as e:
                 system_checks["load_average"] = {
@@ -252,242 +622,356 @@ class HealthCheck:
                 }
         system_checks["info"] = {
             "status": "INFO",
-            "hostname": socket.gethostname(),
-            "platform": platform.platform(),
-            "python_version": platform.python_version(),
-            "time": datetime.datetime.now().isoformat(),
+            "hostname": _HOSTNAME,
+            "platform": _PLATFORM,
+            "python_version": _PYTHON_VERSION,
+            "time": self._run_time,
         }
-        self.results["checks"]["system"] = system_checks
+        self._record_checks("system", system_checks)
 
     def check_services(self) -> None:
         """Check status of configured services"""
         logger.info("Checking services")
         services_config = self.config["environments"][self.env].get("services", [])
+        process_table = self._build_process_table(
+            [
+                service["process_name"]
+                for service in services_config
+                if service.get("type", "process") == "process"
+                and service.get("process_name")
+            ]
+        )
+        port_results = self._check_ports(
+            [
+                (service.get("host", "localhost"), service["port"])
+                for service in services_config
+                if service.get("type", "process") == "port" and service.get("port")
+            ]
+        )
         service_checks = {}
-        for service in services_config:
-            service_name = service.get("name", "unknown")
-            service_type = service.get("type", "process")
-            logger.debug(f"Checking service: {service_name} (type: {service_type})")
-            if service_type == "process":
-                process_name = service.get("process_name")
-                pid = service.get("pid")
-                if process_name:
-                    status, details = self._check_process_by_name(process_name)
-                elif pid:
-                    status, details = self._check_process_by_pid(pid)
-                else:
-                    status = "ERROR"
-                    details = {"message": "No process_name or pid specified"}
-                service_checks[service_name] = {
-                    "status": status,
-                    "type": "process",
-                    **details,
-                }
-            elif service_type == "port":
-                host = service.get("host", "localhost")
-                port = service.get("port")
-                if not port:
-                    service_checks[service_name] = {
-                        "status": "ERROR",
-                        "type": "port",
-                        "message": "No port specified",
-                    }
-                    continue
-                status, details = self._check_port(host, port)
-                service_checks[service_name] = {
-                    "status": status,
+        for service, service_check in zip(
+            services_config,
+            self._map_concurrently(
+                lambda service: self._check_service(
+                    service, process_table, port_results
+                ),
+                services_config,
+            ),
+        ):
+            service_checks[service.get("name", "unknown")] = service_check
+        self._record_checks("services", service_checks)
+
+    def _build_process_table(
+        self, process_names: List[str]
+    ) -> Optional[Dict[str, List[Dict]]]:
+        """Match all requested process names in a single pass over the process table"""
+        if not process_names or not (PSUTIL_AVAILABLE or _HAS_PROCFS):
+            return None
+        try:
+            return self._scan_processes(process_names)
+        except Exception as e:
+            logger.debug(f"Process table scan failed, checking individually: {e}")
+            return None
+
+    def _check_service(
+        self,
+        service: Dict,
+        process_table: Optional[Dict[str, List[Dict]]] = None,
+        port_results: Optional[Dict[Tuple[str, int], Tuple[str, Dict]]] = None,
+    ) -> Dict:
+        """Check a single configured service"""
+        service_name = service.get("name", "unknown")
+        service_type = service.get("type", "process")
+        logger.debug(f"Checking service: {service_name} (type: {service_type})")
+        if service_type == "process":
+            process_name = service.get("process_name")
+            pid = service.get("pid")
+            if process_name:
+                status, details = self._check_process_by_name(
+                    process_name, process_table
+                )
+            elif pid:
+                status, details = self._check_process_by_pid(pid)
+            else:
+                status = "ERROR"
+                details = {"message": "No process_name or pid specified"}
+            return {
+                "status": status,
+                "type": "process",
+                **details,
+            }
+        elif service_type == "port":
+            host = service.get("host", "localhost")
+            port = service.get("port")
+            if not port:
+                return {
+                    "status": "ERROR",
                     "type": "port",
-                    "host": host,
-                    "port": port,
-                    **details,
+                    "message": "No port specified",
                 }
-            elif service_type == "http":
-                url = service.get("url")
-                method = service.get("method", "GET")
-                expected_status = service.get("expected_status", 200)
-                timeout = service.get("timeout", 10)
-                headers = service.get("headers", {})
-                if not url:
-                    service_checks[service_name] = {
-                        "status": "ERROR",
-                        "type": "http",
-                        "message": "No URL specified",
-                    }
-                    continue
-                status, details = self._check_http_endpoint(
-                    url, method, expected_status, timeout, headers
-                )
-                service_checks[service_name] = {
-                    "status": status,
+            if port_results is not None and (host, port) in port_results:
+                status, details = port_results[(host, port)]
+            else:
+                status, details = self._check_port(host, port)
+            return {
+                "status": status,
+                "type": "port",
+                "host": host,
+                "port": port,
+                **details,
+            }
+        elif service_type == "http":
+            url = service.get("url")
+            method = service.get("method", "GET")
+            expected_status = service.get("expected_status", 200)
+            timeout = service.get("timeout", 10)
+            headers = service.get("headers", {})
+            if not url:
+                return {
+                    "status": "ERROR",
                     "type": "http",
-                    "url": url,
-                    **details,
-                }
-            elif service_type == "command":
-                command = service.get("command")
-                expected_exit_code = service.get("expected_exit_code", 0)
-                timeout = service.get("timeout", 30)
-                if not command:
-                    service_checks[service_name] = {
-                        "status": "ERROR",
-                        "type": "command",
-                        "message": "No command specified",
-                    }
-                    continue
-                status, details = self._run_command(
-                    command, expected_exit_code, timeout
-                )
-                service_checks[service_name] = {
-                    "status": status,
-                    "type": "command",
-                    "command": command,
-                    **details,
+                    "message": "No URL specified",
                 }
-            else:
-                service_checks[service_name] = {
+            status, details = self._check_http_endpoint(
+                url, method, expected_status, timeout, headers
+            )
+            return {
+                "status": status,
+                "type": "http",
+                "url": url,
+                **details,
+            }
+        elif service_type == "command":
+            command = service.get("command")
+            expected_exit_code = service.get("expected_exit_code", 0)
+            timeout = service.get("timeout", 30)
+            if not command:
+                return {
                     "status": "ERROR",
-                    "type": service_type,
-                    "message": f"Unsupported service type: {service_type}",
+                    "type": "command",
+                    "message": "No command specified",
                 }
-        self.results["checks"]["services"] = service_checks
+            status, details = self._run_command(
+                command, expected_exit_code, timeout, service.get("raw_shell", False)
+            )
+            return {
+                "status": status,
+                "type": "command",
+                "command": (
+                    command if isinstance(command, str) else shlex.join(command)
+                ),
+                **details,
+            }
+        else:
+            return {
+                "status": "ERROR",
+                "type": service_type,
+                "message": f"Unsupported service type: {service_type}",
+            }
 
     def check_databases(self) -> None:
         """Check database connections"""
         logger.info("Checking databases")
         databases_config = self.config["environments"][self.env].get("databases", [])
+        budget = self._check_budget()
         database_checks = {}
-        for db in databases_config:
-            db_name = db.get("name", "unknown")
-            db_type = db.get("type", "unknown")
-            logger.debug(f"Checking database: {db_name} (type: {db_type})")
-            if db_type == "postgresql":
-                if not POSTGRES_AVAILABLE:
-                    database_checks[db_name] = {
-                        "status": "ERROR",
-                        "type": db_type,
-                        "message": "psycopg2 not available for PostgreSQL check",
-                    }
-                    continue
-                host = db.get("host", "localhost")
-                port = db.get("port", 5432)
-                database = db.get("database", "postgres")
-                user = db.get("user", "postgres")
-                password = db.get("password", "")
-                ssl_mode = db.get("ssl_mode", "prefer")
-                timeout = db.get("timeout", 5)
-                status, details = self._check_postgresql(
-                    host, port, database, user, password, ssl_mode, timeout
-                )
-                database_checks[db_name] = {
-                    "status": status,
-                    "type": db_type,
-                    "host": host,
-                    "port": port,
-                    "database": database,
-                    **details,
-                }
-            elif db_type == "mongodb":
-                if not MONGODB_AVAILABLE:
-                    database_checks[db_name] = {
-                        "status": "ERROR",
-                        "type": db_type,
-                        "message": "pymongo not available for MongoDB check",
-                    }
-                    continue
-                uri = db.get("uri")
-                host = db.get("host", "localhost")
-                port = db.get("port", 27017)
-                database = db.get("database", "admin")
-                user = db.get("user")
-                password = db.get("password")
-                timeout = db.get("timeout", 5)
-                if uri:
-                    status, details = self._check_mongodb_uri(uri, timeout)
-                else:
-                    status, details = self._check_mongodb(
-                        host, port, database, user, password, timeout
-                    )
-                database_checks[db_name] = {
-                    "status": status,
+        for db, db_check in zip(
+            databases_config,
+            self._map_concurrently(
+                self._check_database,
+                databases_config,
+                budget,
+                lambda db: {
+                    "status": "FAIL",
+                    "type": db.get("type", "unknown"),
+                    "message": f"Database check did not complete within the {budget}s budget",
+                },
+            ),
+        ):
+            database_checks[db.get("name", "unknown")] = db_check
+        self._record_checks("databases", database_checks)
+
+    def _check_database(self, db: Dict) -> Dict:
+        """Check a single configured database, reusing a recent success if allowed"""
+        ttl = self.config["environments"][self.env].get("success_ttl_sec", 0)
+        if not ttl:
+            return self._probe_database(db)
+        key = (
+            db.get("type", "unknown"),
+            db.get("uri"),
+            db.get("host"),
+            db.get("port"),
+            db.get("database"),
+            db.get("db"),
+        )
+        with _LAST_SUCCESS_LOCK:
+            last_success = _LAST_SUCCESS.get(key)
+        if last_success is not None and time.monotonic() - last_success[0] < ttl:
+            return {**last_success[1], "cached": True}
+        checked_at = time.monotonic()
+        database_check = self._probe_database(db)
+        with _LAST_SUCCESS_LOCK:
+            if database_check["status"] == "PASS":
+                _LAST_SUCCESS[key] = (checked_at, database_check)
+            else:
+                _LAST_SUCCESS.pop(key, None)
+        return database_check
+
+    def _probe_database(self, db: Dict) -> Dict:
+        """Connect to a single configured database and report its status"""
+        db_name = db.get("name", "unknown")
+        db_type = db.get("type", "unknown")
+        logger.debug(f"Checking database: {db_name} (type: {db_type})")
+        if db_type == "postgresql":
+            if not POSTGRES_AVAILABLE:
+                return {
+                    "status": "ERROR",
                     "type": db_type,
-                    **(
-                        {"uri": uri}
-                        if uri
-                        else {"host": host, "port": port, "database": database}
-                    ),
-                    **details,
+                    "message": "psycopg2 not available for PostgreSQL check",
                 }
-            elif db_type == "redis":
-                if not REDIS_AVAILABLE:
-                    database_checks[db_name] = {
-                        "status": "ERROR",
-                        "type": db_type,
-                        "message": "redis-py not available for Redis check",
-                    }
-                    continue
-                host = db.get("host", "localhost")
-                port = db.get("port", 6379)
-                db_index = db.get("db", 0)
-                password = db.get("password")
-                timeout = db.get("timeout", 5)
-                status, details = self._check_redis(
-                    host, port, db_index, password, timeout
-                )
-                database_checks[db_name] = {
-                    "status": status,
+            host = db.get("host", "localhost")
+            port = db.get("port", 5432)
+            database = db.get("database", "postgres")
+            user = db.get("user", "postgres")
+            password = db.get("password", "")
+            ssl_mode = db.get("ssl_mode", "prefer")
+            timeout = db.get("timeout", 5)
+            status, details = self._check_postgresql(
+                host, port, database, user, password, ssl_mode, timeout
+            )
+            return {
+                "status": status,
+                "type": db_type,
+                "host": host,
+                "port": port,
+                "database": database,
+                **details,
+            }
+        elif db_type == "mongodb":
+            if not MONGODB_AVAILABLE:
+                return {
+                    "status": "ERROR",
                     "type": db_type,
-                    "host": host,
-                    "port": port,
-                    "db": db_index,
-                    **details,
+                    "message": "pymongo not available for MongoDB check",
                 }
+            uri = db.get("uri")
+            host = db.get("host", "localhost")
+            port = db.get("port", 27017)
+            database = db.get("database", "admin")
+            user = db.get("user")
+            password = db.get("password")
+            timeout = db.get("timeout", 5)
+            if uri:
+                status, details = self._check_mongodb_uri(uri, timeout)
             else:
-                database_checks[db_name] = {
+                status, details = self._check_mongodb(
+                    host, port, database, user, password, timeout
+                )
+            return {
+                "status": status,
+                "type": db_type,
+                **(
+                    {"uri": uri}
+                    if uri
+                    else {"host": host, "port": port, "database": database}
+                ),
+                **details,
+            }
+        elif db_type == "redis":
+            if not REDIS_AVAILABLE:
+                return {
                     "status": "ERROR",
                     "type": db_type,
-                    "message": f"Unsupported database type: {db_type}",
+                    "message": "redis-py not available for Redis check",
                 }
-        self.results["checks"]["databases"] = database_checks
+            host = db.get("host", "localhost")
+            port = db.get("port", 6379)
+            db_index = db.get("db", 0)
+            password = db.get("password")
+            timeout = db.get("timeout", 5)
+            socket_path = db.get("unix_socket_path")
+            status, details = self._check_redis(
+                host, port, db_index, password, timeout, socket_path
+            )
+            return {
+                "status": status,
+                "type": db_type,
+                **(
+                    {"unix_socket_path": socket_path}
+                    if socket_path
+                    else {"host": host, "port": port}
+                ),
+                "db": db_index,
+                **details,
+            }
+        else:
+            return {
+                "status": "ERROR",
+                "type": db_type,
+                "message": f"Unsupported database type: {db_type}",
+            }
 
     def check_api_endpoints(self) -> None:
         """Check API endpoints"""
         logger.info("Checking API endpoints")
         if not REQUESTS_AVAILABLE:
-            self.results["checks"]["api_endpoints"] = {
-                "status": "ERROR",
-                "message": "requests library not available for API endpoint checks",
-            }
+            self._record_checks(
+                "api_endpoints",
+                {
+                    "error": CheckResult(
+                        "ERROR",
+                        "requests library not available for API endpoint checks",
+                    )
+                },
+            )
             return
         endpoints_config = self.config["environments"][self.env].get(
             "api_endpoints", []
         )
+        budget = self._check_budget()
         endpoint_checks = {}
-        for endpoint in endpoints_config:
-            endpoint_name = endpoint.get("name", "unknown")
-            url = endpoint.get("url")
-            method = endpoint.get("method", "GET")
-            headers = endpoint.get("headers", {})
-            data = endpoint.get("data")
-            expected_status = endpoint.get("expected_status", 200)
-            timeout = endpoint.get("timeout", 10)
-            content_check = endpoint.get("content_check")
-            logger.debug(f"Checking API endpoint: {endpoint_name} ({url})")
-            if not url:
-                endpoint_checks[endpoint_name] = {
-                    "status": "ERROR",
-                    "message": "No URL specified",
-                }
-                continue
-            status, details = self._check_api_endpoint(
-                url, method, headers, data, expected_status, timeout, content_check
-            )
-            endpoint_checks[endpoint_name] = {
-                "status": status,
-                "url": url,
-                "method": method,
-                **details,
+        for endpoint, endpoint_check in zip(
+            endpoints_config,
+            self._map_concurrently(
+                self._check_endpoint,
+                endpoints_config,
+                budget,
+                lambda endpoint: {
+                    "status": "FAIL",
+                    "url": endpoint.get("url"),
+                    "method": endpoint.get("method", "GET"),
+                    "message": f"API endpoint check did not complete within the {budget}s budget",
+                },
+            ),
+        ):
+            endpoint_checks[endpoint.get("name", "unknown")] = endpoint_check
+        self._record_checks("api_endpoints", endpoint_checks)
+
+    def _check_endpoint(self, endpoint: Dict) -> Dict:
+        """Check a single configured API endpoint"""
+        endpoint_name = endpoint.get("name", "unknown")
+        url = endpoint.get("url")
+        method = endpoint.get("method", "GET")
+        headers = endpoint.get("headers", {})
+        data = endpoint.get("data")
+        expected_status = endpoint.get("expected_status", 200)
+        timeout = endpoint.get("timeout", 10)
+        content_check = endpoint.get("content_check")
+        logger.debug(f"Checking API endpoint: {endpoint_name} ({url})")
+        if not url:
+            return {
+                "status": "ERROR",
+                "message": "No URL specified",
             }
-        self.results["checks"]["api_endpoints"] = endpoint_checks
+        status, details = self._check_api_endpoint(
+            url, method, headers, data, expected_status, timeout, content_check
+        )
+        return {
+            "status": status,
+            "url": url,
+            "method": method,
+            **details,
+        }
 
     def check_kubernetes(self) -> None:
         """Check Kubernetes resources if configured"""
@@ -497,85 +981,160 @@ class HealthCheck:
             logger.debug("Kubernetes checks not enabled")
             return
         if not K8S_AVAILABLE:
-            self.results["checks"]["kubernetes"] = {
-                "status": "ERROR",
-                "message": "kubernetes library not available for Kubernetes checks",
-            }
+            self._record_checks(
+                "kubernetes",
+                {
+                    "error": CheckResult(
+                        "ERROR",
+                        "kubernetes library not available for Kubernetes checks",
+                    )
+                },
+            )
             return
         try:
+            import kubernetes
+
             if k8s_config.get("in_cluster", False):
                 kubernetes.config.load_incluster_config()
             else:
                 kubernetes.config.load_kube_config(
                     config_file=k8s_config.get("config_file")
                 )
-            core_v1 = kubernetes.client.CoreV1Api()
-            apps_v1 = kubernetes.client.AppsV1Api()
+            configuration = kubernetes.client.Configuration.get_default_copy()
+            configuration.connection_pool_maxsize = K8S_POOL_MAXSIZE
+            # Both API objects share one client so the checks reuse a single
+            # keep-alive pool to the apiserver
+            api_client = kubernetes.client.ApiClient(configuration=configuration)
+            core_v1 = kubernetes.client.CoreV1Api(api_client=api_client)
+            apps_v1 = kubernetes.client.AppsV1Api(api_client=api_client)
             namespace = k8s_config.get("namespace", "default")
-            k8s_checks = {}
+            # (result key, namespace reported with it, check) in report order
+            k8s_tasks: List[Tuple[str, Optional[str], Callable[[], Tuple]]] = []
             if k8s_config.get("check_nodes", True):
-                nodes_status, nodes_details = self._check_k8s_nodes(core_v1)
-                k8s_checks["nodes"] = {"status": nodes_status, **nodes_details}
+                k8s_tasks.append(
+                    ("nodes", None, lambda: self._check_k8s_nodes(core_v1))
+                )
             if k8s_config.get("check_pods", True):
-                pods_status, pods_details = self._check_k8s_pods(core_v1, namespace)
-                k8s_checks["pods"] = {
-                    "status": pods_status,
-                    "namespace": namespace,
-                    **pods_details,
-                }
+                k8s_tasks.append(
+                    (
+                        "pods",
+                        namespace,
+                        lambda: self._check_k8s_pods(core_v1, namespace),
+                    )
+                )
             if k8s_config.get("check_deployments", True):
-                deployments_status, deployments_details = self._check_k8s_deployments(
-                    apps_v1, namespace
+                k8s_tasks.append(
+                    (
+                        "deployments",
+                        namespace,
+                        lambda: self._check_k8s_deployments(apps_v1, namespace),
+                    )
                 )
-                k8s_checks["deployments"] = {
-                    "status": deployments_status,
-                    "namespace": namespace,
-                    **deployments_details,
-                }
             if k8s_config.get("check_services", True):
-                services_status, services_details = self._check_k8s_services(
-                    core_v1, namespace
+                k8s_tasks.append(
+                    (
+                        "services",
+                        namespace,
+                        lambda: self._check_k8s_services(core_v1, namespace),
+                    )
+                )
+            budget = self._check_budget()
+            try:
+                k8s_results = self._map_concurrently(
+                    lambda task: task[2](),
+                    k8s_tasks,
+                    budget,
+                    lambda task: (
+                        "FAIL",
+                        {
+                            "message": f"Kubernetes {task[0]} check did not complete within the {budget}s budget"
+                        },
+                    ),
                 )
-                k8s_checks["services"] = {
-                    "status": services_status,
-                    "namespace": namespace,
-                    **services_details,
+            finally:
+                api_client.close()
+            k8s_checks = {}
+            for (key, task_namespace, _), (status, details) in zip(
+                k8s_tasks, k8s_results
+            ):
+                k8s_checks[key] = {
+                    "status": status,
+                    **({"namespace": task_namespace} if task_namespace else {}),
+                    **details,
                 }
-            self.results["checks"]["kubernetes"] = k8s_checks
+            self._record_checks("kubernetes", k8s_checks)
         except Exception as e:
-            self.results["checks"]["kubernetes"] = {
-                "status": "ERROR",
-                "message": f"Error checking Kubernetes resources: {str(e)}",
-            }
-
-    def _check_process_by_name(self, process_name: str) -> Tuple[str, Dict]:
-        """Check if a process is running by name"""
-        if not PSUTIL_AVAILABLE:
-            return ("ERROR", {"message": "psutil not available for process check"})
-        try:
-            processes = []
-            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
-                proc_name = proc.info["name"] or ""
-                if process_name.lower() in proc_name.lower() or (
-                    proc.info["cmdline"]
-                    and any(
-                        (
-                            process_name.lower() in cmd.lower()
-                            for cmd in proc.info["cmdline"]
-                        )
+            self._record_checks(
+                "kubernetes",
+                {
+                    "error": CheckResult(
+                        "ERROR", f"Error checking Kubernetes resources: {str(e)}"
                     )
+                },
+            )
+
+    def _scan_processes(self, process_names: List[str]) -> Dict[str, List[Dict]]:
+        """Find the running processes whose name or command line matches each name"""
+        needles = [(name, name.lower()) for name in dict.fromkeys(process_names)]
+        matches: Dict[str, List[Dict]] = {name: [] for name, _ in needles}
+        for pid, proc_name, cmdline in self._iter_processes():
+            lowered_name = (proc_name or "").lower()
+            lowered_cmdline = [cmd.lower() for cmd in cmdline]
+            for name, needle in needles:
+                if needle in lowered_name or any(
+                    needle in cmd for cmd in lowered_cmdline
                 ):
-                    processes.append(
+                    matches[name].append(
                         {
-                            "pid": proc.info["pid"],
-                            "name": proc.info["name"],
-                            "cmdline": (
-                                " ".join(proc.info["cmdline"])
-                                if proc.info["cmdline"]
-                                else ""
-                            ),
+                            "pid": pid,
+                            "name": proc_name,
+                            "cmdline": " ".join(cmdline) if cmdline else "",
                         }
                     )
+        return matches
+
+    def _iter_processes(self) -> Iterator[Tuple[int, Optional[str], List[str]]]:
+        """Yield (pid, name, cmdline) for every running process"""
+        if not _HAS_PROCFS:
+            for proc in psutil.process_iter(["pid", "name", "cmdline"]):
+                yield proc.info["pid"], proc.info["name"], proc.info["cmdline"] or []
+            return
+        with os.scandir("/proc") as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(f"/proc/{entry.name}/comm", "rb") as f:
+                        comm = f.read()
+                    with open(f"/proc/{entry.name}/cmdline", "rb") as f:
+                        raw_cmdline = f.read()
+                except OSError:
+                    # The process exited or belongs to another user
+                    continue
+                cmdline = (
+                    raw_cmdline.rstrip(b"\0").decode("utf-8", "replace").split("\0")
+                    if raw_cmdline
+                    else []
+                )
+                yield (
+                    int(entry.name),
+                    comm.rstrip(b"\n").decode("utf-8", "replace"),
+                    cmdline,
+                )
+
+    def _check_process_by_name(
+        self,
+        process_name: str,
+        process_table: Optional[Dict[str, List[Dict]]] = None,
+    ) -> Tuple[str, Dict]:
+        """Check if a process is running by name"""
+        if not (PSUTIL_AVAILABLE or _HAS_PROCFS):
+            return ("ERROR", {"message": "psutil not available for process check"})
+        try:
+            if process_table is not None and process_name in process_table:
+                processes = process_table[process_name]
+            else:
+                processes = self._scan_processes([process_name])[process_name]
             if processes:
                 return (
                     "PASS",
@@ -616,24 +1175,82 @@ class HealthCheck:
 
     def _check_port(self, host: str, port: int) -> Tuple[str, Dict]:
         """Check if a port is open"""
+        return self._check_ports([(host, port)])[(host, port)]
+
+    def _check_ports(
+        self, targets: List[Tuple[str, int]]
+    ) -> Dict[Tuple[str, int], Tuple[str, Dict]]:
+        """Probe all (host, port) targets at once with non-blocking connects"""
+        results: Dict[Tuple[str, int], Tuple[str, Dict]] = {}
+        # connect_ex() would resolve a hostname synchronously, one target at a
+        # time, so every host is looked up up front and concurrently instead
+        addresses = self._resolve_hosts([host for host, _ in targets])
+        selector = selectors.DefaultSelector()
         try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(2)
-            result = sock.connect_ex((host, port))
-            sock.close()
-            if result == 0:
-                return ("PASS", {"message": f"Port {port} on {host} is open"})
-            else:
-                return (
-                    "FAIL",
-                    {
-                        "message": f"Port {port} on {host} is closed (error code: {result})"
-                    },
-                )
-        except Exception as e:
+            for host, port in dict.fromkeys(targets):
+                sock = None
+                try:
+                    address = addresses[host]
+                    if isinstance(address, OSError):
+                        raise address
+                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                    sock.setblocking(False)
+                    result = sock.connect_ex((address, port))
+                    if result in (errno.EINPROGRESS, errno.EWOULDBLOCK):
+                        selector.register(sock, selectors.EVENT_WRITE, (host, port))
+                        continue
+                    sock.close()
+                    results[(host, port)] = self._port_result(host, port, result)
+                except Exception as e:
+                    if sock is not None:
+                        sock.close()
+                    results[(host, port)] = (
+                        "ERROR",
+                        {"message": f"Error checking port {port} on {host}: {str(e)}"},
+                    )
+            deadline = time.monotonic() + PORT_CHECK_TIMEOUT
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(timeout=remaining):
+                    sock = key.fileobj
+                    selector.unregister(sock)
+                    result = sock.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR)
+                    sock.close()
+                    results[key.data] = self._port_result(*key.data, result)
+            for key in list(selector.get_map().values()):
+                selector.unregister(key.fileobj)
+                key.fileobj.close()
+                results[key.data] = self._port_result(*key.data, errno.ETIMEDOUT)
+        finally:
+            selector.close()
+        return results
+
+    def _resolve_hosts(self, hosts: List[str]) -> Dict[str, Union[str, OSError]]:
+        """Resolve each host to an IPv4 address once per health check run"""
+        pending = [host for host in dict.fromkeys(hosts) if host not in self._addresses]
+        for host, address in zip(
+            pending, self._map_concurrently(self._resolve_host, pending)
+        ):
+            self._addresses[host] = address
+        return self._addresses
+
+    def _resolve_host(self, host: str) -> Union[str, OSError]:
+        """Look up a host, returning the lookup error instead of raising it"""
+        try:
+            return socket.gethostbyname(host)
+        except OSError as e:
+            return e
+
+    def _port_result(self, host: str, port: int, result: int) -> Tuple[str, Dict]:
+        """Turn a connect error code into a port check result"""
+        if result == 0:
+            return ("PASS", {"message": f"Port {port} on {host} is open"})
+        else:
             return (
-                "ERROR",
-                {"message": f"Error checking port {port} on {host}: {str(e)}"},
+                "FAIL",
+                {"message": f"Port {port} on {host} is closed (error code: {result})"},
             )
 
     def _check_http_endpoint(
@@ -647,9 +1264,11 @@ class HealthCheck:
             )
         try:
             start_time = time.time()
-            response = requests.request(
-                method=method, url=url, headers=headers, timeout=timeout
-            )
+            # Only the status line matters; stream so large bodies are never read
+            with self._http_session.request(
+                method=method, url=url, headers=headers, timeout=timeout, stream=True
+            ) as response:
+                self._release_to_pool(response)
             response_time = time.time() - start_time
             if response.status_code == expected_status:
                 return (
@@ -683,13 +1302,49 @@ class HealthCheck:
             )
 
     def _run_command(
-        self, command: str, expected_exit_code: int, timeout: int
+        self,
+        command: Union[str, List[str]],
+        expected_exit_code: int,
+        timeout: int,
+        raw_shell: bool = False,
     ) -> Tuple[str, Dict]:
-        """Run command and check exit code"""
+        """
+        Run command and check exit code
+
+        An argv list, or a plain command string naming a program on PATH, is
+        executed directly. Other strings (shell syntax, builtins) and services
+        marked raw_shell go through /bin/sh.
+        """
         try:
+            if isinstance(command, str):
+                shell = raw_shell or not SHELL_METACHARACTERS.isdisjoint(command)
+                args = command if shell else shlex.split(command)
+                if not shell and args and "=" in args[0]:
+                    # Leading VAR=value assignments are a shell feature too
+                    shell, args = True, command
+            else:
+                shell = False
+                args = list(command)
+            # Resolving the executable up front and keeping fds open lets
+            # subprocess start the child with posix_spawn instead of fork+exec
+            executable = None
+            if not shell:
+                executable = shutil.which(args[0])
+                if executable is None:
+                    if not isinstance(command, str):
+                        return ("FAIL", {"message": f"Command not found: {args[0]}"})
+                    # Builtins such as command, type, cd and exit have no
+                    # executable on PATH; leave those strings to the shell
+                    shell, args = True, command
             start_time = time.time()
             process = subprocess.run(
-                command, shell=True, capture_output=True, text=True, timeout=timeout
+                args,
+                shell=shell,
+                executable=executable,
+                close_fds=False,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
             )
             execution_time = time.time() - start_time
             if process.returncode == expected_exit_code:
@@ -716,6 +1371,8 @@ class HealthCheck:
                 )
         except subprocess.TimeoutExpired:
             return ("FAIL", {"message": f"Command timed out after {timeout}s"})
+        except FileNotFoundError as e:
+            return ("FAIL", {"message": f"Command not found: {e.filename}"})
         except Exception as e:
             return ("ERROR", {"message": f"Error running command: {str(e)}"})
 
@@ -730,24 +1387,38 @@ class HealthCheck:
         timeout: int,
     ) -> Tuple[str, Dict]:
         """Check PostgreSQL connection"""
+        import psycopg2.pool
+
         try:
             start_time = time.time()
-            conn = psycopg2.connect(
-                host=host,
-                port=port,
-                dbname=database,
-                user=user,
-                password=password,
-                sslmode=ssl_mode,
-                connect_timeout=timeout,
+            pool = self._get_db_pool(
+                ("postgresql", host, port, database, user, password, ssl_mode),
+                lambda: psycopg2.pool.ThreadedConnectionPool(
+                    POSTGRES_POOL_MIN_CONNECTIONS,
+                    POSTGRES_POOL_MAX_CONNECTIONS,
+                    host=host,
+                    port=port,
+                    dbname=database,
+                    user=user,
+                    password=password,
+                    sslmode=ssl_mode,
+                    connect_timeout=timeout,
+                ),
             )
-            cursor = conn.cursor()
-            cursor.execute("SELECT version();")
-            version = cursor.fetchone()[0]
-            cursor.execute("SELECT current_timestamp;")
-            db_time = cursor.fetchone()[0]
-            cursor.close()
-            conn.close()
+            conn = pool.getconn()
+            try:
+                # Without autocommit the probe opens a transaction that stays
+                # idle until putconn() spends another round trip rolling it back
+                conn.autocommit = True
+                cursor = conn.cursor()
+                cursor.execute("SELECT version(), current_timestamp;")
+                version, db_time = cursor.fetchone()
+                cursor.close()
+            except Exception:
+                # A pooled connection may have been dropped by the server
+                pool.putconn(conn, close=True)
+                raise
+            pool.putconn(conn)
             connection_time = time.time() - start_time
             return (
                 "PASS",
@@ -771,17 +1442,23 @@ class HealthCheck:
 
     def _check_mongodb_uri(self, uri: str, timeout: int) -> Tuple[str, Dict]:
         """Check MongoDB connection using URI"""
+        import pymongo
+
         try:
             start_time = time.time()
-            client = pymongo.MongoClient(uri, serverSelectionTimeoutMS=timeout * 1000)
-            server_info = client.server_info()
+            version = self._probe_mongodb(
+                ("mongodb", uri, timeout),
+                lambda: pymongo.MongoClient(
+                    uri, serverSelectionTimeoutMS=timeout * 1000
+                ),
+            )
             connection_time = time.time() - start_time
             return (
                 "PASS",
                 {
                     "message": "Successfully connected to MongoDB database",
                     "connection_time": f"{connection_time:.3f}s",
-                    "version": server_info.get("version", "unknown"),
+                    "version": version,
                 },
             )
         except pymongo.errors.ServerSelectionTimeoutError as e:
@@ -802,29 +1479,36 @@ class HealthCheck:
         timeout: int,
     ) -> Tuple[str, Dict]:
         """Check MongoDB connection"""
+        import pymongo
+
         try:
             start_time = time.time()
             if user and password:
-                client = pymongo.MongoClient(
-                    host=host,
-                    port=port,
-                    username=user,
-                    password=password,
-                    authSource=database,
-                    serverSelectionTimeoutMS=timeout * 1000,
+                version = self._probe_mongodb(
+                    ("mongodb", host, port, database, user, password, timeout),
+                    lambda: pymongo.MongoClient(
+                        host=host,
+                        port=port,
+                        username=user,
+                        password=password,
+                        authSource=database,
+                        serverSelectionTimeoutMS=timeout * 1000,
+                    ),
                 )
             else:
-                client = pymongo.MongoClient(
-                    host=host, port=port, serverSelectionTimeoutMS=timeout * 1000
+                version = self._probe_mongodb(
+                    ("mongodb", host, port, timeout),
+                    lambda: pymongo.MongoClient(
+                        host=host, port=port, serverSelectionTimeoutMS=timeout * 1000
+                    ),
                 )
-            server_info = client.server_info()
             connection_time = time.time() - start_time
             return (
                 "PASS",
                 {
                     "message": "Successfully connected to MongoDB database",
                     "connection_time": f"{connection_time:.3f}s",
-                    "version": server_info.get("version", "unknown"),
+                    "version": version,
                 },
             )
         except pymongo.errors.ServerSelectionTimeoutError as e:
@@ -835,25 +1519,75 @@ class HealthCheck:
         except Exception as e:
             return ("ERROR", {"message": f"Error checking MongoDB database: {str(e)}"})
 
+    def _probe_mongodb(self, key: Tuple, factory: Callable[[], Any]) -> str:
+        """Ping a pooled MongoDB client with hello and return the server version"""
+        import pymongo
+
+        client = self._get_db_pool(key, factory)
+        try:
+            client.admin.command("hello")
+        except pymongo.errors.OperationFailure:
+            # Servers older than 4.4.2 only know the legacy name
+            client.admin.command("isMaster")
+        version = self._mongodb_versions.get(key)
+        if version is None:
+            # hello carries no version string, so buildInfo is read only once
+            version = client.admin.command("buildInfo").get("version", "unknown")
+            self._mongodb_versions[key] = version
+        return version
+
     def _check_redis(
-        self, host: str, port: int, db: int, password: str, timeout: int
+        self,
+        host: str,
+        port: int,
+        db: int,
+        password: str,
+        timeout: int,
+        socket_path: Optional[str] = None,
     ) -> Tuple[str, Dict]:
-        """Check Redis connection"""
+        """Check Redis connection, over a Unix socket when one is configured"""
+        import redis
+
         try:
             start_time = time.time()
-            r = redis.Redis(
-                host=host, port=port, db=db, password=password, socket_timeout=timeout
-            )
-            info = r.info()
+            if socket_path:
+                pool = self._get_db_pool(
+                    ("redis", socket_path, db, password, timeout),
+                    lambda: redis.ConnectionPool(
+                        connection_class=redis.UnixDomainSocketConnection,
+                        path=socket_path,
+                        db=db,
+                        password=password,
+                        socket_timeout=timeout,
+                    ),
+                )
+            else:
+                pool = self._get_db_pool(
+                    ("redis", host, port, db, password, timeout),
+                    lambda: redis.ConnectionPool(
+                        host=host,
+                        port=port,
+                        db=db,
+                        password=password,
+                        socket_timeout=timeout,
+                    ),
+                )
+            # Only the two INFO sections we report on, in one round trip
+            pipe = redis.Redis(connection_pool=pool).pipeline(transaction=False)
+            pipe.info("server")
+            pipe.info("cluster")
+            server_info, cluster_info = pipe.execute()
             connection_time = time.time() - start_time
             return (
                 "PASS",
                 {
                     "message": "Successfully connected to Redis database",
                     "connection_time": f"{connection_time:.3f}s",
-                    "version": info.get("redis_version", "unknown"),
+                    "version": server_info.get("redis_version", "unknown"),
                     "mode": (
-                        "cluster" if info.get("cluster_enabled", 0) else "standalone"
+                        "cluster"
+                        if cluster_info.get("cluster_enabled", 0)
+                        else "standalone"
                     ),
                 },
             )
@@ -877,27 +1611,42 @@ class HealthCheck:
     ) -> Tuple[str, Dict]:
         """Check API endpoint"""
         try:
+            # A plain liveness GET only needs the status line
+            request_method = method
+            if method.upper() == "GET" and not data and not content_check:
+                request_method = "HEAD"
+            request_kwargs = {
+                "url": url,
+                "headers": headers,
+                "json": data if data else None,
+                "timeout": timeout,
+                "stream": True,
+            }
             start_time = time.time()
-            response = requests.request(
-                method=method,
-                url=url,
-                headers=headers,
-                json=data if data else None,
-                timeout=timeout,
+            response = self._http_session.request(
+                method=request_method, **request_kwargs
             )
-            response_time = time.time() - start_time
-            status_check = response.status_code == expected_status
-            content_check_result = True
-            if content_check and status_check:
-                if content_check in response.text:
-                    content_check_message = f"Response contains '{content_check}'"
+            if request_method != method and response.status_code in (405, 501):
+                # GET-only routes (FastAPI's /health among them) reject HEAD
+                response.close()
+                response = self._http_session.request(method=method, **request_kwargs)
+            with response:
+                response_time = time.time() - start_time
+                status_check = response.status_code == expected_status
+                content_check_result = True
+                if content_check and status_check:
+                    if self._response_contains(
+                        response, self._content_needle(content_check)
+                    ):
+                        content_check_message = f"Response contains '{content_check}'"
+                    else:
+                        content_check_result = False
+                        content_check_message = (
+                            f"Response does not contain '{content_check}'"
+                        )
                 else:
-                    content_check_result = False
-                    content_check_message = (
-                        f"Response does not contain '{content_check}'"
-                    )
-            else:
-                content_check_message = "No content check specified"
+                    content_check_message = "No content check specified"
+                self._release_to_pool(response)
             if status_check and content_check_result:
                 return (
                     "PASS",
@@ -932,22 +1681,65 @@ class HealthCheck:
                 {"message": f"Error checking API endpoint {url}: {str(e)}"},
             )
 
+    def _release_to_pool(self, response: Any) -> None:
+        """Drain a short streamed body so its connection stays keep-alive"""
+        # Closing a response with unread body drops the socket, so small
+        # bodies are read out to let the session reuse the connection
+        content_length = response.headers.get("Content-Length", "")
+        if content_length.isdigit() and int(content_length) <= HTTP_DRAIN_LIMIT:
+            response.raw.read()
+
+    @staticmethod
+    @functools.lru_cache(maxsize=64)
+    def _content_needle(content_check: str) -> bytes:
+        """Encode a content_check once so repeated probes match raw bytes"""
+        return content_check.encode("utf-8")
+
+    def _response_contains(self, response: Any, needle: bytes) -> bool:
+        """Read a streamed response only until needle is found"""
+        overlap = len(needle) - 1
+        tail = b""
+        for chunk in response.iter_content(HTTP_CONTENT_CHUNK_SIZE):
+            window = tail + chunk
+            if needle in window:
+                return True
+            tail = window[-overlap:] if overlap else b""
+        return False
+
+    def _list_k8s(
+        self, list_func: Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> List:
+        """Collect every item of a Kubernetes list call, a page at a time"""
+        items: List = []
+        continue_token = None
+        while True:
+            response = list_func(
+                *args, limit=K8S_LIST_PAGE_SIZE, _continue=continue_token, **kwargs
+            )
+            items.extend(response.items)
+            continue_token = response.metadata._continue
+            if not continue_token:
+                return items
+
     def _check_k8s_nodes(self, core_v1: Any) -> Tuple[str, Dict]:
         """Check Kubernetes nodes"""
         try:
-            nodes = core_v1.list_node().items
+            nodes = self._list_k8s(core_v1.list_node)
             node_statuses = []
             not_ready_nodes = []
             for node in nodes:
                 node_name = node.metadata.name
-                node_status = "Unknown"
-                for condition in node.status.conditions:
-                    if condition.type == "Ready":
-                        if condition.status == "True":
-                            node_status = "Ready"
-                        else:
-                            node_status = "NotReady"
-                            not_ready_nodes.append(node_name)
+                ready_condition = next(
+                    (c for c in node.status.conditions or [] if c.type == "Ready"),
+                    None,
+                )
+                if ready_condition is None:
+                    node_status = "Unknown"
+                elif ready_condition.status == "True":
+                    node_status = "Ready"
+                else:
+                    node_status = "NotReady"
+                    not_ready_nodes.append(node_name)
                 node_statuses.append(
                     {
                         "name": node_name,
@@ -982,22 +1774,30 @@ class HealthCheck:
     def _check_k8s_pods(self, core_v1: Any, namespace: str) -> Tuple[str, Dict]:
         """Check Kubernetes pods in namespace"""
         try:
-            pods = core_v1.list_namespaced_pod(namespace).items
+            # Completed job pods are expected to have stopped running
+            pods = self._list_k8s(
+                core_v1.list_namespaced_pod,
+                namespace,
+                field_selector="status.phase!=Succeeded",
+            )
             pod_statuses = []
             not_running_pods = []
+            now = datetime.datetime.now(datetime.timezone.utc)
             for pod in pods:
                 pod_name = pod.metadata.name
                 pod_status = pod.status.phase
+                ready, restarts = self._get_pod_container_state(pod)
                 pod_statuses.append(
                     {
                         "name": pod_name,
                         "status": pod_status,
-                        "ready": self._is_pod_ready(pod),
-                        "restarts": self._get_pod_restarts(pod),
-                        "age": self._get_pod_age(pod),
+                        "ready": ready,
+                        "restarts": restarts,
+                        "age": self._get_pod_age(pod, now),
                     }
                 )
-                if pod_status != "Running" or not self._is_pod_ready(pod):
+                # Only a Running pod can be ready
+                if not ready:
                     not_running_pods.append(f"{pod_name} ({pod_status})")
             if not_running_pods:
                 return (
@@ -1022,48 +1822,38 @@ class HealthCheck:
         except Exception as e:
             return ("ERROR", {"message": f"Error checking Kubernetes pods: {str(e)}"})
 
-    def _is_pod_ready(self, pod: Any) -> bool:
-        """Check if a pod is ready"""
-        if pod.status.phase != "Running":
-            return False
+    def _get_pod_container_state(self, pod: Any) -> Tuple[bool, int]:
+        """Get whether a pod is ready and its total restarts in one pass"""
         # `container_statuses` is None while containers haven't been
         # created yet (e.g. image still pulling), not just an empty list.
         container_statuses = pod.status.container_statuses or []
-        if not container_statuses:
-            return False
+        ready = pod.status.phase == "Running" and bool(container_statuses)
+        restarts = 0
         for container_status in container_statuses:
             if not container_status.ready:
-                return False
-        return True
-
-    def _get_pod_restarts(self, pod: Any) -> int:
-        """Get total restarts for a pod"""
-        restarts = 0
-        for container_status in pod.status.container_statuses or []:
+                ready = False
             restarts += container_status.restart_count
-        return restarts
+        return ready, restarts
 
-    def _get_pod_age(self, pod: Any) -> str:
-        """Get age of a pod"""
-        if pod.metadata.creation_timestamp:
-            age_seconds = (
-                datetime.datetime.now(datetime.timezone.utc)
+    def _get_pod_age(self, pod: Any, now: datetime.datetime) -> str:
+        """Get age of a pod relative to now (an aware UTC datetime)"""
+        if not pod.metadata.creation_timestamp:
+            return "Unknown"
+        age_seconds = int(
+            (
+                now
                 - pod.metadata.creation_timestamp.replace(tzinfo=datetime.timezone.utc)
             ).total_seconds()
-            if age_seconds < 60:
-                return f"{int(age_seconds)}s"
-            elif age_seconds < 3600:
-                return f"{int(age_seconds / 60)}m"
-            elif age_seconds < 86400:
-                return f"{int(age_seconds / 3600)}h"
-            else:
-                return f"{int(age_seconds / 86400)}d"
-        return "Unknown"
+        )
+        for unit_seconds, suffix in POD_AGE_UNITS:
+            if age_seconds >= unit_seconds:
+                return f"{age_seconds // unit_seconds}{suffix}"
+        return f"{age_seconds}s"
 
     def _check_k8s_deployments(self, apps_v1: Any, namespace: str) -> Tuple[str, Dict]:
         """Check Kubernetes deployments in namespace"""
         try:
-            deployments = apps_v1.list_namespaced_deployment(namespace).items
+            deployments = self._list_k8s(apps_v1.list_namespaced_deployment, namespace)
             deployment_statuses = []
             not_ready_deployments = []
             for deployment in deployments:
@@ -1112,7 +1902,7 @@ class HealthCheck:
     def _check_k8s_services(self, core_v1: Any, namespace: str) -> Tuple[str, Dict]:
         """Check Kubernetes services in namespace"""
         try:
-            services = core_v1.list_namespaced_service(namespace).items
+            services = self._list_k8s(core_v1.list_namespaced_service, namespace)
             service_statuses = []
             for service in services:
                 service_name = service.metadata.name
@@ -1153,12 +1943,9 @@ class HealthCheck:
     def _calculate_overall_status(self) -> None:
         """Calculate overall status based on check results"""
         status_counts = {"PASS": 0, "FAIL": 0, "ERROR": 0, "UNKNOWN": 0}
-        for category, checks in self.results["checks"].items():
-            if isinstance(checks, dict):
-                for check_name, check_data in checks.items():
-                    if isinstance(check_data, dict) and "status" in check_data:
-                        status = check_data["status"]
-                        status_counts[status] = status_counts.get(status, 0) + 1
+        for category in list(self.results["checks"]):
+            for status, count in self._status_counts.get(category, {}).items():
+                status_counts[status] = status_counts.get(status, 0) + count
         if status_counts["ERROR"] > 0:
             self.results["status"] = "ERROR"
         elif status_counts["FAIL"] > 0:
@@ -1174,181 +1961,109 @@ class HealthCheck:
 
     def generate_report(
         self, format: str = "text", output_path: Optional[str] = None
-    ) -> str:
-        """Generate a report of the health check results"""
-        if format == "json":
-            report = json.dumps(self.results, indent=2)
-        elif format == "html":
-            report = self._generate_html_report()
-        else:
-            report = self._generate_text_report()
+    ) -> Optional[str]:
+        """
+        Generate a report of the health check results
+
+        With output_path the report is streamed straight into that file and
+        None is returned; otherwise the report is returned as a string.
+        """
         if output_path:
             with open(output_path, "w") as f:
-                f.write(report)
+                self.write_report(f, format)
             logger.info(f"Report saved to {output_path}")
-        return report
+            return None
+        buf = io.StringIO()
+        self.write_report(buf, format)
+        return buf.getvalue()
 
-    def _generate_text_report(self) -> str:
+    def write_report(self, out: TextIO, format: str = "text") -> None:
+        """Write a report of the health check results to a text stream"""
+        if format == "json":
+            out.write(json_dumps(self.results, indent=True))
+        elif format == "html":
+            self._generate_html_report(out)
+        else:
+            self._generate_text_report(out)
+
+    def _generate_text_report(self, out: TextIO) -> None:
         """Generate a text report"""
-        lines = []
-        lines.append("=" * 80)
-        lines.append(f"NEXORA ENVIRONMENT HEALTH CHECK REPORT - {self.env.upper()}")
-        lines.append(f"Date: {self.results['timestamp']}")
-        lines.append(f"Status: {self.results['status']}")
-        lines.append("=" * 80)
+        write = out.write
+        write("=" * 80)
+        write(f"\nNEXORA ENVIRONMENT HEALTH CHECK REPORT - {self.env.upper()}")
+        write(f"\nDate: {self.results['timestamp']}")
+        write(f"\nStatus: {self.results['status']}")
+        write("\n" + "=" * 80)
         summary = self.results["summary"]
-        lines.append("\nSUMMARY:")
-        lines.append(f"Total checks: {summary['total_checks']}")
+        write("\n\nSUMMARY:")
+        write(f"\nTotal checks: {summary['total_checks']}")
         for status, count in summary["status_counts"].items():
-            lines.append(f"  {status}: {count}")
+            write(f"\n  {status}: {count}")
         for category, checks in self.results["checks"].items():
             if not checks:
                 continue
-            lines.append("\n" + "=" * 80)
-            lines.append(f"{category.upper()} CHECKS:")
-            lines.append("-" * 80)
-            if isinstance(checks, dict):
-                for check_name, check_data in checks.items():
-                    if isinstance(check_data, dict) and "status" in check_data:
-                        status = check_data["status"]
-                        message = check_data.get("message", "No message")
-                        lines.append(f"{check_name}: {status}")
-                        lines.append(f"  {message}")
-                        for key, value in check_data.items():
-                            if key not in ["status", "message"] and (
-                                not isinstance(value, (dict, list))
-                            ):
-                                lines.append(f"  {key}: {value}")
-                        lines.append("")
-            else:
-                lines.append(f"{checks}")
-                lines.append("")
-        return "\n".join(lines)
+            write("\n\n" + "=" * 80)
+            write(f"\n{category.upper()} CHECKS:")
+            write("\n" + "-" * 80)
+            for check_name, check_data in checks.items():
+                status = check_data["status"]
+                message = check_data.get("message", "No message")
+                write(f"\n{check_name}: {status}")
+                write(f"\n  {message}")
+                for key, value in check_data.items():
+                    if key not in ["status", "message"] and (
+                        not isinstance(value, (dict, list))
+                    ):
+                        write(f"\n  {key}: {value}")
+                write("\n")
 
-    def _generate_html_report(self) -> str:
+    def _generate_html_report(self, out: TextIO) -> None:
         """Generate an HTML report"""
-        html = []
-        html.append("<!DOCTYPE html>")
-        html.append("<html lang='en'>")
-        html.append("<head>")
-        html.append("  <meta charset='UTF-8'>")
-        html.append(
-            "  <meta name='viewport' content='width=device-width, initial-scale=1.0'>"
-        )
-        html.append("  <title>Nexora Environment Health Check Report</title>")
-        html.append("  <style>")
-        html.append("    body { font-family: Arial, sans-serif; margin: 20px; }")
-        html.append("    h1, h2, h3 { color: #333; }")
-        html.append("    .report-header { margin-bottom: 20px; }")
-        html.append("    .status { font-weight: bold; }")
-        html.append("    .status-PASS { color: green; }")
-        html.append("    .status-FAIL { color: red; }")
-        html.append("    .status-ERROR { color: darkred; }")
-        html.append("    .status-WARN, .status-UNKNOWN { color: orange; }")
-        html.append("    .status-INFO { color: blue; }")
-        html.append(
-            "    .check { margin-bottom: 10px; border: 1px solid #ddd; padding: 10px; border-radius: 5px; }"
-        )
-        html.append(
-            "    .check-header { display: flex; justify-content: space-between; }"
-        )
-        html.append("    .check-details { margin-top: 10px; }")
-        html.append("    .check-message { margin: 5px 0; }")
-        html.append("    .summary { margin: 20px 0; }")
-        html.append("    table { border-collapse: collapse; width: 100%; }")
-        html.append(
-            "    th, td { border: 1px solid #ddd; padding: 8px; text-align: left; }"
-        )
-        html.append("    th { background-color: #f2f2f2; }")
-        html.append("    .category { margin-top: 30px; }")
-        html.append(
-            "    .toggle-btn { cursor: pointer; background: none; border: none; font-size: 16px; }"
-        )
-        html.append("  </style>")
-        html.append("  <script>")
-        html.append("    function toggleDetails(id) {")
-        html.append("      const details = document.getElementById(id);")
-        html.append("      const btn = document.getElementById(id + '-btn');")
-        html.append("      if (details.style.display === 'none') {")
-        html.append("        details.style.display = 'block';")
-        html.append("        btn.textContent = '▼';")
-        html.append("      } else {")
-        html.append("        details.style.display = 'none';")
-        html.append("        btn.textContent = '►';")
-        html.append("      }")
-        html.append("    }")
-        html.append("  </script>")
-        html.append("</head>")
-        html.append("<body>")
-        html.append("  <div class='report-header'>")
-        html.append(
-            f"    <h1>Nexora Environment Health Check Report - {self.env.upper()}</h1>"
-        )
-        html.append(f"    <p><strong>Date:</strong> {self.results['timestamp']}</p>")
-        html.append(
-            f"    <p><strong>Status:</strong> <span class='status status-{self.results['status']}'>{self.results['status']}</span></p>"
-        )
-        html.append("  </div>")
-        summary = self.results["summary"]
-        html.append("  <div class='summary'>")
-        html.append("    <h2>Summary</h2>")
-        html.append("    <table>")
-        html.append(
-            "      <tr><th>Total Checks</th><td>"
-            + str(summary["total_checks"])
-            + "</td></tr>"
+        write = out.write
+        esc = html.escape
+        results = self.results
+        write(HTML_REPORT_HEAD)
+        write(
+            HTML_REPORT_HEADER.format(
+                env=esc(self.env.upper()),
+                timestamp=esc(str(results["timestamp"])),
+                status=esc(str(results["status"])),
+            )
         )
+        summary = results["summary"]
+        write(HTML_REPORT_SUMMARY.format(total=summary["total_checks"]))
         for status, count in summary["status_counts"].items():
-            html.append(f"      <tr><th>{status}</th><td>{count}</td></tr>")
-        html.append("    </table>")
-        html.append("  </div>")
+            write(HTML_REPORT_SUMMARY_ROW.format(status=esc(str(status)), count=count))
+        write(HTML_REPORT_SUMMARY_END)
         check_id = 0
-        for category, checks in self.results["checks"].items():
+        for category, checks in results["checks"].items():
             if not checks:
                 continue
-            html.append(f"  <div class='category'>")
-            html.append(f"    <h2>{category.title()} Checks</h2>")
-            if isinstance(checks, dict):
-                for check_name, check_data in checks.items():
-                    if isinstance(check_data, dict) and "status" in check_data:
-                        check_id += 1
-                        status = check_data["status"]
-                        message = check_data.get("message", "No message")
-                        html.append(f"    <div class='check'>")
-                        html.append(f"      <div class='check-header'>")
-                        html.append(f"        <h3>{check_name}</h3>")
-                        html.append(
-                            f"        <span class='status status-{status}'>{status}</span>"
-                        )
-                        html.append(f"      </div>")
-                        html.append(f"      <div class='check-message'>{message}</div>")
-                        html.append(
-                            f"""      <button id='check-{check_id}-btn' class='toggle-btn' onclick="toggleDetails('check-{check_id}-details')">▼</button>"""
-                        )
-                        html.append(
-                            f"      <div id='check-{check_id}-details' class='check-details'>"
+            write(HTML_REPORT_CATEGORY.format(category=esc(category.title())))
+            for check_name, check_data in checks.items():
+                check_id += 1
+                details = []
+                for key, value in check_data.items():
+                    if key not in ["status", "message"]:
+                        if isinstance(value, (dict, list)):
+                            value = json_dumps(value, indent=True)
+                            value = f"<pre>{esc(value)}</pre>"
+                        else:
+                            value = esc(str(value))
+                        details.append(
+                            HTML_REPORT_DETAIL.format(key=esc(str(key)), value=value)
                         )
-                        for key, value in check_data.items():
-                            if key not in ["status", "message"]:
-                                if isinstance(value, (dict, list)):
-                                    html.append(
-                                        f"        <div><strong>{key}:</strong> <pre>{json.dumps(value, indent=2)}</pre></div>"
-                                    )
-                                else:
-                                    html.append(
-                                        f"        <div><strong>{key}:</strong> {value}</div>"
-                                    )
-                        html.append("      </div>")
-                        html.append("    </div>")
-            else:
-                html.append(f"    <div class='check'>{checks}</div>")
-            html.append("  </div>")
-        html.append("  <div class='footer'>")
-        html.append("    <p>Generated by Nexora Environment Health Check Script</p>")
-        html.append("  </div>")
-        html.append("</body>")
-        html.append("</html>")
-        return "\n".join(html)
+                write(
+                    HTML_REPORT_CHECK.format(
+                        id=check_id,
+                        name=esc(str(check_name)),
+                        status=esc(str(check_data["status"])),
+                        message=esc(str(check_data.get("message", "No message"))),
+                        details="".join(details),
+                    )
+                )
+            write("  </div>\n")
+        write(HTML_REPORT_FOOTER)
 
 
 def parse_args() -> Any:
@@ -1386,6 +2101,11 @@ def parse_args() -> Any:
         help="Alert threshold for resource usage (default: 80)",
     )
     parser.add_argument("--verbose", action="store_true", help="Enable verbose output")
+    parser.add_argument(
+        "--fast-fail",
+        action="store_true",
+        help="Stop at the first failing check category",
+    )
     return parser.parse_args()
 
 
@@ -1398,8 +2118,12 @@ def main() -> Any:
             env=args.env,
             threshold=args.threshold,
             verbose=args.verbose,
+            fast_fail=args.fast_fail,
         )
-        results = health_check.run_all_checks()
+        try:
+            results = health_check.run_all_checks()
+        finally:
+            health_check.close()
         report = health_check.generate_report(
             format=args.format, output_path=args.output
         )
@@ -0,0 +1,233 @@
+"""Tests for the deployment validation script."""
+
+import os
+import socket
+import sys
+import threading
+import types
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+import yaml
+
+import deployment_validation as dv
+
+
+@pytest.fixture
+def validator(tmp_path):
+    validator = dv.DeploymentValidator(str(tmp_path / "missing.yaml"), "dev")
+    yield validator
+    validator.close()
+
+
+def _secret(name, data=None):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, resource_version="1"),
+        type="Opaque",
+        data=data,
+    )
+
+
+class _FakeCoreV1:
+    def __init__(self, secrets):
+        self.secrets = secrets
+        self.list_calls = 0
+
+    def list_namespaced_secret(self, namespace, **kwargs):
+        self.list_calls += 1
+        return SimpleNamespace(
+            items=self.secrets, metadata=SimpleNamespace(resource_version="1")
+        )
+
+
+class _BlockingWatch:
+    """Stands in for kubernetes.watch.Watch, streaming nothing until stopped."""
+
+    def __init__(self):
+        self._stopped = threading.Event()
+
+    def stream(self, func, *args, **kwargs):
+        self._stopped.wait()
+        return iter(())
+
+    def stop(self):
+        self._stopped.set()
+
+
+def test_secret_validation_keeps_no_secret_values(validator):
+    core_v1 = _FakeCoreV1([_secret("db-credentials", {"password": "hunter2"})])
+    status, details = validator._validate_k8s_secrets(
+        core_v1, "nexora", ["db-credentials"]
+    )
+    assert status == "PASS"
+    assert details["secrets"][0]["data_keys"] == ["password"]
+    secrets = validator._get_cached_secrets(core_v1, "nexora")
+    assert secrets == [dv.SecretSummary("db-credentials", "Opaque", ("password",))]
+    assert validator._secret_cache == {}
+    assert not any(t.name.startswith("secret-watch-") for t in threading.enumerate())
+
+
+def test_close_stops_secret_watches(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        dv, "watch", types.SimpleNamespace(Watch=_BlockingWatch), raising=False
+    )
+    validator = dv.DeploymentValidator(
+        str(tmp_path / "missing.yaml"), "dev", watch_secrets=True
+    )
+    core_v1 = _FakeCoreV1([_secret("api-key", {"token": "secret"})])
+    validator._get_cached_secrets(core_v1, "nexora")
+    assert validator._get_cached_secrets(core_v1, "nexora") == [
+        dv.SecretSummary("api-key", "Opaque", ("token",))
+    ]
+    assert core_v1.list_calls == 1
+    ((thread, _),) = validator._secret_watches
+    assert thread.is_alive()
+    validator.close()
+    assert not thread.is_alive()
+
+
+def test_run_all_validations_smoke(tmp_path, monkeypatch):
+    with socket.socket() as listener, socket.socket() as closed:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        closed.bind(("127.0.0.1", 0))
+        closed_port = closed.getsockname()[1]
+        closed.close()
+        app_config = tmp_path / "app.yaml"
+        app_config.write_text("app:\n  name: nexora\n  port: 8000\n")
+        monkeypatch.setenv("NEXORA_SMOKE", "1")
+        config_path = tmp_path / "deployment_config.yaml"
+        config_path.write_text(
+            yaml.safe_dump(
+                {
+                    "environments": {
+                        "dev": {
+                            "kubernetes": {"enabled": False},
+                            "services": [
+                                {
+                                    "name": "listener",
+                                    "type": "tcp",
+                                    "host": "127.0.0.1",
+                                    "port": listener.getsockname()[1],
+                                },
+                                {
+                                    "name": "closed",
+                                    "type": "tcp",
+                                    "host": "127.0.0.1",
+                                    "port": closed_port,
+                                },
+                                {"name": "shell", "type": "command", "command": "true"},
+                            ],
+                            "config_validations": [
+                                {
+                                    "name": "app",
+                                    "type": "file",
+                                    "file_path": str(app_config),
+                                    "required_settings": [
+                                        {"path": "app.name", "value": "nexora"},
+                                        {"path": "app.port", "type": "number"},
+                                    ],
+                                },
+                                {
+                                    "name": "absent",
+                                    "type": "file",
+                                    "file_path": str(tmp_path / "absent.yaml"),
+                                },
+                                {
+                                    "name": "env",
+                                    "type": "env",
+                                    "required_vars": [{"name": "NEXORA_SMOKE"}],
+                                },
+                                {
+                                    "name": "exit",
+                                    "type": "command",
+                                    "command": "exit 1",
+                                },
+                            ],
+                        }
+                    }
+                }
+            )
+        )
+        validator = dv.DeploymentValidator(str(config_path), "dev")
+        try:
+            results = validator.run_all_validations()
+        finally:
+            validator.close()
+    statuses = {
+        category: {name: record["status"] for name, record in records.items()}
+        for category, records in results["validations"].items()
+    }
+    assert statuses["services"] == {
+        "listener": "PASS",
+        "closed": "FAIL",
+        "shell": "PASS",
+    }
+    assert statuses["configurations"] == {
+        "app": "PASS",
+        "absent": "FAIL",
+        "env": "PASS",
+        "exit": "FAIL",
+    }
+    assert results["status"] == "FAIL"
+
+
+_SCAN_DOCUMENT = """\
+app:
+  name: nexora
+  debug: null
+  replicas: [1, 2]
+  labels:
+    - {tier: web}
+    - tier: ~
+empty: {}
+"""
+
+
+@pytest.mark.parametrize(
+    "paths",
+    [
+        ["app.name"],
+        ["app.debug", "app.missing"],
+        ["app.replicas[1]", "app.replicas[2]"],
+        ["app.labels[0].tier", "app.labels[1].tier", "empty.key"],
+        ["app", "missing.deeper.still"],
+    ],
+)
+def test_scan_yaml_presence_matches_full_parse(validator, tmp_path, paths):
+    path = tmp_path / "scan.yaml"
+    path.write_text(_SCAN_DOCUMENT)
+    check = validator._get_settings_check([{"path": p} for p in paths])
+    expected_missing, _ = check(yaml.safe_load(_SCAN_DOCUMENT))
+    assert validator._scan_yaml_presence(str(path), paths) == expected_missing
+
+
+def test_scan_yaml_presence_defers_aliases_to_full_parse(validator, tmp_path):
+    path = tmp_path / "alias.yaml"
+    path.write_text("base: &base {name: nexora}\napp: *base\n")
+    assert validator._scan_yaml_presence(str(path), ["app.name"]) is None
+
+
+def test_load_config_file_parses_ini(tmp_path):
+    path = tmp_path / "service.ini"
+    path.write_text(
+        "LogLevel = info  # inline comment\n"
+        "[DEFAULT]\n"
+        "retries = 3\n"
+        "[database]\n"
+        "Host = db.internal ; inline comment\n"
+        "read_only\n"
+        "[database]\n"
+        "port = 5432\n"
+    )
+    st = path.stat()
+    data = dv.DeploymentValidator._load_config_file(
+        str(path), st.st_mtime_ns, st.st_size
+    )
+    assert data == {
+        "LogLevel": "info",
+        "DEFAULT": {"retries": "3"},
+        "database": {"Host": "db.internal", "read_only": None, "port": "5432"},
+    }
@@ -0,0 +1,138 @@
+"""Tests for the environment health check script."""
+
+import os
+import socket
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import pytest
+import yaml
+
+import environment_health_check as ehc
+
+
+@pytest.fixture
+def health_check(tmp_path):
+    check = ehc.HealthCheck(str(tmp_path / "missing.yaml"), "dev")
+    yield check
+    check.close()
+
+
+@pytest.fixture
+def listening_port():
+    with socket.socket() as listener:
+        listener.bind(("127.0.0.1", 0))
+        listener.listen()
+        yield listener.getsockname()[1]
+
+
+@pytest.fixture
+def closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def test_run_all_checks_smoke(tmp_path, listening_port, closed_port):
+    config_path = tmp_path / "env_config.yaml"
+    config_path.write_text(
+        yaml.safe_dump(
+            {
+                "environments": {
+                    "dev": {
+                        "system": {"min_memory_mb": 0, "min_disk_gb": 0},
+                        "services": [
+                            {
+                                "name": "interpreter",
+                                "type": "process",
+                                "process_name": os.path.basename(sys.executable),
+                            },
+                            {
+                                "name": "listener",
+                                "type": "port",
+                                "host": "127.0.0.1",
+                                "port": listening_port,
+                            },
+                            {
+                                "name": "closed",
+                                "type": "port",
+                                "host": "127.0.0.1",
+                                "port": closed_port,
+                            },
+                            {"name": "shell", "type": "command", "command": "true"},
+                        ],
+                        "databases": [],
+                        "api_endpoints": [],
+                        "kubernetes": {"enabled": False},
+                    }
+                }
+            }
+        )
+    )
+    check = ehc.HealthCheck(str(config_path), "dev")
+    try:
+        results = check.run_all_checks()
+    finally:
+        check.close()
+    services = results["checks"]["services"]
+    if ehc.PSUTIL_AVAILABLE or ehc._HAS_PROCFS:
+        assert services["interpreter"]["status"] == "PASS"
+    assert services["listener"]["status"] == "PASS"
+    assert services["closed"]["status"] == "FAIL"
+    assert services["shell"]["status"] == "PASS"
+    assert results["status"] == "FAIL"
+    assert list(results["checks"]) == [
+        "system",
+        "services",
+        "databases",
+        "api_endpoints",
+    ]
+
+
+@pytest.mark.parametrize(
+    "command, expected_exit_code",
+    [("command -v ls", 0), ("type ls", 0), ("exit 3", 3), ("cd /", 0)],
+)
+def test_run_command_leaves_builtins_to_the_shell(
+    health_check, command, expected_exit_code
+):
+    status, details = health_check._run_command(command, expected_exit_code, 10)
+    assert status == "PASS", details
+
+
+def test_run_command_reports_missing_argv_program(health_check):
+    status, details = health_check._run_command(["no-such-program-xyz"], 0, 10)
+    assert status == "FAIL"
+    assert details["message"] == "Command not found: no-such-program-xyz"
+
+
+def test_budget_reports_unfinished_checks(health_check):
+    results = health_check._map_concurrently(
+        lambda delay: time.sleep(delay) or "done",
+        [0, 3],
+        budget=0.5,
+        on_timeout=lambda delay: "timed out",
+    )
+    assert results == ["done", "timed out"]
+
+
+def test_budget_caps_process_lifetime():
+    script = (
+        "import time\n"
+        "import environment_health_check as ehc\n"
+        "check = ehc.HealthCheck('missing.yaml', 'dev')\n"
+        "print(check._map_concurrently(time.sleep, [3], 0.5, lambda s: 'timed out'))\n"
+    )
+    start = time.monotonic()
+    process = subprocess.run(
+        [sys.executable, "-c", script],
+        cwd=os.path.dirname(ehc.__file__),
+        capture_output=True,
+        text=True,
+        timeout=30,
+    )
+    assert process.stdout.strip() == "['timed out']"
+    assert time.monotonic() - start < 2.5